@@ -0,0 +1,294 @@
+import logging
+import pickle
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any, NamedTuple
+
+from app.core.config import settings
+from app.core.metrics import cache_hits, cache_misses
+
+try:
+    from redis import asyncio as redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    tags: tuple[str, ...]
+    versions: tuple[int, ...]
+    value: Any
+
+
+class TaggedCache:
+    """
+    Cache with TTL expiry, LRU eviction and tag-based invalidation.
+
+    Entries are stored under (namespace, key) together with the versions their tags had
+    when they were cached; the namespace is always one of the tags. Invalidating a tag
+    bumps its version, so entries cached under an older version are treated as missing
+    without scanning and are evicted later by TTL or by the size limit.
+
+    With a shared Redis tier, entries are also stored in Redis and tag versions live
+    there, so an invalidation in one process is seen by all of them. The in-process tier
+    then only saves fetching and unpickling entries. Redis errors are logged and treated
+    as misses. An invalidation that fails to reach Redis is retried before every read,
+    and until it succeeds nothing is served, so other processes' stale entries are not
+    trusted either.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, redis_url: str | None = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        # Tags whose shared version could not be bumped yet
+        self._pending_invalidations: set[str] = set()
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+
+        self._redis = None
+        if redis_url:
+            if redis is None:
+                logger.warning("redis is not installed, caching in-process only")
+            else:
+                self._redis = redis.from_url(redis_url)
+
+    @staticmethod
+    def _redis_key(namespace: str, key: Hashable) -> str:
+        return f"cache:{namespace}:{key!r}"
+
+    async def _tag_versions(self, tags: Iterable[str]) -> dict[str, int] | None:
+        """
+        Get the current versions of tags, or None if the shared tier is unreachable or
+        an earlier invalidation still cannot be applied to it.
+        """
+        tags = list(tags)
+        if self._redis is None:
+            return {tag: self._versions.get(tag, 0) for tag in tags}
+        if self._pending_invalidations and not await self._bump_shared(self._pending_invalidations):
+            return None
+        try:
+            versions = await self._redis.mget([f"cache-tag:{tag}" for tag in tags])
+        except redis.RedisError:
+            logger.warning("Reading cache tag versions failed", exc_info=True)
+            return None
+        return {tag: int(version or 0) for tag, version in zip(tags, versions, strict=True)}
+
+    async def _get_shared(self, namespace: str, keys: list[Hashable]) -> dict[Hashable, _Entry]:
+        """Get entries from the shared tier, with their expiry in local monotonic time."""
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    redis_key = self._redis_key(namespace, key)
+                    pipe.get(redis_key).pttl(redis_key)
+                results = await pipe.execute()
+        except redis.RedisError:
+            logger.warning("Reading the shared cache failed", exc_info=True)
+            return {}
+
+        now = time.monotonic()
+        entries = {}
+        for key, data, ttl_ms in zip(keys, results[::2], results[1::2], strict=True):
+            if data is not None and ttl_ms > 0:
+                entries[key] = _Entry(now + ttl_ms / 1000, *pickle.loads(data))
+        return entries
+
+    async def get_many(self, namespace: str, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        """Get the cached values of keys that are present, unexpired and not invalidated."""
+        keys = list(keys)
+        now = time.monotonic()
+        entries = {}
+        for key in keys:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry.expires_at >= now:
+                entries[key] = entry
+        missing = [key for key in keys if key not in entries]
+        if missing and self._redis is not None:
+            entries.update(await self._get_shared(namespace, missing))
+
+        values = {}
+        if entries:
+            tags = {tag for entry in entries.values() for tag in entry.tags}
+            versions = await self._tag_versions(tags)
+            for key, entry in entries.items():
+                current = versions is not None and all(
+                    versions[tag] == version
+                    for tag, version in zip(entry.tags, entry.versions, strict=True)
+                )
+                if current:
+                    self._entries[(namespace, key)] = entry
+                    self._entries.move_to_end((namespace, key))
+                    values[key] = entry.value
+                else:
+                    self._entries.pop((namespace, key), None)
+            self._evict()
+
+        self._hits[namespace] += len(values)
+        self._misses[namespace] += len(keys) - len(values)
+        cache_hits(namespace).inc(len(values))
+        cache_misses(namespace).inc(len(keys) - len(values))
+        return values
+
+    async def get(self, namespace: str, key: Hashable) -> Any | None:
+        """Get a cached value, or None if it is missing, expired or invalidated."""
+        return (await self.get_many(namespace, [key])).get(key)
+
+    async def tag_versions(self, namespace: str, tags: Iterable[str] = ()) -> dict[str, int] | None:
+        """
+        Get the current versions of a namespace and tags, to cache a value under later.
+
+        Read them before querying the value, so an invalidation that commits while the
+        query runs leaves the value under the old versions, where it is never served.
+        Returns None if the shared tier is unreachable.
+        """
+        return await self._tag_versions({namespace, *tags})
+
+    async def set_many(
+        self,
+        namespace: str,
+        entries: Iterable[tuple[Hashable, Any, Iterable[str]]],
+        versions: dict[str, int] | None,
+    ) -> None:
+        """
+        Cache (key, value, tags) entries under the versions of their tags read by
+        tag_versions before the values were queried. Nothing is cached if versions is
+        None, as returned when they could not be read.
+        """
+        entries = [(key, value, (namespace, *tags)) for key, value, tags in entries]
+        if not entries or versions is None:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+        for key, value, tags in entries:
+            entry_versions = tuple(versions[tag] for tag in tags)
+            self._entries[(namespace, key)] = _Entry(expires_at, tags, entry_versions, value)
+            self._entries.move_to_end((namespace, key))
+        self._evict()
+
+        if self._redis is not None:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key, value, tags in entries:
+                        entry_versions = tuple(versions[tag] for tag in tags)
+                        pipe.set(
+                            self._redis_key(namespace, key),
+                            pickle.dumps((tags, entry_versions, value)),
+                            px=int(self.ttl_seconds * 1000),
+                        )
+                    await pipe.execute()
+            except redis.RedisError:
+                logger.warning("Writing the shared cache failed", exc_info=True)
+
+    async def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[str],
+        versions: dict[str, int] | None,
+    ) -> None:
+        """Cache a value under the versions of its tags read before it was queried."""
+        await self.set_many(namespace, [(key, value, tags)], versions)
+
+    def _evict(self) -> None:
+        # Evict least recently used entries over the size limit
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Invalidate every entry cached under any of the given namespaces or tags.
+
+        If the shared tier cannot be reached, local entries under the tags are dropped
+        and the invalidation is kept to be retried before the next read.
+        """
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+        if self._redis is not None and not await self._bump_shared(tags):
+            invalidated = set(tags)
+            for cache_key in [
+                cache_key
+                for cache_key, entry in self._entries.items()
+                if invalidated.intersection(entry.tags)
+            ]:
+                del self._entries[cache_key]
+
+    async def _bump_shared(self, tags: Iterable[str]) -> bool:
+        """
+        Bump the shared versions of tags, together with any still pending.
+
+        Returns False and keeps them all pending if the shared tier cannot be reached.
+        """
+        tags = {*tags, *self._pending_invalidations}
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.incr(f"cache-tag:{tag}")
+                await pipe.execute()
+        except redis.RedisError:
+            logger.warning("Invalidating shared cache tags failed", exc_info=True)
+            self._pending_invalidations |= tags
+            return False
+        self._pending_invalidations -= tags
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit and miss counts with hit ratios, in total and per namespace."""
+
+        def hit_ratio(hits: int, misses: int) -> float | None:
+            return hits / (hits + misses) if hits + misses else None
+
+        hits, misses = self._hits.total(), self._misses.total()
+        return {
+            "entries": len(self._entries),
+            "shared": self._redis is not None,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hit_ratio(hits, misses),
+            "namespaces": [
+                {
+                    "namespace": namespace,
+                    "hits": self._hits[namespace],
+                    "misses": self._misses[namespace],
+                    "hit_ratio": hit_ratio(self._hits[namespace], self._misses[namespace]),
+                }
+                for namespace in sorted(self._hits.keys() | self._misses.keys())
+            ],
+        }
+
+    async def close(self) -> None:
+        """Close the connection to the shared tier."""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+def inventory_read_tags(
+    warehouse_ids: Iterable[int] | None = None, item_ids: Iterable[int] | None = None
+) -> list[str]:
+    """
+    Get the tags of a cached inventory read covering some warehouses or items.
+
+    Reads are tagged with the warehouses they cover, else with the items, else with
+    inventory:all. Writes to single records invalidate inventory_write_tags, and writes
+    touching many records invalidate the whole inventory namespace or tag.
+    """
+    if warehouse_ids:
+        return [f"inventory:w{warehouse_id}" for warehouse_id in warehouse_ids]
+    if item_ids:
+        return [f"inventory:i{item_id}" for item_id in item_ids]
+    return ["inventory:all"]
+
+
+def inventory_write_tags(warehouse_id: int, item_id: int) -> list[str]:
+    """Get the tags to invalidate after writing the inventory of an item in a warehouse."""
+    return [f"inventory:w{warehouse_id}", f"inventory:i{item_id}", "inventory:all"]
+
+
+cache = TaggedCache(
+    settings.CACHE_TTL_SECONDS, settings.CACHE_MAX_ENTRIES, settings.CACHE_REDIS_URL
+)
@@ -0,0 +1,194 @@
+import zlib
+from collections.abc import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def negotiate_encoding(accept_encoding: str, encodings: list[str]) -> str | None:
+    """
+    Pick the encoding to use from an Accept-Encoding header.
+
+    The client's highest quality wins, with ties going to the earliest of encodings.
+    Wildcards are ignored, so an encoding is only used when a client names it.
+    """
+    qualities = {}
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    best_encoding, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, 0.0)
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with zstd, brotli or gzip, whichever the client prefers.
+
+    Brotli and zstd are used when their packages are installed. Responses smaller than
+    minimum_size are sent as they are. Streamed responses are compressed chunk by chunk
+    as they are sent, except server-sent events, which must reach clients immediately.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level: int = settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level: int = settings.COMPRESSION_ZSTD_LEVEL,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        # In order of preference when the client accepts several equally
+        self.encoders: dict[str, Callable[[], _GzipEncoder | _BrotliEncoder | _ZstdEncoder]] = {}
+        if zstandard is not None:
+            self.encoders["zstd"] = lambda: _ZstdEncoder(zstd_level)
+        if brotli is not None:
+            self.encoders["br"] = lambda: _BrotliEncoder(brotli_quality)
+        self.encoders["gzip"] = lambda: _GzipEncoder(gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, list(self.encoders))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressedResponder(send, encoding, self.encoders[encoding], self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressedResponder:
+    """Wraps send, compressing the response body once it is known to be worth it."""
+
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        encoder_factory: Callable[[], _GzipEncoder | _BrotliEncoder | _ZstdEncoder],
+        minimum_size: int,
+    ) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._encoder_factory = encoder_factory
+        self._minimum_size = minimum_size
+        self._start_message: Message | None = None
+        self._buffer = b""
+        self._encoder: _GzipEncoder | _BrotliEncoder | _ZstdEncoder | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until enough of the body is seen to decide whether to compress
+            self._start_message = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._encoder is None:
+            headers = MutableHeaders(raw=self._start_message["headers"])
+            if "content-encoding" in headers or headers.get("content-type", "").startswith(
+                "text/event-stream"
+            ):
+                self._passthrough = True
+                await self._send(self._start_message)
+                await self._send(message)
+                return
+
+            # Middleware such as the auth middleware sends even small bodies in chunks
+            self._buffer += body
+            if more_body and len(self._buffer) < self._minimum_size:
+                return
+            body, self._buffer = self._buffer, b""
+            if not more_body and len(body) < self._minimum_size:
+                self._passthrough = True
+                await self._send(self._start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            self._encoder = self._encoder_factory()
+            headers["Content-Encoding"] = self._encoding
+            if headers.get("ETag", "").startswith('"'):
+                # The compressed body differs byte for byte, so its tag can only be weak
+                headers["ETag"] = "W/" + headers["ETag"]
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                # The compressed length isn't known until the stream ends
+                del headers["Content-Length"]
+            else:
+                body = self._encoder.compress(body) + self._encoder.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(self._start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            await self._send(self._start_message)
+
+        compressed = self._encoder.compress(body)
+        if not more_body:
+            compressed += self._encoder.finish()
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
@@ -3,9 +3,41 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_PREFILL: int = 5
     JWT_SECRET_KEY: str = "your-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PASSWORD_HASH_WORKERS: int = 2
+    CACHE_TTL_SECONDS: int = 30
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_REDIS_URL: str | None = None
+    CACHE_WARMUP: bool = True
+    CACHE_WARMUP_ITEMS: int = 500
+    EVENTS_QUEUE_SIZE: int = 256
+    EVENTS_KEEPALIVE_SECONDS: int = 15
+    EVENTS_RECONNECT_MIN_SECONDS: float = 0.5
+    EVENTS_RECONNECT_MAX_SECONDS: float = 30.0
+    INVENTORY_SNAPSHOT_INTERVAL: int = 10000
+    GEO_INDEX_TTL_SECONDS: int = 300
+    GEO_INDEX_MAX_PENDING: int = 32
+    PURGE_CHUNK_SIZE: int = 5000
+    PURGE_LEASE_SECONDS: int = 60
+    RESERVATION_TTL_SECONDS: int = 900
+    RESERVATION_SWEEP_INTERVAL_SECONDS: int = 30
+    RESERVATION_SWEEP_BATCH_SIZE: int = 1000
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    EXPORT_BATCH_SIZE: int = 10000
+    HEALTH_DB_TIMEOUT_SECONDS: float = 1.0
+    HEALTH_MAX_POOL_USAGE: float = 0.9
+    HEALTH_MAX_LOOP_LAG_SECONDS: float = 0.5
+    HEALTH_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    HEALTH_LOOP_LAG_WINDOW: int = 10
+    METRICS_TOKEN: str | None = None
 
     model_config = SettingsConfigDict(
         env_file=".env.local", env_file_encoding="utf-8", extra="allow"
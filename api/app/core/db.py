@@ -4,12 +4,17 @@ from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.core.metrics import TimedQueuePool, instrument_engine
 
 # Create the engine for Postgres
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    poolclass=TimedQueuePool,
 )
+instrument_engine(engine)
 
 # Create a session factory
 AsyncSessionLocal = async_sessionmaker(
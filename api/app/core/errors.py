@@ -0,0 +1,40 @@
+from fastapi import Request, status
+from sqlalchemy.exc import IntegrityError
+
+from app.core.responses import ORJSONResponse
+
+# Database constraints that guard business rules, with the conflict each reports
+CONFLICT_CONSTRAINTS = {
+    "ck_inventory_quantity_covers_reserved": "Stock cannot drop below the quantity reserved",
+    "ck_inventory_reserved_quantity": "Reserved quantity cannot drop below zero",
+    "locations_warehouse_id_code_key": "Location code already exists in this warehouse",
+}
+
+# Foreign keys that reference a row named in the request, with the row each reports missing
+NOT_FOUND_CONSTRAINTS = {
+    "locations_warehouse_id_fkey": "Warehouse not found",
+    "location_stock_item_id_fkey": "Item not found",
+}
+
+
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> ORJSONResponse:
+    """
+    Report writes rejected by a business-rule constraint as 409 Conflict, and writes
+    referencing a missing row as 404 Not Found.
+
+    The constraints catch writes that checks in the repositories cannot see coming, such
+    as concurrent changes. Violations of any other constraint are re-raised.
+    """
+    # asyncpg's error, with the constraint name, is the cause of the DBAPI error
+    constraint_name = getattr(exc.orig.__cause__, "constraint_name", None)
+    if constraint_name in CONFLICT_CONSTRAINTS:
+        return ORJSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": CONFLICT_CONSTRAINTS[constraint_name]},
+        )
+    if constraint_name in NOT_FOUND_CONSTRAINTS:
+        return ORJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": NOT_FOUND_CONSTRAINTS[constraint_name]},
+        )
+    raise exc
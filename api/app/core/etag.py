@@ -0,0 +1,36 @@
+from fastapi import HTTPException, Request, status
+
+
+def make_etag(*parts: object) -> str | None:
+    """
+    Build a strong ETag from the parts identifying a version of a resource.
+
+    Returns None if any part is None, as a version is until it is settled.
+    """
+    if any(part is None for part in parts):
+        return None
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_headers(etag: str | None, vary: str | None = None) -> dict[str, str]:
+    """Get the ETag and Vary headers of a response, leaving out the ETag if it is None."""
+    headers = {} if etag is None else {"ETag": etag}
+    if vary is not None:
+        headers["Vary"] = vary
+    return headers
+
+
+def check_not_modified(request: Request, etag: str | None) -> None:
+    """
+    Raise 304 Not Modified if the request's If-None-Match header contains the ETag.
+
+    Tags are compared weakly, as If-None-Match requires, so tags weakened by the
+    compression middleware still match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None or etag is None:
+        return
+
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "warehouse_events"
+
+
+async def publish_event(db: AsyncSession, entity: str, action: str, **data: Any) -> None:
+    """
+    Publish a change event through Postgres NOTIFY.
+
+    The notification is queued in the current transaction and only delivered to
+    listeners when it commits, so call this before committing the write.
+    """
+    payload = json.dumps({"entity": entity, "action": action, **data})
+    await db.execute(select(func.pg_notify(EVENTS_CHANNEL, payload)))
+
+
+class EventBroker:
+    """
+    Fan out change events to subscribers of this worker.
+
+    All subscribers share a single LISTEN connection, opened with the first
+    subscription and closed when the last one goes away. If the connection drops while
+    there are subscribers, it is reopened with exponential backoff, and subscribers are
+    told to resync both when it drops and once it is back.
+    """
+
+    def __init__(self, database_url: str, channel: str) -> None:
+        self.dsn = make_url(database_url).set(drivername="postgresql")
+        self.channel = channel
+        self._subscribers: set[asyncio.Queue] = set()
+        self._connection: asyncpg.Connection | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        """Open the LISTEN connection. Call with the lock held."""
+        self._connection = await asyncpg.connect(self.dsn.render_as_string(hide_password=False))
+        self._connection.add_termination_listener(self._on_termination)
+        await self._connection.add_listener(self.channel, self._on_notification)
+
+    async def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber and return the queue its events are delivered to."""
+        async with self._lock:
+            # While reconnecting, the new subscriber waits for the connection like the rest
+            if self._connection is None and self._reconnect_task is None:
+                await self._connect()
+
+            queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+            self._subscribers.add(queue)
+            return queue
+
+    async def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber, closing the shared connection after the last one."""
+        async with self._lock:
+            self._subscribers.discard(queue)
+            if self._subscribers:
+                return
+            if self._reconnect_task is not None:
+                self._reconnect_task.cancel()
+                self._reconnect_task = None
+            if self._connection is not None:
+                connection, self._connection = self._connection, None
+                if not connection.is_closed():
+                    await connection.close()
+
+    def _broadcast(self, event: dict[str, Any]) -> None:
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # The subscriber fell behind, so tell it to refetch instead of
+                # silently dropping events
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"entity": "all", "action": "resync"})
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed event payload: %s", payload)
+            return
+        self._broadcast(event)
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        # Connections closed by unsubscribe are no longer the current one
+        if connection is not self._connection:
+            return
+        self._connection = None
+        # Events may have been missed while the connection was down
+        self._broadcast({"entity": "all", "action": "resync"})
+        if self._subscribers and self._reconnect_task is None:
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Reopen the LISTEN connection with exponential backoff until it succeeds."""
+        delay = settings.EVENTS_RECONNECT_MIN_SECONDS
+        while True:
+            await asyncio.sleep(delay)
+            async with self._lock:
+                try:
+                    await self._connect()
+                except Exception:
+                    logger.warning("Reconnecting to the events channel failed", exc_info=True)
+                else:
+                    self._reconnect_task = None
+                    # Anything published while reconnecting was missed
+                    self._broadcast({"entity": "all", "action": "resync"})
+                    return
+            delay = min(delay * 2, settings.EVENTS_RECONNECT_MAX_SECONDS)
+
+
+event_broker = EventBroker(settings.DATABASE_URL, EVENTS_CHANNEL)
@@ -0,0 +1,31 @@
+from collections.abc import Iterable
+
+from fastapi import HTTPException, status
+
+
+def parse_fieldset(
+    value: str | None, allowed: Iterable[str], parameter: str = "fields", allow_empty: bool = False
+) -> list[str] | None:
+    """
+    Parse a comma-separated list of names from a query parameter.
+
+    Returns None if the parameter wasn't given, and the names in order without
+    duplicates otherwise. Raises 422 if any name isn't allowed, or if the list is empty
+    and allow_empty isn't set.
+    """
+    if value is None:
+        return None
+
+    names = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    if not names and not allow_empty:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At least one of {parameter} must be given",
+        )
+    unknown = set(names) - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown {parameter}: {', '.join(sorted(unknown))}",
+        )
+    return names
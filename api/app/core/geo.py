@@ -0,0 +1,170 @@
+import time
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from app.core.config import settings
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(
+    latitude: float | np.ndarray,
+    longitude: float | np.ndarray,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    """
+    Great-circle distances in km between points given in degrees.
+
+    Arguments broadcast like numpy arrays, so one point against many gives a vector and
+    column against row vectors gives a distance matrix.
+    """
+    lat1, lon1 = np.radians(latitude), np.radians(longitude)
+    lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def to_unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Convert coordinates in degrees to points on the unit sphere."""
+    lat, lon = np.radians(latitudes), np.radians(longitudes)
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+class WarehouseIndex:
+    """
+    In-memory nearest-neighbour index over warehouse coordinates.
+
+    Warehouses are stored in a KD-tree over unit-sphere vectors, where straight-line
+    distance orders points the same way as great-circle distance. Changes go to a
+    pending set that is scanned alongside the tree, which is rebuilt once the pending
+    changes outgrow a fraction of it.
+    """
+
+    def __init__(self) -> None:
+        self.loaded_at: float | None = None
+        self._tree: cKDTree | None = None
+        self._ids = np.empty(0, dtype=np.int64)
+        self._coordinates = np.empty((0, 2))
+        self._positions: dict[int, int] = {}
+        self._pending: dict[int, tuple[float, float]] = {}
+        self._stale: set[int] = set()
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the index was loaded recently enough to pick up other workers' writes."""
+        return (
+            self.loaded_at is not None
+            and time.monotonic() - self.loaded_at < settings.GEO_INDEX_TTL_SECONDS
+        )
+
+    def load(self, warehouses: list[tuple[int, float, float]]) -> None:
+        """Replace the index with (warehouse_id, latitude, longitude) tuples."""
+        self._build(warehouses)
+        self.loaded_at = time.monotonic()
+
+    def upsert(self, warehouse_id: int, latitude: float, longitude: float) -> None:
+        """Add a warehouse or move it to new coordinates."""
+        if self.loaded_at is None:
+            return
+        if warehouse_id in self._positions:
+            self._stale.add(warehouse_id)
+        self._pending[warehouse_id] = (float(latitude), float(longitude))
+        self._maybe_rebuild()
+
+    def remove(self, warehouse_id: int) -> None:
+        """Remove a warehouse from the index."""
+        if self.loaded_at is None:
+            return
+        if warehouse_id in self._positions:
+            self._stale.add(warehouse_id)
+        self._pending.pop(warehouse_id, None)
+        self._maybe_rebuild()
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int, allowed_ids: set[int] | None = None
+    ) -> list[tuple[int, float]]:
+        """
+        Get up to k (warehouse_id, distance_km) pairs closest to a point.
+
+        When allowed_ids is given, only those warehouses are considered and their
+        distances are computed directly instead of walking the tree.
+        """
+        if allowed_ids is not None:
+            candidates = [
+                (warehouse_id, *coordinates)
+                for warehouse_id in allowed_ids
+                if (coordinates := self._coordinates_of(warehouse_id)) is not None
+            ]
+        else:
+            candidates = [
+                (warehouse_id, *coordinates) for warehouse_id, coordinates in self._pending.items()
+            ]
+            if self._tree is not None:
+                # Ask for enough extra neighbours to make up for stale entries
+                count = min(k + len(self._stale), len(self._ids))
+                _, positions = self._tree.query(
+                    to_unit_vectors(np.array([latitude]), np.array([longitude]))[0], k=count
+                )
+                for position in np.atleast_1d(positions):
+                    warehouse_id = int(self._ids[position])
+                    if warehouse_id not in self._stale:
+                        candidates.append((warehouse_id, *self._coordinates[position]))
+
+        if not candidates:
+            return []
+
+        ids = np.array([candidate[0] for candidate in candidates])
+        distances = haversine_km(
+            latitude,
+            longitude,
+            np.array([candidate[1] for candidate in candidates]),
+            np.array([candidate[2] for candidate in candidates]),
+        )
+        order = np.argsort(distances, kind="stable")[:k]
+        return [(int(ids[i]), float(distances[i])) for i in order]
+
+    def _coordinates_of(self, warehouse_id: int) -> tuple[float, float] | None:
+        if warehouse_id in self._pending:
+            return self._pending[warehouse_id]
+        if warehouse_id in self._positions and warehouse_id not in self._stale:
+            latitude, longitude = self._coordinates[self._positions[warehouse_id]]
+            return float(latitude), float(longitude)
+        return None
+
+    def _maybe_rebuild(self) -> None:
+        changes = len(self._pending) + len(self._stale)
+        if changes > max(settings.GEO_INDEX_MAX_PENDING, len(self._ids) // 10):
+            warehouses = [
+                (int(warehouse_id), float(latitude), float(longitude))
+                for warehouse_id, (latitude, longitude) in zip(
+                    self._ids, self._coordinates, strict=True
+                )
+                if warehouse_id not in self._stale
+            ]
+            warehouses.extend(
+                (warehouse_id, latitude, longitude)
+                for warehouse_id, (latitude, longitude) in self._pending.items()
+            )
+            self._build(warehouses)
+
+    def _build(self, warehouses: list[tuple[int, float, float]]) -> None:
+        self._ids = np.array([warehouse[0] for warehouse in warehouses], dtype=np.int64)
+        self._coordinates = np.array(
+            [(float(warehouse[1]), float(warehouse[2])) for warehouse in warehouses]
+        ).reshape(-1, 2)
+        self._positions = {int(warehouse_id): i for i, warehouse_id in enumerate(self._ids)}
+        self._tree = (
+            cKDTree(to_unit_vectors(self._coordinates[:, 0], self._coordinates[:, 1]))
+            if warehouses
+            else None
+        )
+        self._pending = {}
+        self._stale = set()
+
+
+warehouse_index = WarehouseIndex()
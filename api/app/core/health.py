@@ -0,0 +1,82 @@
+import asyncio
+import time
+from collections import deque
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models.health import DatabaseHealth, PoolHealth, ReadinessReport
+
+
+class LoopLagMonitor:
+    """
+    Samples how far behind schedule the event loop runs.
+
+    A background task sleeps for a fixed interval and records how much later than
+    that it wakes up. A loop busy with CPU-bound work or blocking calls wakes it late,
+    and so runs every other task late too.
+    """
+
+    def __init__(self, interval_seconds: float, window: int) -> None:
+        self.interval_seconds = interval_seconds
+        self._samples: deque[float] = deque([0.0], maxlen=window)
+
+    @property
+    def lag_seconds(self) -> float:
+        """The highest lag among the recent samples."""
+        return max(self._samples)
+
+    async def run(self) -> None:
+        """Sample the lag until cancelled."""
+        while True:
+            started_at = time.monotonic()
+            await asyncio.sleep(self.interval_seconds)
+            self._samples.append(max(0.0, time.monotonic() - started_at - self.interval_seconds))
+
+
+loop_lag_monitor = LoopLagMonitor(
+    settings.HEALTH_LOOP_LAG_INTERVAL_SECONDS, settings.HEALTH_LOOP_LAG_WINDOW
+)
+
+
+def check_pool() -> PoolHealth:
+    """Get how many of the pool's connections, overflow included, are checked out."""
+    pool = engine.pool
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+    usage = checked_out / capacity if capacity else 0.0
+    return PoolHealth(
+        checked_out=checked_out,
+        capacity=capacity,
+        usage=usage,
+        ok=usage < settings.HEALTH_MAX_POOL_USAGE,
+    )
+
+
+async def check_database() -> DatabaseHealth:
+    """Ping the database, failing if it takes longer than HEALTH_DB_TIMEOUT_SECONDS."""
+    started_at = time.monotonic()
+    try:
+        # Waiting for a pool connection counts towards the timeout too
+        async with asyncio.timeout(settings.HEALTH_DB_TIMEOUT_SECONDS):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+    except Exception as e:
+        return DatabaseHealth(ok=False, error=str(e) or type(e).__name__)
+    return DatabaseHealth(ok=True, latency_ms=(time.monotonic() - started_at) * 1000)
+
+
+async def check_readiness() -> ReadinessReport:
+    """Check whether this worker should be sent traffic."""
+    pool = check_pool()
+    database = await check_database()
+    loop_lag_ms = loop_lag_monitor.lag_seconds * 1000
+    loop_ok = loop_lag_ms < settings.HEALTH_MAX_LOOP_LAG_SECONDS * 1000
+    return ReadinessReport(
+        ready=database.ok and pool.ok and loop_ok,
+        database=database,
+        pool=pool,
+        loop_lag_ms=loop_lag_ms,
+        loop_ok=loop_ok,
+    )
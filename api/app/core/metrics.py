@@ -0,0 +1,160 @@
+import os
+import time
+from functools import cache
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Metrics of every uvicorn worker are aggregated when PROMETHEUS_MULTIPROC_DIR names an
+# empty directory shared by the workers; prometheus_client then keeps values in files there
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route and status", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ["method", "route"]
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests being handled", multiprocess_mode="livesum"
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured size of the connection pool", multiprocess_mode="livesum"
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections", "Open pool connections", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Pool connections in use", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pool connection",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds", "SQL statement latency by operation", ["operation"]
+)
+
+AUTH_LOGINS = Counter("auth_logins_total", "Login attempts by result", ["result"])
+AUTH_REJECTIONS = Counter("auth_rejections_total", "Requests rejected by authentication")
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "bcrypt calls waiting for a password hashing thread",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds", "bcrypt hash and verify latency"
+)
+
+CACHE_HITS = Counter("cache_hits_total", "Repository cache hits by namespace", ["namespace"])
+CACHE_MISSES = Counter("cache_misses_total", "Repository cache misses by namespace", ["namespace"])
+
+# Children bound once per set of label values, so recording skips the label lookup
+http_requests = cache(HTTP_REQUESTS.labels)
+http_request_duration = cache(HTTP_REQUEST_DURATION.labels)
+db_statement_duration = cache(DB_STATEMENT_DURATION.labels)
+auth_logins = cache(AUTH_LOGINS.labels)
+cache_hits = cache(CACHE_HITS.labels)
+cache_misses = cache(CACHE_MISSES.labels)
+
+
+class MetricsMiddleware:
+    """Records the latency and status of every HTTP request, labelled by route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the scope; unmatched paths share one
+            # label so they can't grow the number of series
+            route = scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+            method = scope["method"]
+            http_request_duration(method, route_path).observe(time.perf_counter() - started_at)
+            http_requests(method, route_path, str(status_code)).inc()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started_at)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record the engine's pool usage and the latency of every statement it runs."""
+    pool = engine.pool
+    if hasattr(pool, "size"):
+        DB_POOL_SIZE.set(pool.size())
+
+    def update_pool_gauges(*_) -> None:
+        if hasattr(pool, "checkedout"):
+            DB_POOL_CHECKED_OUT.set(pool.checkedout())
+            DB_POOL_CONNECTIONS.set(pool.checkedin() + pool.checkedout())
+
+    for pool_event in ("checkout", "checkin", "close", "close_detached"):
+        event.listen(pool, pool_event, update_pool_gauges)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info["statement_started_at"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        started_at = conn.info.pop("statement_started_at", None)
+        if started_at is not None:
+            # Labelled by the leading keyword, such as SELECT or WITH, to bound the series
+            operation = statement.split(None, 1)[0].upper()
+            db_statement_duration(operation).observe(time.perf_counter() - started_at)
+
+
+def metrics_response() -> Response:
+    """Render the metrics in the Prometheus text format, summed over workers if shared."""
+    registry = REGISTRY
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared metrics when it exits."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
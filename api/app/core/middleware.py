@@ -1,3 +1,4 @@
+import secrets
 from collections.abc import Callable
 
 from fastapi import FastAPI, Request, Response, status
@@ -5,6 +6,7 @@ from fastapi.responses import JSONResponse
 from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.core.metrics import AUTH_REJECTIONS
 
 
 def setup_auth_middleware(app: FastAPI) -> None:
@@ -26,12 +28,24 @@ def setup_auth_middleware(app: FastAPI) -> None:
             or path.startswith("/docs")
             or path.startswith("/redoc")
             or path.startswith("/openapi.json")
+            or path.startswith("/health/")
         ):
             return await call_next(request)
 
         # ✅ Check Authorization header
         auth_header = request.headers.get("Authorization")
+
+        # ✅ Let scrapers in with the metrics token, which opens nothing else
+        if (
+            path == "/metrics"
+            and settings.METRICS_TOKEN
+            and auth_header is not None
+            and secrets.compare_digest(auth_header, f"Bearer {settings.METRICS_TOKEN}")
+        ):
+            return await call_next(request)
+
         if not auth_header or not auth_header.startswith("Bearer "):
+            AUTH_REJECTIONS.inc()
             return JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"detail": "Not authenticated"},
@@ -53,6 +67,7 @@ def setup_auth_middleware(app: FastAPI) -> None:
             request.state.user_id = user_id
 
         except JWTError as e:
+            AUTH_REJECTIONS.inc()
             return JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={"detail": f"Invalid or expired token: {str(e)}"},
@@ -0,0 +1,27 @@
+import numpy as np
+
+
+def plan_picks(
+    slot_items: np.ndarray, slot_quantities: np.ndarray, demands: np.ndarray
+) -> np.ndarray:
+    """
+    Pick every item from its slots in walking order until its demand is met.
+
+    Slots must be sorted by item and then by pick sequence, and slot_items holds the
+    position in demands of each slot's item. Returns the quantity picked per slot.
+
+    A walk along the pick path costs as much as its furthest stop, and taking each item
+    from its earliest slots minimizes the furthest stop it needs, so all picks are
+    computed at once from cumulative stock along the path.
+    """
+    if not len(slot_items):
+        return np.zeros_like(slot_quantities)
+
+    # Stock of the same item in slots earlier on the path
+    upper = np.cumsum(slot_quantities)
+    group_starts = np.flatnonzero(np.r_[True, slot_items[1:] != slot_items[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(slot_items)])
+    lower = upper - slot_quantities
+    lower -= np.repeat(lower[group_starts], group_sizes)
+
+    return np.clip(demands[slot_items] - lower, 0, slot_quantities)
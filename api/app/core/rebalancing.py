@@ -0,0 +1,71 @@
+import numpy as np
+
+
+def rebalance_targets(stock: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Split each item's total stock across warehouses in proportion to their weights.
+
+    stock has one row per warehouse and one column per item. Targets are whole units
+    that add up to each item's current total, with leftover units going to the
+    warehouses with the largest fractional shares.
+    """
+    shares = weights / weights.sum()
+    exact = shares[:, None] * stock.sum(axis=0)[None, :]
+    targets = np.floor(exact).astype(stock.dtype)
+    leftover = stock.sum(axis=0) - targets.sum(axis=0)
+    ranks = np.argsort(np.argsort(targets - exact, axis=0, kind="stable"), axis=0)
+    return targets + (ranks < leftover[None, :])
+
+
+def plan_rebalance(
+    stock: np.ndarray, targets: np.ndarray, distances_km: np.ndarray, tolerance: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Plan transfers that move every warehouse toward its target stock.
+
+    stock and targets have one row per warehouse and one column per item, distances_km
+    is the warehouse-to-warehouse distance matrix. Warehouses within `tolerance` of an
+    item's target neither send nor receive it. Warehouse pairs are visited from the
+    closest to the farthest and each pair moves as much of every item as the source
+    can spare and the destination needs, which keeps the distance moved low.
+
+    Returns (source, destination, item, quantity) arrays with one entry per transfer,
+    where warehouses and items are row and column positions.
+    """
+    surplus = np.clip(stock - np.floor(targets * (1 + tolerance)), 0, None).astype(stock.dtype)
+    deficit = np.clip(np.ceil(targets * (1 - tolerance)) - stock, 0, None).astype(stock.dtype)
+    surplus_left = surplus.sum(axis=1)
+    deficit_left = deficit.sum(axis=1)
+
+    sources, destinations = np.nonzero(~np.eye(len(stock), dtype=bool))
+    order = np.argsort(distances_km[sources, destinations], kind="stable")
+
+    transfers: list[tuple[int, int, np.ndarray, np.ndarray]] = []
+    for source, destination in zip(sources[order], destinations[order], strict=True):
+        if not surplus_left[source] or not deficit_left[destination]:
+            continue
+
+        moved = np.minimum(surplus[source], deficit[destination])
+        items = np.flatnonzero(moved)
+        if not len(items):
+            continue
+
+        quantities = moved[items]
+        surplus[source, items] -= quantities
+        deficit[destination, items] -= quantities
+        surplus_left[source] -= quantities.sum()
+        deficit_left[destination] -= quantities.sum()
+        transfers.append((source, destination, items, quantities))
+
+    if not transfers:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty, empty
+
+    return (
+        np.concatenate([np.full(len(items), source) for source, _, items, _ in transfers]),
+        np.concatenate(
+            [np.full(len(items), destination) for _, destination, items, _ in transfers]
+        ),
+        np.concatenate([items for _, _, items, _ in transfers]),
+        np.concatenate([quantities for _, _, _, quantities in transfers]),
+    )
@@ -0,0 +1,194 @@
+import io
+from collections.abc import AsyncGenerator
+from decimal import Decimal
+from functools import cache
+from typing import Any
+
+import msgpack
+import orjson
+import pyarrow as pa
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Boolean, DateTime, Float, Integer, Numeric, Select, String, cast
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import TypeEngine
+
+from app.core.config import settings
+from app.core.db import get_db_session_context
+
+# Response formats by name, in the order preferred when a client accepts several
+MEDIA_TYPES = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+# Arrow types of SQL column types, checked in order since Float is a Numeric
+_ARROW_TYPES = [
+    (Boolean, pa.bool_()),
+    (Integer, pa.int64()),
+    (Numeric, pa.float64()),
+    (String, pa.string()),
+    (DateTime, pa.timestamp("us", tz="UTC")),
+]
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode values orjson doesn't support natively."""
+    # Strings keep the precision, and match how pydantic serializes Decimal
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson, used as the app-wide default."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_encode_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        )
+
+
+def negotiate_format(request: Request, formats: list[str]) -> str:
+    """
+    Pick the response format from the request's Accept header.
+
+    formats are names from MEDIA_TYPES, and the first is used when the client accepts
+    anything. Raises 406 if the client accepts none of them.
+    """
+    accept = request.headers.get("accept")
+    if not accept:
+        return formats[0]
+
+    qualities = {}
+    for part in accept.split(","):
+        media_type, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type.strip().lower()] = quality
+
+    best_format, best_quality = None, 0.0
+    for format_name in formats:
+        media_type = MEDIA_TYPES[format_name]
+        quality = qualities.get(
+            media_type,
+            qualities.get(media_type.split("/")[0] + "/*", qualities.get("*/*", 0.0)),
+        )
+        if quality > best_quality:
+            best_format, best_quality = format_name, quality
+    if best_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"Available formats: {', '.join(MEDIA_TYPES[name] for name in formats)}",
+        )
+    return best_format
+
+
+@cache
+def _type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def model_response(
+    response_type: Any,
+    content: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+    exclude_unset: bool = False,
+    format_name: str = "json",
+) -> Response:
+    """
+    Validate content as response_type and serialize it straight to JSON or MessagePack.
+
+    Skips FastAPI's intermediate conversion to Python dicts, which dominates the cost of
+    large responses. Endpoints using it should still declare the type as their
+    response_model, so it is documented. With exclude_unset, fields left unset on the
+    content's models are omitted.
+    """
+    adapter = _type_adapter(response_type)
+    value = adapter.validate_python(content, from_attributes=True)
+    if format_name == "msgpack":
+        # Values are converted as for JSON, so both formats carry the same data
+        body = msgpack.packb(
+            adapter.dump_python(value, mode="json", by_alias=True, exclude_unset=exclude_unset)
+        )
+    else:
+        body = adapter.dump_json(value, by_alias=True, exclude_unset=exclude_unset)
+    return Response(
+        content=body, status_code=status_code, headers=headers, media_type=MEDIA_TYPES[format_name]
+    )
+
+
+def _arrow_type(column_type: TypeEngine) -> pa.DataType:
+    column_type = getattr(column_type, "impl_instance", column_type)
+    return next(
+        arrow_type for sql_type, arrow_type in _ARROW_TYPES if isinstance(column_type, sql_type)
+    )
+
+
+def arrow_response(statement: Select, headers: dict[str, str] | None = None) -> StreamingResponse:
+    """
+    Stream the rows of a query as Arrow IPC record batches, one column per selected column.
+
+    The query runs in its own session while the response is sent, so only one batch of
+    rows is held in memory. Columns are copied straight from the result tuples. Numeric
+    columns are sent as doubles.
+    """
+    columns = []
+    for column in statement.selected_columns:
+        # Type decorators such as SQLModel's AutoString wrap a plain SQL type
+        column_type = getattr(column.type, "impl_instance", column.type)
+        if isinstance(column_type, Numeric) and not isinstance(column_type, Float):
+            column = cast(column, Float).label(column.name)
+        columns.append(column)
+    statement = statement.with_only_columns(*columns)
+    schema = pa.schema([(column.name, _arrow_type(column.type)) for column in columns])
+
+    async def record_batches() -> AsyncGenerator[bytes]:
+        sink = io.BytesIO()
+
+        def drain() -> bytes:
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return data
+
+        async with get_db_session_context() as db:
+            result = await db.stream(
+                statement.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+            )
+            with pa.ipc.new_stream(sink, schema) as writer:
+                async for rows in result.partitions():
+                    arrays = [
+                        pa.array(values, type=field.type)
+                        for values, field in zip(zip(*rows), schema, strict=True)
+                    ]
+                    writer.write_batch(pa.record_batch(arrays, schema=schema))
+                    yield drain()
+        yield drain()
+
+    return StreamingResponse(record_batches(), headers=headers, media_type=MEDIA_TYPES["arrow"])
+
+
+async def query_response(
+    db: AsyncSession,
+    statement: Select,
+    response_type: Any,
+    format_name: str,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Send the rows of a query as Arrow record batches, or as response_type otherwise."""
+    if format_name == "arrow":
+        return arrow_response(statement, headers)
+    result = await db.execute(statement)
+    return model_response(response_type, result.all(), headers=headers, format_name=format_name)
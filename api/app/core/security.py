@@ -1,4 +1,9 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -8,11 +13,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.db import get_db_session
+from app.core.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_QUEUE_DEPTH
 from app.repositories.user_repository import UserRepository
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is slow by design, so it runs on its own threads rather than the event loop
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
@@ -20,14 +31,36 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 user_repository = UserRepository()
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def _run_password_hash(function: Callable[..., Any], *args: str) -> Any:
+    """Run a bcrypt call on the password hashing threads, tracking how many are queued."""
+
+    def run() -> Any:
+        PASSWORD_HASH_QUEUE_DEPTH.dec()
+        started_at = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            PASSWORD_HASH_DURATION.observe(time.perf_counter() - started_at)
+
+    def leave_queue_if_cancelled(future: Future) -> None:
+        # Jobs cancelled while still queued never run, so they leave the queue here
+        if future.cancelled():
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+
+    PASSWORD_HASH_QUEUE_DEPTH.inc()
+    future = password_hash_executor.submit(run)
+    future.add_done_callback(leave_queue_if_cancelled)
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return await _run_password_hash(pwd_context.verify, plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return await _run_password_hash(pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -0,0 +1,84 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import TypeVar
+
+from fastapi import Request, Response
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    The first caller for a key starts the call as a task and later callers for the same
+    key await that task instead of starting their own, until it finishes. Awaiting
+    callers are shielded from each other, so one of them being cancelled does not cancel
+    the call for the rest. Exceptions are raised to every caller.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """Run function, or wait for the call already running under key."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(function())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._finish(key, task))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved, in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def response(self, key: Hashable, build: Callable[[], Awaitable[Response]]) -> Response:
+        """
+        Build a response once for concurrent requests with the same key.
+
+        Every request gets its own copy, since middleware may modify a response's headers
+        as it is sent. build must open its own database session: the request that started
+        it may finish or be cancelled before the others. Callers must not hold a session
+        while they wait, or a burst of them can take every pooled connection and leave
+        none for build.
+        """
+        response = await self.do(key, build)
+        return Response(
+            content=response.body, status_code=response.status_code, headers=response.headers
+        )
+
+
+def request_key(
+    request: Request,
+    *parts: Hashable,
+    vary: Iterable[str] = ("accept",),
+    per_user: bool = False,
+) -> tuple:
+    """
+    Derive the single-flight key of a read request.
+
+    The key covers the method, path and query string, the values of the vary headers,
+    and any extra parts such as the ETag of the version being read. Authentication
+    runs for every request before it can join a call; responses that differ by user
+    must be keyed per_user, which adds the authenticated user ID.
+    """
+    return (
+        request.method,
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        tuple(request.headers.get(header) for header in vary),
+        request.state.user_id if per_user else None,
+        *parts,
+    )
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,43 @@
+import numpy as np
+
+
+def plan_sourcing(
+    distances_km: np.ndarray,
+    stock: np.ndarray,
+    line_items: np.ndarray,
+    line_quantities: np.ndarray,
+) -> np.ndarray:
+    """
+    Split order lines across warehouses, shipping every unit from the nearest stock left.
+
+    distances_km has one distance per warehouse, stock one row of available quantities
+    per distinct item, line_items the stock row each order line draws from and
+    line_quantities the requested quantities. Returns the quantity each warehouse ships
+    per line. Lines for the same item are served in order, so a later line only gets
+    stock that earlier lines did not take.
+
+    With one destination and a cost proportional to units times distance, filling each
+    item from the nearest warehouse outwards is optimal, and every line is computed at
+    once from cumulative stock in distance order.
+    """
+    order = np.argsort(distances_km, kind="stable")
+    sorted_stock = stock[:, order]
+    upper = np.cumsum(sorted_stock, axis=1)[line_items]
+    lower = upper - sorted_stock[line_items]
+
+    # Units of the same item already claimed by earlier lines
+    by_item = np.argsort(line_items, kind="stable")
+    sorted_items = line_items[by_item]
+    claimed = np.cumsum(line_quantities[by_item]) - line_quantities[by_item]
+    group_starts = np.flatnonzero(np.r_[True, sorted_items[1:] != sorted_items[:-1]])
+    group_sizes = np.diff(np.r_[group_starts, len(sorted_items)])
+    claimed -= np.repeat(claimed[group_starts], group_sizes)
+    start = np.empty_like(claimed)
+    start[by_item] = claimed
+    end = start + line_quantities
+
+    # Each line takes the overlap of its demand window with each warehouse's stock window
+    taken = np.minimum(upper, end[:, None]) - np.maximum(lower, start[:, None])
+    allocation = np.empty_like(taken)
+    allocation[:, order] = np.clip(taken, 0, None)
+    return allocation
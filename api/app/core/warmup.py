@@ -0,0 +1,77 @@
+import contextlib
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import engine, get_db_session_context
+from app.models.inventory import Inventory
+from app.models.item import Item
+from app.models.warehouse import Warehouse
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.item_repository import ItemRepository
+from app.repositories.version_repository import version_repository
+from app.repositories.warehouse_repository import WarehouseRepository
+
+logger = logging.getLogger(__name__)
+
+inventory_repository = InventoryRepository()
+item_repository = ItemRepository()
+warehouse_repository = WarehouseRepository()
+
+
+async def _prime_statements(db: AsyncSession) -> None:
+    """
+    Run the hottest reads once, for an ID that doesn't exist.
+
+    asyncpg prepares and caches each statement per connection, and introspects the
+    types it uses the first time, so this moves that work out of the first requests.
+    """
+    await version_repository.get_warehouse_version(db, 0)
+    for models in [(Warehouse,), (Inventory,), (Item, Inventory), (Inventory, Warehouse)]:
+        await version_repository.get_table_version(db, *models)
+    await inventory_repository.get_by_warehouse(db, 0)
+    await inventory_repository.get_by_item(db, 0)
+
+
+async def prefill_pool(size: int) -> None:
+    """Open size pool connections at once and prime each, so the pool keeps them ready."""
+    async with contextlib.AsyncExitStack() as stack:
+        connections = [await stack.enter_async_context(engine.connect()) for _ in range(size)]
+        for connection in connections:
+            async with AsyncSession(bind=connection) as db:
+                await _prime_statements(db)
+
+
+async def warm_caches() -> None:
+    """
+    Cache the first page of warehouses and the inventory totals of the first items.
+
+    They are keyed by the current versions, like the requests that read them until the
+    next write.
+    """
+    async with get_db_session_context() as db:
+        # Keyed the same as GET /warehouses/ without parameters
+        version = await version_repository.get_table_version(db, Warehouse)
+        await warehouse_repository.get_warehouses(db, version=version)
+        version = await version_repository.get_table_version(db, Item, Inventory)
+        result = await db.execute(
+            select(Item.item_id).order_by(Item.item_id).limit(settings.CACHE_WARMUP_ITEMS)
+        )
+        await item_repository.get_totals(db, list(result.scalars()), version)
+
+
+async def warm_up() -> None:
+    """
+    Prepare the app for traffic before it starts serving.
+
+    Failures are logged rather than raised, so the app still starts when the database
+    is not reachable yet.
+    """
+    try:
+        await prefill_pool(min(settings.DB_POOL_PREFILL, settings.DB_POOL_SIZE))
+        if settings.CACHE_WARMUP:
+            await warm_caches()
+    except Exception:
+        logger.exception("Warming up failed")
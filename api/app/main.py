@@ -1,20 +1,68 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import IntegrityError
 
+from app.core.cache import cache
+from app.core.compression import CompressionMiddleware
+from app.core.db import engine
+from app.core.errors import integrity_error_handler
+from app.core.health import loop_lag_monitor
+from app.core.metrics import MetricsMiddleware, mark_process_dead
 from app.core.middleware import setup_auth_middleware
+from app.core.responses import ORJSONResponse
+from app.core.security import password_hash_executor
+from app.core.warmup import warm_up
+from app.repositories.reservation_repository import reservation_repository
+from app.repositories.warehouse_repository import warehouse_repository
 from app.routers.auth import router as auth_router
+from app.routers.cache import router as cache_router
+from app.routers.count import router as count_router
+from app.routers.events import router as events_router
+from app.routers.health import router as health_router
 from app.routers.inventory import router as inventory_router
 from app.routers.item import router as item_router
+from app.routers.location import router as location_router
+from app.routers.metrics import router as metrics_router
+from app.routers.sync import router as sync_router
 from app.routers.warehouse import router as warehouse_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open and prime pool connections and fill caches before serving the first request
+    await warm_up()
+    # Expired reservations are released in the background rather than filtered on read
+    sweeper = asyncio.create_task(reservation_repository.run_sweeper())
+    # Purges survive restarts and are picked up again by whichever worker sees them first
+    purge_resumer = asyncio.create_task(warehouse_repository.run_purge_resumer())
+    lag_sampler = asyncio.create_task(loop_lag_monitor.run())
+    yield
+    for task in (sweeper, purge_resumer, lag_sampler):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await cache.close()
+    await engine.dispose()
+    password_hash_executor.shutdown(wait=False, cancel_futures=True)
+    mark_process_dead()
+
+
 app = FastAPI(
     title="Warehouse Management API",
     description="API for managing warehouses, items, and inventory",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 setup_auth_middleware(app)
 
+app.add_exception_handler(IntegrityError, integrity_error_handler)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -24,11 +72,24 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Added late so it wraps the other middleware and compresses their responses too
+app.add_middleware(CompressionMiddleware)
+
+# Outermost, so request latency includes all middleware
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(warehouse_router)
 app.include_router(item_router)
 app.include_router(inventory_router)
+app.include_router(location_router)
+app.include_router(count_router)
+app.include_router(events_router)
+app.include_router(sync_router)
+app.include_router(cache_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -0,0 +1,21 @@
+from sqlmodel import SQLModel
+
+
+class CacheNamespaceStats(SQLModel):
+    """Cache lookups of one namespace since the process started."""
+
+    namespace: str
+    hits: int
+    misses: int
+    hit_ratio: float | None
+
+
+class CacheStats(SQLModel):
+    """Cache lookups since the process started, in total and per namespace."""
+
+    entries: int
+    shared: bool
+    hits: int
+    misses: int
+    hit_ratio: float | None
+    namespaces: list[CacheNamespaceStats]
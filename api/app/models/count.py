@@ -0,0 +1,102 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+
+class CountSessionBase(SQLModel):
+    """Base model for a cycle-count session with common attributes."""
+
+    warehouse_id: int = Field(foreign_key="warehouses.warehouse_id", ondelete="CASCADE")
+
+
+class CountSession(CountSessionBase, table=True):
+    """Cycle-count session model that maps to the database table."""
+
+    __tablename__ = "count_sessions"
+
+    session_id: int | None = Field(default=None, primary_key=True)
+    # open -> closed
+    status: str = "open"
+    opened_at: datetime = Field(default_factory=lambda: datetime.now())
+    closed_at: datetime | None = None
+    # Filled in when the session is closed
+    lines_counted: int = 0
+    lines_adjusted: int = 0
+    net_variance: int = 0
+    absolute_variance: int = 0
+
+
+class CountLine(SQLModel, table=True):
+    """Counted quantity of one item within a cycle-count session."""
+
+    __tablename__ = "count_lines"
+
+    session_id: int = Field(
+        foreign_key="count_sessions.session_id", primary_key=True, ondelete="CASCADE"
+    )
+    item_id: int = Field(foreign_key="items.item_id", primary_key=True, ondelete="CASCADE")
+    counted_quantity: int
+    # System stock the count was compared with, recorded when the session is closed
+    system_quantity: int | None = None
+
+
+class CountBatch(SQLModel, table=True):
+    """Batch of lines already added to a cycle-count session, so retries are skipped."""
+
+    __tablename__ = "count_batches"
+
+    session_id: int = Field(
+        foreign_key="count_sessions.session_id", primary_key=True, ondelete="CASCADE"
+    )
+    batch_id: UUID = Field(primary_key=True)
+
+
+class CountSessionCreate(CountSessionBase):
+    """Schema for opening a new cycle-count session."""
+
+    pass
+
+
+class CountSessionRead(CountSessionBase):
+    """Schema for reading cycle-count session data."""
+
+    session_id: int
+    status: str
+    opened_at: datetime
+    closed_at: datetime | None
+    lines_counted: int
+    lines_adjusted: int
+    net_variance: int
+    absolute_variance: int
+
+
+class CountLineCreate(SQLModel):
+    """Schema for a counted line."""
+
+    item_id: int
+    counted_quantity: int = Field(ge=0)
+
+
+class CountLinesRequest(SQLModel):
+    """Schema for adding a batch of counted lines to a session."""
+
+    # Chosen by the client, and sent again when the batch is retried
+    batch_id: UUID
+    lines: list[CountLineCreate] = Field(min_length=1, max_length=1000)
+
+
+class CountVariance(SQLModel):
+    """Difference between the counted and the system quantity of an item."""
+
+    item_id: int
+    counted_quantity: int
+    system_quantity: int
+    variance: int
+
+
+class CountReport(SQLModel):
+    """Response model for the variances found by a cycle-count session, largest first."""
+
+    session: CountSessionRead
+    variances: list[CountVariance]
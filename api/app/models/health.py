@@ -0,0 +1,34 @@
+from sqlmodel import SQLModel
+
+
+class DatabaseHealth(SQLModel):
+    """Result of pinging the database."""
+
+    ok: bool
+    latency_ms: float | None = None
+    error: str | None = None
+
+
+class PoolHealth(SQLModel):
+    """Usage of the database connection pool."""
+
+    ok: bool
+    checked_out: int
+    capacity: int
+    usage: float
+
+
+class ReadinessReport(SQLModel):
+    """Whether a worker is ready for traffic, with the checks it is based on."""
+
+    ready: bool
+    database: DatabaseHealth
+    pool: PoolHealth
+    loop_lag_ms: float
+    loop_ok: bool
+
+
+class LivenessReport(SQLModel):
+    """Confirms the worker's event loop is responding."""
+
+    status: str = "ok"
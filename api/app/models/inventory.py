@@ -1,7 +1,9 @@
+from sqlalchemy import BigInteger, CheckConstraint, FetchedValue, Index
 from sqlmodel import Field, Relationship, SQLModel
 
-from app.models.item import Item, ItemRead
-from app.models.warehouse import Warehouse, WarehouseRead
+from app.models.item import Item, ItemFieldsRead, ItemRead
+from app.models.pagination import PageInfo
+from app.models.warehouse import Warehouse, WarehouseFieldsRead, WarehouseRead
 
 
 class InventoryBase(SQLModel):
@@ -16,15 +18,44 @@ class Inventory(InventoryBase, table=True):
     """Inventory model that maps to the database table."""
 
     __tablename__ = "inventory"
+    # Lookups by item across warehouses are answered from the index alone
+    __table_args__ = (
+        Index(
+            "ix_inventory_item_id",
+            "item_id",
+            postgresql_include=["warehouse_id", "quantity", "reserved_quantity"],
+        ),
+        # The latest change to a warehouse's inventory is read from the top of the index
+        Index("ix_inventory_warehouse_id_change_seq", "warehouse_id", "change_seq"),
+        # Stock promised to reservations can't be moved, counted or adjusted away
+        CheckConstraint(
+            "quantity >= reserved_quantity", name="ck_inventory_quantity_covers_reserved"
+        ),
+        CheckConstraint("reserved_quantity >= 0", name="ck_inventory_reserved_quantity"),
+    )
 
-    # Define composite primary key
+    # Define composite primary key, removed by the database with its warehouse or item
     warehouse_id: int = Field(
         foreign_key="warehouses.warehouse_id",
         primary_key=True,
+        ondelete="CASCADE",
     )
     item_id: int = Field(
         foreign_key="items.item_id",
         primary_key=True,
+        ondelete="CASCADE",
+    )
+
+    # Stock promised to open reservations, kept on the row so availability is one lookup
+    reserved_quantity: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
+    # Bumped by a database trigger on every insert and update, used for delta sync
+    change_seq: int | None = Field(
+        default=None,
+        sa_type=BigInteger,
+        sa_column_kwargs={"server_default": FetchedValue(), "server_onupdate": FetchedValue()},
+        nullable=False,
+        index=True,
     )
 
     # Define relationships
@@ -43,7 +74,7 @@ class InventoryCreate(InventoryBase):
 class InventoryRead(InventoryBase):
     """Schema for reading inventory data."""
 
-    pass
+    reserved_quantity: int = 0
 
 
 class InventoryWithItem(InventoryRead):
@@ -52,12 +83,45 @@ class InventoryWithItem(InventoryRead):
     item: ItemRead
 
 
+class PaginatedInventoryWithItemResponse(SQLModel):
+    """Paginated response for inventory records with item information."""
+
+    items: list[InventoryWithItem]
+    page_info: PageInfo
+
+
+class WarehouseDashboard(SQLModel):
+    """Response model for a warehouse with its stock summary and inventory page."""
+
+    warehouse: WarehouseRead
+    sku_count: int
+    total_units: int
+    low_stock_count: int
+    inventory: PaginatedInventoryWithItemResponse
+
+
 class InventoryWithWarehouse(InventoryRead):
     """Schema for reading inventory data with warehouse information."""
 
     warehouse: WarehouseRead
 
 
+class InventoryFieldsRead(SQLModel):
+    """
+    Schema for reading a subset of inventory fields, with its item or warehouse embedded
+    on request.
+
+    Fields that were not selected are left unset and omitted from responses.
+    """
+
+    warehouse_id: int | None = None
+    item_id: int | None = None
+    quantity: int | None = None
+    reserved_quantity: int | None = None
+    item: ItemFieldsRead | None = None
+    warehouse: WarehouseFieldsRead | None = None
+
+
 class InventoryUpdate(SQLModel):
     """Schema for updating an inventory record."""
 
@@ -79,3 +143,95 @@ class InventoryTransferResponse(SQLModel):
     message: str
     source_inventory: InventoryRead
     destination_inventory: InventoryRead
+
+
+class InventoryMatrix(SQLModel):
+    """
+    Item × warehouse stock pivot.
+
+    Dense matrices carry one row of quantities per item, ordered like warehouse_ids.
+    Sparse matrices carry (item_index, warehouse_index, quantity) cells instead.
+    """
+
+    warehouse_ids: list[int]
+    item_ids: list[int]
+    quantities: list[list[int]] | None = None
+    cells: list[tuple[int, int, int]] | None = None
+
+
+class SourcingLine(SQLModel):
+    """Schema for an order line to source."""
+
+    item_id: int
+    quantity: int = Field(gt=0)
+
+
+class SourcingRequest(SQLModel):
+    """Schema for requesting a fulfilment sourcing plan."""
+
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    lines: list[SourcingLine] = Field(min_length=1)
+
+
+class SourcingAllocation(SQLModel):
+    """Quantity of an order line shipped from one warehouse."""
+
+    warehouse_id: int
+    quantity: int
+    distance_km: float
+
+
+class SourcingPlanLine(SQLModel):
+    """Sourcing of one order line."""
+
+    item_id: int
+    quantity: int
+    shortfall: int
+    allocations: list[SourcingAllocation]
+
+
+class SourcingPlan(SQLModel):
+    """Response model for a fulfilment sourcing plan."""
+
+    fulfillable: bool
+    total_unit_km: float
+    lines: list[SourcingPlanLine]
+
+
+class AvailabilityLine(SQLModel):
+    """Schema for an order line to check availability for."""
+
+    item_id: int
+    quantity: int = Field(gt=0)
+    warehouse_id: int | None = None
+
+
+class AvailabilityRequest(SQLModel):
+    """Schema for checking the availability of several order lines."""
+
+    lines: list[AvailabilityLine] = Field(min_length=1, max_length=1000)
+
+
+class AvailabilityLineResult(SQLModel):
+    """
+    Availability of one order line.
+
+    available counts the stock in the requested warehouse, or in all warehouses if none
+    was requested. The best warehouse is the one holding the most of the item anywhere.
+    """
+
+    item_id: int
+    quantity: int
+    warehouse_id: int | None
+    available: int
+    fulfillable: bool
+    best_warehouse_id: int | None
+    best_warehouse_quantity: int
+
+
+class AvailabilityResponse(SQLModel):
+    """Response model for a multi-line availability check."""
+
+    all_fulfillable: bool
+    lines: list[AvailabilityLineResult]
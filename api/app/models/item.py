@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import BigInteger, FetchedValue
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.pagination import PageInfo
@@ -14,6 +15,8 @@ class ItemBase(SQLModel):
     name: str
     description: str
     sku: str | None = None
+    # Floor area one unit takes up, in the same unit as warehouse square footage
+    unit_footprint: float | None = Field(default=None, ge=0)
 
 
 class Item(ItemBase, table=True):
@@ -23,9 +26,19 @@ class Item(ItemBase, table=True):
 
     item_id: int | None = Field(default=None, primary_key=True)
 
+    # Bumped by a database trigger on every insert and update, used for delta sync
+    change_seq: int | None = Field(
+        default=None,
+        sa_type=BigInteger,
+        sa_column_kwargs={"server_default": FetchedValue(), "server_onupdate": FetchedValue()},
+        nullable=False,
+        index=True,
+    )
+
     # Define relationship with Inventory
     inventory_items: list["Inventory"] = Relationship(
-        back_populates="item", sa_relationship_kwargs={"cascade": "all, delete-orphan"}
+        back_populates="item",
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
     )
 
 
@@ -39,6 +52,25 @@ class ItemRead(ItemBase):
     """Schema for reading item data."""
 
 
+class ItemExportRead(ItemRead):
+    """Schema for reading item data in a full export."""
+
+    item_id: int
+
+
+class ItemFieldsRead(SQLModel):
+    """
+    Schema for reading a subset of item fields.
+
+    Fields that were not selected are left unset and omitted from responses.
+    """
+
+    name: str | None = None
+    description: str | None = None
+    sku: str | None = None
+    unit_footprint: float | None = None
+
+
 class ItemReadWithInventory(ItemRead):
     """Schema for reading item data with total inventory information."""
 
@@ -52,6 +84,7 @@ class ItemUpdate(SQLModel):
     name: str | None = None
     description: str | None = None
     sku: str | None = None
+    unit_footprint: float | None = Field(default=None, ge=0)
 
 
 class PaginatedItemWithInventoryResponse(SQLModel):
@@ -0,0 +1,116 @@
+from sqlalchemy import Index, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class LocationBase(SQLModel):
+    """Base model for a bin location with common attributes."""
+
+    warehouse_id: int = Field(foreign_key="warehouses.warehouse_id", ondelete="CASCADE")
+    code: str
+    # Position of the location along the warehouse's pick path
+    pick_sequence: int = Field(ge=0)
+
+
+class Location(LocationBase, table=True):
+    """Bin location model that maps to the database table."""
+
+    __tablename__ = "locations"
+    __table_args__ = (
+        UniqueConstraint("warehouse_id", "code"),
+        Index("ix_locations_warehouse_id_pick_sequence", "warehouse_id", "pick_sequence"),
+    )
+
+    location_id: int | None = Field(default=None, primary_key=True)
+
+
+class LocationCreate(LocationBase):
+    """Schema for creating a new location."""
+
+    pass
+
+
+class LocationRead(LocationBase):
+    """Schema for reading location data."""
+
+    location_id: int
+
+
+class LocationUpdate(SQLModel):
+    """Schema for updating a location."""
+
+    code: str | None = None
+    pick_sequence: int | None = Field(default=None, ge=0)
+
+
+class LocationStock(SQLModel, table=True):
+    """
+    Quantity of an item stored in one location.
+
+    Location quantities roll up into the warehouse's inventory, which also counts stock
+    that has not been put away into a location yet.
+    """
+
+    __tablename__ = "location_stock"
+    __table_args__ = (Index("ix_location_stock_warehouse_id_item_id", "warehouse_id", "item_id"),)
+
+    location_id: int = Field(
+        foreign_key="locations.location_id", primary_key=True, ondelete="CASCADE"
+    )
+    item_id: int = Field(foreign_key="items.item_id", primary_key=True, ondelete="CASCADE")
+    warehouse_id: int = Field(foreign_key="warehouses.warehouse_id", ondelete="CASCADE")
+    quantity: int
+
+
+class LocationStockRead(SQLModel):
+    """Schema for reading location stock."""
+
+    location_id: int
+    item_id: int
+    warehouse_id: int
+    quantity: int
+
+
+class LocationStockUpdate(SQLModel):
+    """Schema for setting the quantity of an item in a location."""
+
+    quantity: int = Field(ge=0)
+
+
+class PickListLine(SQLModel):
+    """Schema for an order line to pick."""
+
+    item_id: int
+    quantity: int = Field(gt=0)
+
+
+class PickListRequest(SQLModel):
+    """Schema for requesting a pick list."""
+
+    warehouse_id: int
+    lines: list[PickListLine] = Field(min_length=1)
+
+
+class PickStop(SQLModel):
+    """Quantity of an item to pick at one location."""
+
+    location_id: int
+    code: str
+    pick_sequence: int
+    item_id: int
+    quantity: int
+
+
+class PickListItem(SQLModel):
+    """Picking of one item, with its order lines combined."""
+
+    item_id: int
+    quantity: int
+    shortfall: int
+
+
+class PickList(SQLModel):
+    """Response model for a pick list, with stops in walking order."""
+
+    complete: bool
+    stops: list[PickStop]
+    items: list[PickListItem]
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, FetchedValue
+from sqlmodel import Field, SQLModel
+
+from app.models.inventory import InventoryRead
+
+
+class InventoryMovement(SQLModel, table=True):
+    """Append-only ledger entry for a change of an inventory quantity."""
+
+    __tablename__ = "inventory_movements"
+
+    movement_id: int | None = Field(default=None, primary_key=True, sa_type=BigInteger)
+    warehouse_id: int = Field(index=True)
+    item_id: int = Field(index=True)
+    delta: int
+    kind: str
+    created_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": FetchedValue()},
+        nullable=False,
+    )
+
+
+class InventorySnapshot(SQLModel, table=True):
+    """Point-in-time copy of all inventory quantities."""
+
+    __tablename__ = "inventory_snapshots"
+
+    snapshot_id: int | None = Field(default=None, primary_key=True)
+    taken_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
+    # Last ledger entry included in the snapshot
+    last_movement_id: int = Field(sa_type=BigInteger)
+
+
+class InventorySnapshotLine(SQLModel, table=True):
+    """Quantity of one inventory record in a snapshot."""
+
+    __tablename__ = "inventory_snapshot_lines"
+
+    snapshot_id: int = Field(
+        foreign_key="inventory_snapshots.snapshot_id", primary_key=True, ondelete="CASCADE"
+    )
+    warehouse_id: int = Field(primary_key=True)
+    item_id: int = Field(primary_key=True)
+    quantity: int
+
+
+class InventoryHistory(SQLModel):
+    """Inventory quantities as they were at a point in time."""
+
+    at: datetime
+    snapshot_taken_at: datetime
+    records: list[InventoryRead]
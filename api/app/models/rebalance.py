@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Literal
+
+from sqlmodel import Field, SQLModel
+
+from app.models.pagination import PageInfo
+
+
+class RebalancePlanBase(SQLModel):
+    """Base model for a stock rebalancing plan with common attributes."""
+
+    strategy: str
+    tolerance: float
+
+
+class RebalancePlan(RebalancePlanBase, table=True):
+    """Rebalancing plan model that maps to the database table."""
+
+    __tablename__ = "rebalance_plans"
+
+    plan_id: int | None = Field(default=None, primary_key=True)
+    # pending -> ready -> applied, or failed / stale
+    status: str = "pending"
+    created_at: datetime = Field(default_factory=lambda: datetime.now())
+    finished_at: datetime | None = None
+    applied_at: datetime | None = None
+    transfer_count: int = 0
+    units_moved: int = 0
+    unit_km: float = 0.0
+    error: str | None = None
+
+
+class RebalanceTransfer(SQLModel, table=True):
+    """Transfer of one item between two warehouses within a rebalancing plan."""
+
+    __tablename__ = "rebalance_transfers"
+
+    plan_id: int = Field(
+        foreign_key="rebalance_plans.plan_id", primary_key=True, ondelete="CASCADE"
+    )
+    source_warehouse_id: int = Field(primary_key=True)
+    destination_warehouse_id: int = Field(primary_key=True)
+    item_id: int = Field(primary_key=True)
+    quantity: int
+    distance_km: float
+
+
+class RebalanceRequest(SQLModel):
+    """Schema for requesting a rebalancing plan."""
+
+    strategy: Literal["capacity", "even"] = "capacity"
+    tolerance: float = Field(0.1, ge=0, le=1)
+
+
+class RebalancePlanRead(RebalancePlanBase):
+    """Schema for reading a rebalancing plan."""
+
+    plan_id: int
+    status: str
+    created_at: datetime
+    finished_at: datetime | None
+    applied_at: datetime | None
+    transfer_count: int
+    units_moved: int
+    unit_km: float
+    error: str | None
+
+
+class RebalanceTransferRead(SQLModel):
+    """Schema for reading a planned transfer."""
+
+    source_warehouse_id: int
+    destination_warehouse_id: int
+    item_id: int
+    quantity: int
+    distance_km: float
+
+
+class PaginatedRebalanceTransferResponse(SQLModel):
+    """Paginated response for the transfers of a rebalancing plan."""
+
+    items: list[RebalanceTransferRead]
+    page_info: PageInfo
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, FetchedValue, ForeignKeyConstraint
+from sqlmodel import Field, SQLModel
+
+
+class ReservationBase(SQLModel):
+    """Base model for a stock reservation with common attributes."""
+
+    warehouse_id: int
+    item_id: int
+    quantity: int = Field(gt=0)
+
+
+class Reservation(ReservationBase, table=True):
+    """
+    Reservation model that maps to the database table.
+
+    Open reservations are summed into Inventory.reserved_quantity. Rows are deleted when
+    the reservation is released, fulfilled or swept after expiring.
+    """
+
+    __tablename__ = "reservations"
+    # Removed by the database together with the inventory record they hold stock from
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["warehouse_id", "item_id"],
+            ["inventory.warehouse_id", "inventory.item_id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    reservation_id: int | None = Field(default=None, primary_key=True)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
+    created_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": FetchedValue()},
+        nullable=False,
+    )
+
+
+class ReservationCreate(ReservationBase):
+    """Schema for creating a new reservation."""
+
+    ttl_seconds: int | None = Field(default=None, ge=1, le=86400)
+
+
+class ReservationRead(ReservationBase):
+    """Schema for reading reservation data."""
+
+    reservation_id: int
+    expires_at: datetime
+    created_at: datetime
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, FetchedValue, Index
+from sqlmodel import Field, SQLModel
+
+from app.models.inventory import InventoryRead
+from app.models.item import ItemRead
+from app.models.warehouse import WarehouseRead
+
+
+class DeletedRow(SQLModel, table=True):
+    """Tombstone written by a database trigger whenever a synced row is deleted."""
+
+    __tablename__ = "deleted_rows"
+    __table_args__ = (Index("ix_deleted_rows_entity_change_seq", "entity", "change_seq"),)
+
+    change_seq: int | None = Field(
+        default=None,
+        primary_key=True,
+        sa_type=BigInteger,
+        sa_column_kwargs={"server_default": FetchedValue()},
+    )
+    entity: str
+    warehouse_id: int | None = None
+    item_id: int | None = None
+    deleted_at: datetime = Field(sa_column_kwargs={"server_default": FetchedValue()})
+
+
+class DeletedRowRead(SQLModel):
+    """Schema for reading a deleted row's identity."""
+
+    entity: str
+    warehouse_id: int | None = None
+    item_id: int | None = None
+
+
+class SyncItem(ItemRead):
+    """Schema for reading item data in a sync response."""
+
+    item_id: int
+
+
+class SyncResponse(SQLModel):
+    """Rows upserted or deleted since a change sequence watermark."""
+
+    watermark: int
+    has_more: bool
+    warehouses: list[WarehouseRead]
+    items: list[SyncItem]
+    inventory: list[InventoryRead]
+    deleted: list[DeletedRowRead]
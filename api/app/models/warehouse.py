@@ -1,8 +1,12 @@
+from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from sqlalchemy import BigInteger, FetchedValue
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.models.pagination import PageInfo
+
 if TYPE_CHECKING:
     from app.models.inventory import Inventory
 
@@ -26,13 +30,47 @@ class Warehouse(WarehouseBase, table=True):
 
     warehouse_id: int | None = Field(default=None, primary_key=True)
 
+    # Floor area taken up by stock, maintained by a database trigger on the ledger.
+    # Updates to it alone keep the warehouse's change_seq.
+    used_footprint: float = Field(default=0.0, sa_column_kwargs={"server_default": "0"})
+
+    # Set when a background purge starts; the warehouse is hidden until it is gone
+    deleting: bool = Field(default=False, sa_column_kwargs={"server_default": "false"})
+
+    # Bumped by a database trigger on every insert and update, used for delta sync
+    change_seq: int | None = Field(
+        default=None,
+        sa_type=BigInteger,
+        sa_column_kwargs={"server_default": FetchedValue(), "server_onupdate": FetchedValue()},
+        nullable=False,
+        index=True,
+    )
+
     # Define relationship with Inventory
     inventory_items: list["Inventory"] = Relationship(
         back_populates="warehouse",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "passive_deletes": True},
     )
 
 
+class WarehousePurge(SQLModel, table=True):
+    """Background deletion of a warehouse, kept after the warehouse is gone."""
+
+    __tablename__ = "warehouse_purges"
+
+    purge_id: int | None = Field(default=None, primary_key=True)
+    # No foreign key, so the purge outlives the warehouse it deletes
+    warehouse_id: int = Field(index=True)
+    # running -> done, or failed
+    status: str = "running"
+    removed_count: int = 0
+    created_at: datetime = Field(default_factory=lambda: datetime.now())
+    # Renewed after every chunk; running purges left unrenewed are resumed
+    heartbeat_at: datetime = Field(default_factory=lambda: datetime.now())
+    finished_at: datetime | None = None
+    error: str | None = None
+
+
 class WarehouseCreate(WarehouseBase):
     """Schema for creating a new warehouse."""
 
@@ -55,3 +93,58 @@ class WarehouseUpdate(SQLModel):
     phone: str | None = None
     latitude: Decimal | None = None
     longitude: Decimal | None = None
+
+
+class WarehouseFieldsRead(SQLModel):
+    """
+    Schema for reading a subset of warehouse fields.
+
+    Fields that were not selected are left unset and omitted from responses.
+    """
+
+    warehouse_id: int | None = None
+    name: str | None = None
+    square_footage: float | None = None
+    address: str | None = None
+    manager_name: str | None = None
+    phone: str | None = None
+    latitude: Decimal | None = None
+    longitude: Decimal | None = None
+
+
+class PaginatedWarehouseResponse(SQLModel):
+    """Paginated response for warehouses."""
+
+    items: list[WarehouseFieldsRead]
+    page_info: PageInfo
+
+
+class WarehouseUtilization(SQLModel):
+    """Schema for a warehouse's floor space utilization."""
+
+    warehouse_id: int
+    name: str
+    square_footage: float
+    used_footprint: float
+    utilization: float | None
+    available_footprint: float
+
+
+class NearestWarehouse(SQLModel):
+    """Schema for a warehouse returned by a nearest-warehouse lookup."""
+
+    warehouse: WarehouseRead
+    distance_km: float
+    quantity: int | None = None
+
+
+class WarehousePurgeRead(SQLModel):
+    """Schema for reading a warehouse purge."""
+
+    purge_id: int
+    warehouse_id: int
+    status: str
+    removed_count: int
+    created_at: datetime
+    finished_at: datetime | None
+    error: str | None
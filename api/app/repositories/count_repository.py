@@ -0,0 +1,217 @@
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import and_, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache
+from app.core.events import publish_event
+from app.models.count import (
+    CountBatch,
+    CountLine,
+    CountLinesRequest,
+    CountReport,
+    CountSession,
+    CountSessionCreate,
+    CountSessionRead,
+    CountVariance,
+)
+from app.models.inventory import Inventory
+from app.models.location import LocationStock
+from app.repositories.location_repository import location_repository
+from app.repositories.movement_repository import movement_repository
+
+
+class CountRepository:
+    """Repository for cycle-count sessions."""
+
+    async def create(self, db: AsyncSession, session: CountSessionCreate) -> CountSession:
+        """Open a new cycle-count session for a warehouse."""
+        db_session = CountSession.model_validate(session)
+        db.add(db_session)
+        await db.commit()
+        await db.refresh(db_session)
+        return db_session
+
+    async def get_by_id(self, db: AsyncSession, session_id: int) -> CountSession | None:
+        """Get a cycle-count session by ID."""
+        result = await db.execute(select(CountSession).where(CountSession.session_id == session_id))
+        return result.scalar_one_or_none()
+
+    async def add_lines(
+        self, db: AsyncSession, session_id: int, request: CountLinesRequest
+    ) -> tuple[CountSession | None, bool]:
+        """
+        Add counted lines to an open session.
+
+        Counts of the same item are added together, so an item stored in several places
+        can be counted place by place. Each batch is added once, so a retried batch is
+        accepted without being counted twice. Returns a tuple of (session, added).
+        Nothing is added if the session is closed.
+        """
+        # Shared lock, so lines cannot arrive while the session is being closed
+        result = await db.execute(
+            select(CountSession)
+            .where(CountSession.session_id == session_id)
+            .with_for_update(read=True)
+        )
+        db_session = result.scalar_one_or_none()
+        if db_session is None or db_session.status != "open":
+            return db_session, False
+
+        # A concurrent retry waits on the key until this batch commits or rolls back
+        batch_result = await db.execute(
+            insert(CountBatch)
+            .values(session_id=session_id, batch_id=request.batch_id)
+            .on_conflict_do_nothing()
+            .returning(CountBatch.batch_id)
+        )
+        if batch_result.scalar_one_or_none() is None:
+            return db_session, True
+
+        counted = Counter()
+        for line in request.lines:
+            counted[line.item_id] += line.counted_quantity
+
+        statement = insert(CountLine).values(
+            [
+                {"session_id": session_id, "item_id": item_id, "counted_quantity": quantity}
+                for item_id, quantity in sorted(counted.items())
+            ]
+        )
+        await db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[CountLine.session_id, CountLine.item_id],
+                set_={
+                    "counted_quantity": CountLine.counted_quantity
+                    + statement.excluded.counted_quantity
+                },
+            )
+        )
+        await db.commit()
+        return db_session, True
+
+    async def close(
+        self, db: AsyncSession, session_id: int
+    ) -> tuple[CountSession | None, CountReport | None]:
+        """
+        Close an open session and set the counted items to their counted quantities.
+
+        Variances against system stock are computed for all lines at once, and every
+        adjustment is applied in one transaction. Returns a tuple of (session, report).
+        Nothing is applied if the session is not open.
+        """
+        result = await db.execute(
+            select(CountSession).where(CountSession.session_id == session_id).with_for_update()
+        )
+        db_session = result.scalar_one_or_none()
+        if db_session is None or db_session.status != "open":
+            return db_session, None
+
+        warehouse_id = db_session.warehouse_id
+        counted_items = select(CountLine.item_id).where(CountLine.session_id == session_id)
+
+        # Lock the counted stock so the variances match what is overwritten
+        await db.execute(
+            select(Inventory.item_id)
+            .where(Inventory.warehouse_id == warehouse_id, Inventory.item_id.in_(counted_items))
+            .order_by(Inventory.item_id)
+            .with_for_update()
+        )
+
+        system_quantity = (
+            select(Inventory.quantity)
+            .where(Inventory.warehouse_id == warehouse_id, Inventory.item_id == CountLine.item_id)
+            .scalar_subquery()
+        )
+        await db.execute(
+            update(CountLine)
+            .where(CountLine.session_id == session_id)
+            .values(system_quantity=func.coalesce(system_quantity, 0))
+            .execution_options(synchronize_session=False)
+        )
+
+        variance = CountLine.counted_quantity - CountLine.system_quantity
+        adjusted = and_(CountLine.session_id == session_id, variance != 0)
+        upsert = insert(Inventory).from_select(
+            ["warehouse_id", "item_id", "quantity"],
+            select(literal(warehouse_id), CountLine.item_id, CountLine.counted_quantity).where(
+                adjusted
+            ),
+        )
+        await db.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[Inventory.warehouse_id, Inventory.item_id],
+                set_={"quantity": upsert.excluded.quantity},
+            )
+        )
+        await movement_repository.record_from_select(
+            db,
+            select(literal(warehouse_id), CountLine.item_id, variance, literal("counted")).where(
+                adjusted
+            ),
+        )
+        await location_repository.fit_to_inventory(
+            db, LocationStock.warehouse_id == warehouse_id, LocationStock.item_id.in_(counted_items)
+        )
+
+        summary_result = await db.execute(
+            select(
+                func.count(),
+                func.count().filter(variance != 0),
+                func.coalesce(func.sum(variance), 0),
+                func.coalesce(func.sum(func.abs(variance)), 0),
+            ).where(CountLine.session_id == session_id)
+        )
+        (
+            db_session.lines_counted,
+            db_session.lines_adjusted,
+            db_session.net_variance,
+            db_session.absolute_variance,
+        ) = summary_result.one()
+        db_session.status = "closed"
+        db_session.closed_at = datetime.now()
+        # One event for the whole count; subscribers refetch instead of replaying it
+        await publish_event(
+            db, "inventory", "counted", warehouse_id=warehouse_id, session_id=session_id
+        )
+        await db.commit()
+        await cache.invalidate("inventory")
+        await db.refresh(db_session)
+        return db_session, await self.get_report(db, session_id)
+
+    async def get_report(self, db: AsyncSession, session_id: int) -> CountReport | None:
+        """
+        Get the variances of a session, largest first.
+
+        Closed sessions report against the stock they were closed with. Open sessions
+        preview the variances against current stock.
+        """
+        db_session = await self.get_by_id(db, session_id)
+        if db_session is None:
+            return None
+
+        system_quantity = func.coalesce(CountLine.system_quantity, Inventory.quantity, 0)
+        variance = CountLine.counted_quantity - system_quantity
+        result = await db.execute(
+            select(
+                CountLine.item_id,
+                CountLine.counted_quantity,
+                system_quantity.label("system_quantity"),
+                variance.label("variance"),
+            )
+            .outerjoin(
+                Inventory,
+                and_(
+                    Inventory.warehouse_id == db_session.warehouse_id,
+                    Inventory.item_id == CountLine.item_id,
+                ),
+            )
+            .where(CountLine.session_id == session_id, variance != 0)
+            .order_by(func.abs(variance).desc(), CountLine.item_id)
+        )
+        return CountReport(
+            session=CountSessionRead.model_validate(db_session),
+            variances=[CountVariance.model_validate(row, from_attributes=True) for row in result],
+        )
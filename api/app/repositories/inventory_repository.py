@@ -1,8 +1,32 @@
-from sqlalchemy import and_, select
+import numpy as np
+from sqlalchemy import ARRAY, Integer, Select, and_, bindparam, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.models.inventory import Inventory, InventoryCreate, InventoryUpdate
+from app.core.cache import cache, inventory_read_tags, inventory_write_tags
+from app.core.events import publish_event
+from app.core.geo import haversine_km
+from app.core.sourcing import plan_sourcing
+from app.models.inventory import (
+    AvailabilityLineResult,
+    AvailabilityRequest,
+    AvailabilityResponse,
+    Inventory,
+    InventoryCreate,
+    InventoryFieldsRead,
+    InventoryMatrix,
+    InventoryUpdate,
+    SourcingAllocation,
+    SourcingPlan,
+    SourcingPlanLine,
+    SourcingRequest,
+)
+from app.models.item import Item
+from app.models.location import LocationStock
+from app.models.warehouse import Warehouse
+from app.repositories.location_repository import location_repository
+from app.repositories.movement_repository import movement_repository
 
 
 class InventoryRepository:
@@ -12,7 +36,27 @@ class InventoryRepository:
         """Create a new inventory record."""
         db_inventory = Inventory.model_validate(inventory)
         db.add(db_inventory)
+        await movement_repository.record(
+            db,
+            [
+                {
+                    "warehouse_id": db_inventory.warehouse_id,
+                    "item_id": db_inventory.item_id,
+                    "delta": db_inventory.quantity,
+                    "kind": "created",
+                }
+            ],
+        )
+        await publish_event(
+            db,
+            "inventory",
+            "created",
+            warehouse_id=db_inventory.warehouse_id,
+            item_id=db_inventory.item_id,
+            quantity=db_inventory.quantity,
+        )
         await db.commit()
+        await cache.invalidate(*inventory_write_tags(inventory.warehouse_id, inventory.item_id))
         await db.refresh(db_inventory)
         return db_inventory
 
@@ -45,6 +89,286 @@ class InventoryRepository:
         )
         return result.unique().scalars().all()
 
+    def fields_statement(
+        self,
+        fields: list[str],
+        embed: str | None = None,
+        embed_fields: list[str] | None = None,
+        warehouse_id: int | None = None,
+        item_id: int | None = None,
+    ) -> Select:
+        """
+        Build a query for selected inventory fields of a warehouse or an item.
+
+        embed names a relation, item or warehouse, whose embed_fields are joined in as
+        columns labelled relation.field.
+        """
+        columns = [getattr(Inventory, field).label(field) for field in fields]
+        statement = select(*columns).select_from(Inventory)
+        if embed is not None:
+            related_model, onclause = {
+                "item": (Item, Item.item_id == Inventory.item_id),
+                "warehouse": (Warehouse, Warehouse.warehouse_id == Inventory.warehouse_id),
+            }[embed]
+            statement = statement.join(related_model, onclause).add_columns(
+                *(getattr(related_model, field).label(f"{embed}.{field}") for field in embed_fields)
+            )
+        if warehouse_id is not None:
+            statement = statement.where(Inventory.warehouse_id == warehouse_id)
+        if item_id is not None:
+            statement = statement.where(Inventory.item_id == item_id)
+        return statement.order_by(Inventory.warehouse_id, Inventory.item_id)
+
+    def export_statement(self) -> Select:
+        """Build a query for all inventory records."""
+        return select(
+            Inventory.warehouse_id,
+            Inventory.item_id,
+            Inventory.quantity,
+            Inventory.reserved_quantity,
+        ).order_by(Inventory.warehouse_id, Inventory.item_id)
+
+    async def get_fields(
+        self,
+        db: AsyncSession,
+        fields: list[str],
+        embed: str | None = None,
+        embed_fields: list[str] | None = None,
+        warehouse_id: int | None = None,
+        item_id: int | None = None,
+    ) -> list[InventoryFieldsRead]:
+        """
+        Get the inventory records of a warehouse or an item with only selected fields.
+
+        embed names a relation, item or warehouse, whose embed_fields are joined in and
+        embedded. Only the selected columns are loaded.
+        """
+        result = await db.execute(
+            self.fields_statement(fields, embed, embed_fields, warehouse_id, item_id)
+        )
+        records = []
+        for row in result:
+            values = dict(row._mapping)
+            if embed is not None:
+                values[embed] = {field: values.pop(f"{embed}.{field}") for field in embed_fields}
+            records.append(InventoryFieldsRead.model_validate(values))
+        return records
+
+    async def get_matrix(
+        self,
+        db: AsyncSession,
+        warehouse_ids: list[int] | None = None,
+        item_ids: list[int] | None = None,
+        sparse: bool = False,
+        version: int | None = None,
+    ) -> InventoryMatrix:
+        """
+        Get stock per item per warehouse as a pivot built from one aggregate query.
+
+        Results are cached until the next inventory write to the warehouses, or else the
+        items, they cover. The cache versions are read before the query, so a write that
+        commits while it runs is not hidden behind a result cached as current. version
+        is the database version the caller's ETag was built from; it is part of the
+        cache key, so the matrix returned is never older than that version.
+        """
+        cache_key = (
+            tuple(sorted(set(warehouse_ids))) if warehouse_ids else None,
+            tuple(sorted(set(item_ids))) if item_ids else None,
+            sparse,
+            version,
+        )
+        cached = await cache.get("inventory", cache_key)
+        if cached is not None:
+            return cached
+        tags = inventory_read_tags(warehouse_ids, item_ids)
+        versions = await cache.tag_versions("inventory", tags)
+
+        query = (
+            select(
+                Inventory.item_id,
+                Inventory.warehouse_id,
+                func.sum(Inventory.quantity).label("quantity"),
+            )
+            .group_by(Inventory.item_id, Inventory.warehouse_id)
+            .order_by(Inventory.item_id, Inventory.warehouse_id)
+        )
+        if warehouse_ids:
+            query = query.where(Inventory.warehouse_id.in_(warehouse_ids))
+        if item_ids:
+            query = query.where(Inventory.item_id.in_(item_ids))
+
+        result = await db.execute(query)
+        rows = result.all()
+
+        # Rows arrive sorted by item, so item positions follow insertion order
+        item_positions: dict[int, int] = {}
+        for item_id, _, _ in rows:
+            item_positions.setdefault(item_id, len(item_positions))
+        warehouse_ids_sorted = sorted({warehouse_id for _, warehouse_id, _ in rows})
+        warehouse_positions = {
+            warehouse_id: index for index, warehouse_id in enumerate(warehouse_ids_sorted)
+        }
+
+        matrix = InventoryMatrix(
+            warehouse_ids=warehouse_ids_sorted,
+            item_ids=list(item_positions),
+        )
+        if sparse:
+            matrix.cells = [
+                (item_positions[item_id], warehouse_positions[warehouse_id], quantity)
+                for item_id, warehouse_id, quantity in rows
+            ]
+        else:
+            quantities = [[0] * len(warehouse_positions) for _ in item_positions]
+            for item_id, warehouse_id, quantity in rows:
+                quantities[item_positions[item_id]][warehouse_positions[warehouse_id]] = quantity
+            matrix.quantities = quantities
+
+        await cache.set("inventory", cache_key, matrix, tags, versions)
+        return matrix
+
+    async def check_availability(
+        self, db: AsyncSession, request: AvailabilityRequest
+    ) -> AvailabilityResponse:
+        """
+        Check the availability of every order line with one query.
+
+        The lines are sent as arrays and unnested into a relation joined to the
+        inventory, so the cost does not grow with round trips. Lines are checked
+        independently, so lines for the same item may count the same stock.
+        """
+        lines = (
+            func.unnest(
+                bindparam("line_numbers", list(range(len(request.lines))), type_=ARRAY(Integer)),
+                bindparam(
+                    "item_ids", [line.item_id for line in request.lines], type_=ARRAY(Integer)
+                ),
+                bindparam(
+                    "warehouse_ids",
+                    [line.warehouse_id for line in request.lines],
+                    type_=ARRAY(Integer),
+                ),
+            )
+            .table_valued("line_number", "item_id", "warehouse_id")
+            .render_derived(name="lines")
+        )
+        in_requested_warehouse = or_(
+            lines.c.warehouse_id.is_(None), Inventory.warehouse_id == lines.c.warehouse_id
+        )
+        available = Inventory.quantity - Inventory.reserved_quantity
+        result = await db.execute(
+            select(
+                lines.c.line_number,
+                func.coalesce(func.sum(available).filter(in_requested_warehouse), 0).label(
+                    "available"
+                ),
+                func.array_agg(
+                    aggregate_order_by(
+                        Inventory.warehouse_id, available.desc(), Inventory.warehouse_id
+                    )
+                )[1].label("best_warehouse_id"),
+                func.coalesce(func.max(available), 0).label("best_warehouse_quantity"),
+            )
+            .select_from(lines)
+            .outerjoin(
+                Inventory,
+                and_(Inventory.item_id == lines.c.item_id, available > 0),
+            )
+            .group_by(lines.c.line_number)
+            .order_by(lines.c.line_number)
+        )
+
+        results = [
+            AvailabilityLineResult(
+                item_id=line.item_id,
+                quantity=line.quantity,
+                warehouse_id=line.warehouse_id,
+                available=row.available,
+                fulfillable=row.available >= line.quantity,
+                best_warehouse_id=row.best_warehouse_id,
+                best_warehouse_quantity=row.best_warehouse_quantity,
+            )
+            for line, row in zip(request.lines, result, strict=True)
+        ]
+        return AvailabilityResponse(
+            all_fulfillable=all(line.fulfillable for line in results), lines=results
+        )
+
+    async def plan_sourcing(self, db: AsyncSession, request: SourcingRequest) -> SourcingPlan:
+        """
+        Plan the cheapest split of order lines across warehouses for a destination.
+
+        Stock and warehouse coordinates for all requested items are loaded in one query,
+        then every line is planned at once against the vector of warehouse distances.
+        """
+        item_ids = sorted({line.item_id for line in request.lines})
+        result = await db.execute(
+            select(
+                Inventory.warehouse_id,
+                Inventory.item_id,
+                (Inventory.quantity - Inventory.reserved_quantity).label("quantity"),
+                Warehouse.latitude,
+                Warehouse.longitude,
+            )
+            .join(Warehouse, Warehouse.warehouse_id == Inventory.warehouse_id)
+            .where(
+                Inventory.item_id.in_(item_ids),
+                Inventory.quantity > Inventory.reserved_quantity,
+            )
+        )
+        rows = result.all()
+
+        warehouse_ids = sorted({row.warehouse_id for row in rows})
+        warehouse_positions = {warehouse_id: i for i, warehouse_id in enumerate(warehouse_ids)}
+        item_positions = {item_id: i for i, item_id in enumerate(item_ids)}
+
+        stock = np.zeros((len(item_ids), len(warehouse_ids)), dtype=np.int64)
+        latitudes = np.zeros(len(warehouse_ids))
+        longitudes = np.zeros(len(warehouse_ids))
+        for row in rows:
+            position = warehouse_positions[row.warehouse_id]
+            stock[item_positions[row.item_id], position] = row.quantity
+            latitudes[position] = row.latitude
+            longitudes[position] = row.longitude
+
+        distances = haversine_km(request.latitude, request.longitude, latitudes, longitudes)
+        line_quantities = np.array([line.quantity for line in request.lines], dtype=np.int64)
+        allocation = plan_sourcing(
+            distances,
+            stock,
+            np.array([item_positions[line.item_id] for line in request.lines], dtype=np.int64),
+            line_quantities,
+        )
+
+        shortfalls = line_quantities - allocation.sum(axis=1)
+        lines = []
+        for line, line_allocation, shortfall in zip(
+            request.lines, allocation, shortfalls, strict=True
+        ):
+            positions = np.flatnonzero(line_allocation)
+            positions = positions[np.argsort(distances[positions], kind="stable")]
+            lines.append(
+                SourcingPlanLine(
+                    item_id=line.item_id,
+                    quantity=line.quantity,
+                    shortfall=int(shortfall),
+                    allocations=[
+                        SourcingAllocation(
+                            warehouse_id=warehouse_ids[position],
+                            quantity=int(line_allocation[position]),
+                            distance_km=float(distances[position]),
+                        )
+                        for position in positions
+                    ],
+                )
+            )
+
+        return SourcingPlan(
+            fulfillable=not shortfalls.any(),
+            total_unit_km=float((allocation * distances).sum()),
+            lines=lines,
+        )
+
     async def update(
         self,
         db: AsyncSession,
@@ -58,11 +382,36 @@ class InventoryRepository:
             return None
 
         # Update only the fields that are provided
+        previous_quantity = db_inventory.quantity
         inventory_data = inventory_update.model_dump(exclude_unset=True)
         for key, value in inventory_data.items():
             setattr(db_inventory, key, value)
 
+        await movement_repository.record(
+            db,
+            [
+                {
+                    "warehouse_id": warehouse_id,
+                    "item_id": item_id,
+                    "delta": db_inventory.quantity - previous_quantity,
+                    "kind": "adjusted",
+                }
+            ],
+        )
+        await location_repository.fit_to_inventory(
+            db, LocationStock.warehouse_id == warehouse_id, LocationStock.item_id == item_id
+        )
+
+        await publish_event(
+            db,
+            "inventory",
+            "updated",
+            warehouse_id=warehouse_id,
+            item_id=item_id,
+            quantity=db_inventory.quantity,
+        )
         await db.commit()
+        await cache.invalidate(*inventory_write_tags(warehouse_id, item_id))
         await db.refresh(db_inventory)
         return db_inventory
 
@@ -73,9 +422,68 @@ class InventoryRepository:
             return False
 
         await db.delete(db_inventory)
+        # The stock is gone from its locations too
+        await db.execute(
+            delete(LocationStock).where(
+                LocationStock.warehouse_id == warehouse_id, LocationStock.item_id == item_id
+            )
+        )
+        await movement_repository.record(
+            db,
+            [
+                {
+                    "warehouse_id": warehouse_id,
+                    "item_id": item_id,
+                    "delta": -db_inventory.quantity,
+                    "kind": "deleted",
+                }
+            ],
+        )
+        await publish_event(db, "inventory", "deleted", warehouse_id=warehouse_id, item_id=item_id)
         await db.commit()
+        await cache.invalidate(*inventory_write_tags(warehouse_id, item_id))
         return True
 
+    async def can_receive(
+        self,
+        db: AsyncSession,
+        source_warehouse_id: int,
+        destination_warehouse_id: int,
+        item_id: int,
+        quantity: int,
+    ) -> bool:
+        """
+        Check that the destination warehouse has floor space for a transfer.
+
+        Both warehouses stay locked until the transaction ends, so concurrent transfers
+        cannot both take the last free space. They are locked in ID order, like the
+        ledger trigger updates them, to avoid deadlocks between opposite transfers.
+        Items without a footprint always fit, but a warehouse being purged receives nothing.
+        """
+        result = await db.execute(
+            select(
+                Warehouse.warehouse_id,
+                Warehouse.square_footage,
+                Warehouse.used_footprint,
+                Warehouse.deleting,
+            )
+            .where(Warehouse.warehouse_id.in_([source_warehouse_id, destination_warehouse_id]))
+            .order_by(Warehouse.warehouse_id)
+            .with_for_update()
+        )
+        destination = next(
+            (row for row in result if row.warehouse_id == destination_warehouse_id), None
+        )
+
+        item_result = await db.execute(select(Item.unit_footprint).where(Item.item_id == item_id))
+        unit_footprint = item_result.scalar_one_or_none()
+        if destination is not None and destination.deleting:
+            return False
+        if destination is None or not unit_footprint:
+            return True
+
+        return destination.used_footprint + quantity * unit_footprint <= destination.square_footage
+
     async def transfer(
         self,
         db: AsyncSession,
@@ -93,7 +501,10 @@ class InventoryRepository:
         """
         # Get source inventory
         source_inventory = await self.get_by_ids(db, source_warehouse_id, item_id)
-        if not source_inventory or source_inventory.quantity < quantity:
+        if (
+            not source_inventory
+            or source_inventory.quantity - source_inventory.reserved_quantity < quantity
+        ):
             return None, None
 
         # Get or create destination inventory
@@ -118,7 +529,44 @@ class InventoryRepository:
 
             # Keep the record even if quantity becomes zero
 
+            await movement_repository.record(
+                db,
+                [
+                    {
+                        "warehouse_id": source_warehouse_id,
+                        "item_id": item_id,
+                        "delta": -quantity,
+                        "kind": "transfer_out",
+                    },
+                    {
+                        "warehouse_id": destination_warehouse_id,
+                        "item_id": item_id,
+                        "delta": quantity,
+                        "kind": "transfer_in",
+                    },
+                ],
+            )
+            await location_repository.fit_to_inventory(
+                db,
+                LocationStock.warehouse_id == source_warehouse_id,
+                LocationStock.item_id == item_id,
+            )
+
+            for changed_inventory in (source_inventory, destination_inventory):
+                await publish_event(
+                    db,
+                    "inventory",
+                    "updated",
+                    warehouse_id=changed_inventory.warehouse_id,
+                    item_id=item_id,
+                    quantity=changed_inventory.quantity,
+                )
+
             await db.commit()
+            await cache.invalidate(
+                *inventory_write_tags(source_warehouse_id, item_id),
+                *inventory_write_tags(destination_warehouse_id, item_id),
+            )
             await db.refresh(source_inventory)
 
             # Refresh destination inventory if it exists
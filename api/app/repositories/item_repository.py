@@ -1,15 +1,19 @@
-from sqlalchemy import func, select
+from sqlalchemy import Select, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache, inventory_read_tags
+from app.core.events import publish_event
 from app.models.inventory import Inventory
 from app.models.item import (
     Item,
     ItemCreate,
+    ItemExportRead,
     ItemReadWithInventory,
     ItemUpdate,
     PaginatedItemWithInventoryResponse,
 )
 from app.models.pagination import PageInfo
+from app.repositories.movement_repository import movement_repository
 
 
 class ItemRepository:
@@ -19,33 +23,79 @@ class ItemRepository:
         """Create a new item."""
         db_item = Item.model_validate(item)
         db.add(db_item)
+        await db.flush()
+        await publish_event(db, "item", "created", item_id=db_item.item_id)
         await db.commit()
         await db.refresh(db_item)
         return db_item
 
-    async def get_by_id(self, db: AsyncSession, item_id: int) -> ItemReadWithInventory | None:
-        """Get an item by ID with total inventory information."""
-        # Get the item
-        result = await db.execute(select(Item).where(Item.item_id == item_id))
-        item = result.scalar_one_or_none()
-
-        if not item:
-            return None
+    async def get_by_id(
+        self, db: AsyncSession, item_id: int, version: int | None = None
+    ) -> ItemReadWithInventory | None:
+        """
+        Get an item by ID with total inventory information.
 
-        # Calculate total inventory for this item
-        inventory_result = await db.execute(
-            select(func.sum(Inventory.quantity)).where(Inventory.item_id == item_id)
-        )
-        total_inventory = inventory_result.scalar_one() or 0
+        version is the database version the caller's ETag was built from. It is part of
+        the cache keys, so the item returned is never older than that version.
+        """
+        item = await cache.get("item", (item_id, version))
+        if item is None:
+            tags = [f"item:{item_id}"]
+            versions = await cache.tag_versions("item", tags)
+            result = await db.execute(select(Item).where(Item.item_id == item_id))
+            db_item = result.scalar_one_or_none()
+            if not db_item:
+                return None
+            item = ItemExportRead.model_validate(db_item)
+            await cache.set("item", (item_id, version), item, tags, versions)
 
         # Create the response with total inventory
-        return ItemReadWithInventory(
-            item_id=item.item_id,
-            name=item.name,
-            description=item.description,
-            sku=item.sku,
-            total_inventory=total_inventory,
-        )
+        totals = await self.get_totals(db, [item_id], version)
+        return ItemReadWithInventory(**item.model_dump(), total_inventory=totals[item_id])
+
+    async def get_totals(
+        self, db: AsyncSession, item_ids: list[int], version: int | None = None
+    ) -> dict[int, int]:
+        """
+        Get the total inventory of items across all warehouses.
+
+        Totals are cached per item until the next write to its inventory, keyed by the
+        version the caller's ETag was built from, like get_by_id.
+        """
+        cached = await cache.get_many("item_totals", [(item_id, version) for item_id in item_ids])
+        totals = {item_id: total for (item_id, _), total in cached.items()}
+        missing_ids = [item_id for item_id in item_ids if item_id not in totals]
+        if missing_ids:
+            versions = await cache.tag_versions(
+                "item_totals", ["inventory", *inventory_read_tags(item_ids=missing_ids)]
+            )
+            # Query to get the sum of inventory quantities grouped by item_id
+            result = await db.execute(
+                select(Inventory.item_id, func.sum(Inventory.quantity))
+                .where(Inventory.item_id.in_(missing_ids))
+                .group_by(Inventory.item_id)
+            )
+            loaded = dict.fromkeys(missing_ids, 0) | {item_id: total for item_id, total in result}
+            await cache.set_many(
+                "item_totals",
+                (
+                    (
+                        (item_id, version),
+                        total,
+                        ["inventory", *inventory_read_tags(item_ids=[item_id])],
+                    )
+                    for item_id, total in loaded.items()
+                ),
+                versions,
+            )
+            totals |= loaded
+        return totals
+
+    def export_statement(self) -> Select:
+        """Build a query for all items."""
+        return select(
+            Item.item_id, Item.name, Item.description, Item.sku, Item.unit_footprint
+        ).order_by(Item.item_id)
 
     async def get_items(
         self,
@@ -53,10 +103,11 @@ class ItemRepository:
         search: str | None = None,
         page: int = 1,
         page_size: int = 10,
+        version: int | None = None,
     ) -> PaginatedItemWithInventoryResponse:
         """
         Get items with pagination and total inventory information.
-        If search is provided, filters items by name.
+        If search is provided, filters items by name. version is passed on to get_totals.
         """
         # Build the base query
         query = select(Item)
@@ -78,24 +129,8 @@ class ItemRepository:
         result = await db.execute(query.offset(offset).limit(page_size))
         items = result.scalars().all()
 
-        # Get item IDs for the current page
-        item_ids = [item.item_id for item in items]
-
-        # If we have items, get their total inventory
-        inventory_by_item = {}
-        if item_ids:
-            # Query to get the sum of inventory quantities grouped by item_id
-            inventory_query = (
-                select(
-                    Inventory.item_id,
-                    func.sum(Inventory.quantity).label("total_quantity"),
-                )
-                .where(Inventory.item_id.in_(item_ids))
-                .group_by(Inventory.item_id)
-            )
-
-            inventory_result = await db.execute(inventory_query)
-            inventory_by_item = {item_id: total for item_id, total in inventory_result}
+        # Get the total inventory of the items on the current page
+        inventory_by_item = await self.get_totals(db, [item.item_id for item in items], version)
 
         # Create ItemReadWithInventory objects
         items_with_inventory = [
@@ -104,6 +139,7 @@ class ItemRepository:
                 name=item.name,
                 description=item.description,
                 sku=item.sku,
+                unit_footprint=item.unit_footprint,
                 total_inventory=inventory_by_item.get(item.item_id, 0),
             )
             for item in items
@@ -134,18 +170,28 @@ class ItemRepository:
         for key, value in item_data.items():
             setattr(db_item, key, value)
 
+        await publish_event(db, "item", "updated", item_id=item_id)
         await db.commit()
+        await cache.invalidate(f"item:{item_id}")
         await db.refresh(db_item)
         return db_item
 
     async def delete(self, db: AsyncSession, item_id: int) -> bool:
         """Delete an item."""
-        db_item = await db.execute(select(Item).where(Item.item_id == item_id))
-        db_item = db_item.scalar_one_or_none()
-
-        if not db_item:
+        # Lock the item so no stock of it can be added until it is gone
+        result = await db.execute(
+            select(Item.item_id).where(Item.item_id == item_id).with_for_update()
+        )
+        if result.scalar_one_or_none() is None:
             return False
 
-        await db.delete(db_item)
+        # Delete the stock explicitly so the ledger records it leaving; the foreign key
+        # cascade would remove it without a trace
+        await movement_repository.delete_stock(db, Inventory.item_id == item_id)
+        await db.execute(
+            delete(Item).where(Item.item_id == item_id).execution_options(synchronize_session=False)
+        )
+        await publish_event(db, "item", "deleted", item_id=item_id)
         await db.commit()
+        await cache.invalidate("inventory", f"item:{item_id}")
         return True
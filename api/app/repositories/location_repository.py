@@ -0,0 +1,366 @@
+import numpy as np
+from sqlalchemy import ColumnElement, and_, case, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache
+from app.core.events import publish_event
+from app.core.picking import plan_picks
+from app.models.inventory import Inventory
+from app.models.item import Item
+from app.models.location import (
+    Location,
+    LocationCreate,
+    LocationStock,
+    LocationUpdate,
+    PickList,
+    PickListItem,
+    PickListRequest,
+    PickStop,
+)
+from app.models.warehouse import Warehouse
+from app.repositories.movement_repository import movement_repository
+
+
+class LocationRepository:
+    """Repository for bin locations and the stock stored in them."""
+
+    async def create(self, db: AsyncSession, location: LocationCreate) -> Location | None:
+        """Create a new location. Returns None if the code is taken in its warehouse."""
+        # Inserted in one statement, so concurrent creates with the same code cannot both
+        # pass a check for it
+        result = await db.execute(
+            insert(Location)
+            .values(**location.model_dump())
+            .on_conflict_do_nothing(index_elements=[Location.warehouse_id, Location.code])
+            .returning(Location)
+        )
+        db_location = result.scalar_one_or_none()
+        if db_location is None:
+            await db.rollback()
+            return None
+
+        await db.commit()
+        await db.refresh(db_location)
+        return db_location
+
+    async def get_by_id(self, db: AsyncSession, location_id: int) -> Location | None:
+        """Get a location by ID."""
+        result = await db.execute(select(Location).where(Location.location_id == location_id))
+        return result.scalar_one_or_none()
+
+    async def get_by_warehouse(self, db: AsyncSession, warehouse_id: int) -> list[Location]:
+        """Get all locations of a warehouse in walking order."""
+        result = await db.execute(
+            select(Location)
+            .where(Location.warehouse_id == warehouse_id)
+            .order_by(Location.pick_sequence, Location.location_id)
+        )
+        return result.scalars().all()
+
+    async def update(
+        self, db: AsyncSession, location_id: int, location_update: LocationUpdate
+    ) -> Location | None:
+        """Update a location."""
+        db_location = await self.get_by_id(db, location_id)
+        if not db_location:
+            return None
+
+        # Update only the fields that are provided
+        location_data = location_update.model_dump(exclude_unset=True)
+        for key, value in location_data.items():
+            setattr(db_location, key, value)
+
+        await db.commit()
+        await db.refresh(db_location)
+        return db_location
+
+    async def delete(self, db: AsyncSession, location_id: int) -> bool:
+        """Delete a location, removing its stock from the warehouse's inventory."""
+        db_location = await self.get_by_id(db, location_id)
+        if not db_location:
+            return False
+
+        stock_result = await db.execute(
+            delete(LocationStock)
+            .where(LocationStock.location_id == location_id)
+            .returning(LocationStock.item_id, LocationStock.quantity)
+        )
+        await self._roll_up(
+            db,
+            db_location.warehouse_id,
+            {item_id: -quantity for item_id, quantity in stock_result},
+        )
+
+        await db.delete(db_location)
+        await db.commit()
+        await cache.invalidate("inventory")
+        return True
+
+    async def get_stock(self, db: AsyncSession, location_id: int) -> list[LocationStock]:
+        """Get the stock stored in a location."""
+        result = await db.execute(
+            select(LocationStock)
+            .where(LocationStock.location_id == location_id)
+            .order_by(LocationStock.item_id)
+        )
+        return result.scalars().all()
+
+    async def set_stock(
+        self, db: AsyncSession, location_id: int, item_id: int, quantity: int
+    ) -> tuple[Location | None, LocationStock | None]:
+        """
+        Set the quantity of an item in a location.
+
+        The change is applied to the warehouse's inventory total as well. Returns a tuple
+        of (location, stock). Nothing is changed, and stock is None, if the warehouse
+        cannot receive the stock added.
+        """
+        db_location = await self.get_by_id(db, location_id)
+        if not db_location:
+            return None, None
+
+        result = await db.execute(
+            select(LocationStock)
+            .where(LocationStock.location_id == location_id, LocationStock.item_id == item_id)
+            .with_for_update()
+        )
+        db_stock = result.scalar_one_or_none()
+        if db_stock is None:
+            db_stock = LocationStock(
+                location_id=location_id,
+                item_id=item_id,
+                warehouse_id=db_location.warehouse_id,
+                quantity=0,
+            )
+            db.add(db_stock)
+
+        delta = quantity - db_stock.quantity
+        db_stock.quantity = quantity
+        if not await self._roll_up(db, db_location.warehouse_id, {item_id: delta}):
+            await db.rollback()
+            return db_location, None
+
+        await db.commit()
+        await cache.invalidate("inventory")
+        await db.refresh(db_stock)
+        return db_location, db_stock
+
+    async def fit_to_inventory(self, db: AsyncSession, *criteria: ColumnElement[bool]) -> None:
+        """
+        Lower the location stock matching criteria to at most its inventory total.
+
+        Called wherever stock leaves the inventory without naming a location. It is taken
+        from the slots earliest on the pick path, as a picker would take it, in a single
+        statement for all matching slots.
+        """
+        await db.flush()
+        partition = (LocationStock.warehouse_id, LocationStock.item_id)
+        slots = (
+            select(
+                LocationStock.location_id,
+                LocationStock.item_id,
+                # Stock of the same item in slots earlier on the path
+                (
+                    func.sum(LocationStock.quantity).over(
+                        partition_by=partition,
+                        order_by=(Location.pick_sequence, Location.location_id),
+                    )
+                    - LocationStock.quantity
+                ).label("earlier"),
+                (
+                    func.sum(LocationStock.quantity).over(partition_by=partition)
+                    - func.coalesce(Inventory.quantity, 0)
+                ).label("excess"),
+            )
+            .join(Location, Location.location_id == LocationStock.location_id)
+            .outerjoin(
+                Inventory,
+                and_(
+                    Inventory.warehouse_id == LocationStock.warehouse_id,
+                    Inventory.item_id == LocationStock.item_id,
+                ),
+            )
+            .where(*criteria)
+            .subquery()
+        )
+        await db.execute(
+            update(LocationStock)
+            .where(
+                LocationStock.location_id == slots.c.location_id,
+                LocationStock.item_id == slots.c.item_id,
+                slots.c.excess > slots.c.earlier,
+            )
+            .values(
+                quantity=func.greatest(
+                    LocationStock.quantity - (slots.c.excess - slots.c.earlier), 0
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _roll_up(self, db: AsyncSession, warehouse_id: int, deltas: dict[int, int]) -> bool:
+        """
+        Apply location stock changes to the warehouse's inventory and the ledger.
+
+        Inventory may not drop below its reserved quantity, nor below zero; the database
+        rejects such changes with a constraint violation. Returns False, applying nothing,
+        if stock is added to a warehouse being purged or without the floor space for it.
+        """
+        deltas = {item_id: delta for item_id, delta in deltas.items() if delta}
+        if not deltas:
+            return True
+
+        if any(delta > 0 for delta in deltas.values()):
+            # Locked until the transaction ends, like transfers lock their destination
+            warehouse_result = await db.execute(
+                select(Warehouse.square_footage, Warehouse.used_footprint, Warehouse.deleting)
+                .where(Warehouse.warehouse_id == warehouse_id)
+                .with_for_update()
+            )
+            warehouse = warehouse_result.one()
+            footprint_result = await db.execute(
+                select(Item.item_id, Item.unit_footprint).where(Item.item_id.in_(deltas))
+            )
+            footprint = sum(
+                deltas[item_id] * (unit_footprint or 0)
+                for item_id, unit_footprint in footprint_result
+            )
+            if warehouse.deleting or (
+                footprint > 0 and warehouse.used_footprint + footprint > warehouse.square_footage
+            ):
+                return False
+
+        await db.flush()
+        quantities = []
+        # Stock leaving a location is in the inventory already. It is subtracted by an
+        # update, as the checks on an upsert's proposed row would reject a negative one.
+        decreases = {item_id: delta for item_id, delta in deltas.items() if delta < 0}
+        if decreases:
+            result = await db.execute(
+                update(Inventory)
+                .where(Inventory.warehouse_id == warehouse_id, Inventory.item_id.in_(decreases))
+                .values(quantity=Inventory.quantity + case(decreases, value=Inventory.item_id))
+                .returning(Inventory.item_id, Inventory.quantity)
+                .execution_options(synchronize_session=False)
+            )
+            quantities += result.all()
+        increases = {item_id: delta for item_id, delta in deltas.items() if delta > 0}
+        if increases:
+            statement = insert(Inventory).values(
+                [
+                    {"warehouse_id": warehouse_id, "item_id": item_id, "quantity": delta}
+                    for item_id, delta in increases.items()
+                ]
+            )
+            result = await db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[Inventory.warehouse_id, Inventory.item_id],
+                    set_={"quantity": Inventory.quantity + statement.excluded.quantity},
+                ).returning(Inventory.item_id, Inventory.quantity)
+            )
+            quantities += result.all()
+
+        await movement_repository.record(
+            db,
+            [
+                {
+                    "warehouse_id": warehouse_id,
+                    "item_id": item_id,
+                    "delta": delta,
+                    "kind": "adjusted",
+                }
+                for item_id, delta in deltas.items()
+            ],
+        )
+        for item_id, quantity in quantities:
+            await publish_event(
+                db,
+                "inventory",
+                "updated",
+                warehouse_id=warehouse_id,
+                item_id=item_id,
+                quantity=quantity,
+            )
+        return True
+
+    async def get_pick_list(self, db: AsyncSession, request: PickListRequest) -> PickList:
+        """
+        Plan where to pick an order in a warehouse, with stops in walking order.
+
+        Slots holding the requested items are read in one indexed query already sorted by
+        item and pick sequence, then all items are planned at once. Slots are only
+        offered up to the item's inventory total, taken from the start of the path.
+        """
+        demand_by_item: dict[int, int] = {}
+        for line in request.lines:
+            demand_by_item[line.item_id] = demand_by_item.get(line.item_id, 0) + line.quantity
+        item_ids = sorted(demand_by_item)
+
+        earlier = (
+            func.sum(LocationStock.quantity).over(
+                partition_by=LocationStock.item_id,
+                order_by=(Location.pick_sequence, Location.location_id),
+            )
+            - LocationStock.quantity
+        )
+        result = await db.execute(
+            select(
+                LocationStock.item_id,
+                func.least(
+                    LocationStock.quantity,
+                    func.greatest(func.coalesce(Inventory.quantity, 0) - earlier, 0),
+                ).label("quantity"),
+                Location.location_id,
+                Location.code,
+                Location.pick_sequence,
+            )
+            .join(Location, Location.location_id == LocationStock.location_id)
+            .outerjoin(
+                Inventory,
+                and_(
+                    Inventory.warehouse_id == LocationStock.warehouse_id,
+                    Inventory.item_id == LocationStock.item_id,
+                ),
+            )
+            .where(
+                LocationStock.warehouse_id == request.warehouse_id,
+                LocationStock.item_id.in_(item_ids),
+                LocationStock.quantity > 0,
+            )
+            .order_by(LocationStock.item_id, Location.pick_sequence, Location.location_id)
+        )
+        slots = result.all()
+
+        item_positions = {item_id: i for i, item_id in enumerate(item_ids)}
+        demands = np.array([demand_by_item[item_id] for item_id in item_ids], dtype=np.int64)
+        slot_items = np.array([item_positions[slot.item_id] for slot in slots], dtype=np.int64)
+        picks = plan_picks(
+            slot_items, np.array([slot.quantity for slot in slots], dtype=np.int64), demands
+        )
+
+        # Visit the chosen slots along the pick path
+        positions = np.flatnonzero(picks)
+        sequences = np.array([slots[position].pick_sequence for position in positions])
+        positions = positions[np.argsort(sequences, kind="stable")]
+        stops = [
+            PickStop(
+                location_id=slots[position].location_id,
+                code=slots[position].code,
+                pick_sequence=slots[position].pick_sequence,
+                item_id=slots[position].item_id,
+                quantity=int(picks[position]),
+            )
+            for position in positions
+        ]
+
+        picked = np.bincount(slot_items, weights=picks, minlength=len(item_ids))
+        shortfalls = demands - picked.astype(np.int64)
+        items = [
+            PickListItem(item_id=item_id, quantity=int(demand), shortfall=int(shortfall))
+            for item_id, demand, shortfall in zip(item_ids, demands, shortfalls, strict=True)
+        ]
+        return PickList(complete=not shortfalls.any(), stops=stops, items=items)
+
+
+location_repository = LocationRepository()
@@ -0,0 +1,314 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Select,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import get_db_session_context
+from app.models.inventory import Inventory, InventoryRead
+from app.models.movement import (
+    InventoryHistory,
+    InventoryMovement,
+    InventorySnapshot,
+    InventorySnapshotLine,
+)
+
+logger = logging.getLogger(__name__)
+
+# Snapshots are taken one at a time. Two-key advisory locks are used, as single bigint
+# keys are reserved for the change sequence floor.
+SNAPSHOT_LOCK = (29, 1)
+SNAPSHOT_POLL_SECONDS = 0.1
+
+
+class MovementRepository:
+    """Repository for the inventory movement ledger and its snapshots."""
+
+    def __init__(self) -> None:
+        self._last_snapshot_movement_id: int | None = None
+        self._snapshot_task: asyncio.Task | None = None
+
+    async def record(self, db: AsyncSession, movements: list[dict]) -> None:
+        """
+        Append movements to the ledger as part of the caller's transaction.
+
+        Each movement is a dict with warehouse_id, item_id, delta and kind. Pending
+        inventory changes are flushed first, so ledger entries are always allocated after
+        the inventory rows they describe are locked. Schedules a snapshot once enough
+        movements have accumulated since the last one.
+        """
+        movements = [movement for movement in movements if movement["delta"]]
+        if not movements:
+            return
+
+        await db.flush()
+        result = await db.execute(
+            insert(InventoryMovement).returning(InventoryMovement.movement_id), movements
+        )
+        await self._schedule_snapshot(db, max(result.scalars().all()))
+
+    async def record_from_select(
+        self, db: AsyncSession, movements: Select | CompoundSelect
+    ) -> None:
+        """
+        Append movements produced by a query as part of the caller's transaction.
+
+        The query must return warehouse_id, item_id, delta and kind columns. Used by
+        bulk operations so large batches are copied inside Postgres.
+        """
+        await db.flush()
+        await db.execute(
+            insert(InventoryMovement).from_select(
+                ["warehouse_id", "item_id", "delta", "kind"], movements
+            )
+        )
+        result = await db.execute(select(func.max(InventoryMovement.movement_id)))
+        last_movement_id = result.scalar_one()
+        if last_movement_id is not None:
+            await self._schedule_snapshot(db, last_movement_id)
+
+    async def delete_stock(
+        self, db: AsyncSession, *criteria: ColumnElement[bool], limit: int | None = None
+    ) -> int:
+        """
+        Delete the inventory rows matching criteria and record their stock leaving.
+
+        Rows are deleted and copied into the ledger by a single statement, so no stock
+        passes through Python. With limit, at most that many rows are deleted. Returns
+        the number of deleted rows.
+        """
+        await db.flush()
+        condition = criteria
+        if limit is not None:
+            chunk = select(Inventory.warehouse_id, Inventory.item_id).where(*criteria).limit(limit)
+            condition = (tuple_(Inventory.warehouse_id, Inventory.item_id).in_(chunk),)
+
+        removed = (
+            delete(Inventory)
+            .where(*condition)
+            .returning(Inventory.warehouse_id, Inventory.item_id, Inventory.quantity)
+            .cte("removed_stock")
+        )
+        recorded = (
+            insert(InventoryMovement)
+            .from_select(
+                ["warehouse_id", "item_id", "delta", "kind"],
+                select(
+                    removed.c.warehouse_id,
+                    removed.c.item_id,
+                    -removed.c.quantity,
+                    literal("deleted"),
+                ).where(removed.c.quantity != 0),
+            )
+            .returning(InventoryMovement.movement_id)
+            .cte("recorded_movements")
+        )
+        result = await db.execute(
+            select(
+                select(func.count()).select_from(removed).scalar_subquery(),
+                select(func.max(recorded.c.movement_id)).scalar_subquery(),
+            )
+        )
+        removed_count, last_movement_id = result.one()
+        if last_movement_id is not None:
+            await self._schedule_snapshot(db, last_movement_id)
+        return removed_count
+
+    async def _schedule_snapshot(self, db: AsyncSession, last_movement_id: int) -> None:
+        if self._last_snapshot_movement_id is None:
+            snapshot_result = await db.execute(
+                select(func.coalesce(func.max(InventorySnapshot.last_movement_id), 0))
+            )
+            self._last_snapshot_movement_id = snapshot_result.scalar_one()
+
+        if (
+            last_movement_id - self._last_snapshot_movement_id
+            >= settings.INVENTORY_SNAPSHOT_INTERVAL
+            and (self._snapshot_task is None or self._snapshot_task.done())
+        ):
+            # The snapshot waits for this transaction to finish before copying
+            self._snapshot_task = asyncio.create_task(self._take_snapshot_in_background())
+
+    async def take_snapshot(self, db: AsyncSession) -> int | None:
+        """
+        Add the ledger since the latest snapshot onto a copy of it and return the copy's ID.
+
+        The snapshot covers the ledger up to its last entry when it starts. Inventory is
+        not read, so writers are never blocked: the transactions that may still commit
+        entries up to that point are waited for instead. Returns None if another worker
+        is taking a snapshot, or took one within the last INVENTORY_SNAPSHOT_INTERVAL
+        movements.
+        """
+        lock_result = await db.execute(select(func.pg_try_advisory_xact_lock(*SNAPSHOT_LOCK)))
+        if not lock_result.scalar_one():
+            await db.rollback()
+            return None
+
+        # Entries are numbered when written but become visible at commit, so every
+        # transaction running now may still commit one up to the last number drawn
+        movement_result = await db.execute(
+            text(
+                "SELECT coalesce(pg_sequence_last_value("
+                "pg_get_serial_sequence('inventory_movements', 'movement_id')::regclass), 0)"
+            )
+        )
+        last_movement_id = movement_result.scalar_one()
+        previous_result = await db.execute(
+            select(InventorySnapshot.snapshot_id, InventorySnapshot.last_movement_id)
+            .order_by(InventorySnapshot.last_movement_id.desc())
+            .limit(1)
+        )
+        previous = previous_result.one_or_none()
+        previous_snapshot_id = previous.snapshot_id if previous else None
+        self._last_snapshot_movement_id = previous.last_movement_id if previous else 0
+        if (
+            last_movement_id - self._last_snapshot_movement_id
+            < settings.INVENTORY_SNAPSHOT_INTERVAL
+        ):
+            await db.rollback()
+            return None
+        await self._wait_for_running_transactions(db)
+
+        combined = union_all(
+            select(
+                InventorySnapshotLine.warehouse_id,
+                InventorySnapshotLine.item_id,
+                InventorySnapshotLine.quantity,
+            ).where(InventorySnapshotLine.snapshot_id == previous_snapshot_id),
+            select(
+                InventoryMovement.warehouse_id,
+                InventoryMovement.item_id,
+                InventoryMovement.delta.label("quantity"),
+            ).where(
+                InventoryMovement.movement_id > self._last_snapshot_movement_id,
+                InventoryMovement.movement_id <= last_movement_id,
+            ),
+        ).subquery()
+        quantity = func.sum(combined.c.quantity)
+
+        # Timestamp the snapshot once all included entries have committed
+        result = await db.execute(
+            insert(InventorySnapshot)
+            .values(taken_at=func.clock_timestamp(), last_movement_id=last_movement_id)
+            .returning(InventorySnapshot.snapshot_id)
+        )
+        snapshot_id = result.scalar_one()
+        await db.execute(
+            insert(InventorySnapshotLine).from_select(
+                ["snapshot_id", "warehouse_id", "item_id", "quantity"],
+                select(literal(snapshot_id), combined.c.warehouse_id, combined.c.item_id, quantity)
+                .group_by(combined.c.warehouse_id, combined.c.item_id)
+                .having(quantity != 0),
+            )
+        )
+        await db.commit()
+
+        self._last_snapshot_movement_id = last_movement_id
+        return snapshot_id
+
+    async def _wait_for_running_transactions(self, db: AsyncSession) -> None:
+        # Every transaction holds a lock on its virtual ID until it ends
+        running_result = await db.execute(
+            text(
+                "SELECT l.virtualxid FROM pg_locks l JOIN pg_stat_activity a ON a.pid = l.pid "
+                "WHERE l.locktype = 'virtualxid' AND l.granted "
+                "AND a.datname = current_database() AND l.pid <> pg_backend_pid()"
+            )
+        )
+        running = list(running_result.scalars())
+        while running:
+            await asyncio.sleep(SNAPSHOT_POLL_SECONDS)
+            running_result = await db.execute(
+                text(
+                    "SELECT virtualxid FROM pg_locks "
+                    "WHERE locktype = 'virtualxid' AND virtualxid = ANY(:running)"
+                ),
+                {"running": running},
+            )
+            running = list(running_result.scalars())
+
+    async def _take_snapshot_in_background(self) -> None:
+        try:
+            async with get_db_session_context() as db:
+                await self.take_snapshot(db)
+        except Exception:
+            logger.exception("Failed to take inventory snapshot")
+
+    async def get_history(
+        self,
+        db: AsyncSession,
+        at: datetime,
+        warehouse_id: int | None = None,
+        item_id: int | None = None,
+    ) -> InventoryHistory | None:
+        """
+        Rebuild inventory quantities as they were at a point in time.
+
+        Starts from the nearest snapshot taken at or before `at` and adds the ledger
+        entries recorded after it, so at most INVENTORY_SNAPSHOT_INTERVAL movements are
+        replayed. Returns None if `at` predates the first snapshot.
+        """
+        snapshot_result = await db.execute(
+            select(InventorySnapshot)
+            .where(InventorySnapshot.taken_at <= at)
+            .order_by(InventorySnapshot.taken_at.desc())
+            .limit(1)
+        )
+        snapshot = snapshot_result.scalar_one_or_none()
+        if snapshot is None:
+            return None
+
+        lines = select(
+            InventorySnapshotLine.warehouse_id,
+            InventorySnapshotLine.item_id,
+            InventorySnapshotLine.quantity,
+        ).where(InventorySnapshotLine.snapshot_id == snapshot.snapshot_id)
+        tail = select(
+            InventoryMovement.warehouse_id,
+            InventoryMovement.item_id,
+            InventoryMovement.delta.label("quantity"),
+        ).where(
+            InventoryMovement.movement_id > snapshot.last_movement_id,
+            InventoryMovement.created_at <= at,
+        )
+        if warehouse_id is not None:
+            lines = lines.where(InventorySnapshotLine.warehouse_id == warehouse_id)
+            tail = tail.where(InventoryMovement.warehouse_id == warehouse_id)
+        if item_id is not None:
+            lines = lines.where(InventorySnapshotLine.item_id == item_id)
+            tail = tail.where(InventoryMovement.item_id == item_id)
+
+        combined = union_all(lines, tail).subquery()
+        quantity = func.sum(combined.c.quantity)
+        result = await db.execute(
+            select(combined.c.warehouse_id, combined.c.item_id, quantity)
+            .group_by(combined.c.warehouse_id, combined.c.item_id)
+            .having(quantity != 0)
+            .order_by(combined.c.warehouse_id, combined.c.item_id)
+        )
+
+        return InventoryHistory(
+            at=at,
+            snapshot_taken_at=snapshot.taken_at,
+            records=[
+                InventoryRead(warehouse_id=row_warehouse_id, item_id=row_item_id, quantity=total)
+                for row_warehouse_id, row_item_id, total in result
+            ],
+        )
+
+
+movement_repository = MovementRepository()
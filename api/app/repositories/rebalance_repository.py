@@ -0,0 +1,396 @@
+import asyncio
+import logging
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import (
+    ARRAY,
+    Float,
+    Integer,
+    bindparam,
+    func,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache
+from app.core.db import get_db_session_context
+from app.core.events import publish_event
+from app.core.geo import haversine_km
+from app.core.rebalancing import plan_rebalance, rebalance_targets
+from app.models.inventory import Inventory
+from app.models.item import Item
+from app.models.location import LocationStock
+from app.models.pagination import PageInfo
+from app.models.rebalance import (
+    PaginatedRebalanceTransferResponse,
+    RebalancePlan,
+    RebalanceRequest,
+    RebalanceTransfer,
+    RebalanceTransferRead,
+)
+from app.models.warehouse import Warehouse
+from app.repositories.location_repository import location_repository
+from app.repositories.movement_repository import movement_repository
+
+logger = logging.getLogger(__name__)
+
+# Keep references to running plans so they are not garbage collected
+_running_plans: set[asyncio.Task] = set()
+
+
+class RebalanceRepository:
+    """Repository for stock rebalancing plans."""
+
+    async def create_plan(self, db: AsyncSession, request: RebalanceRequest) -> RebalancePlan:
+        """Create a rebalancing plan and start computing it in the background."""
+        db_plan = RebalancePlan.model_validate(request)
+        db.add(db_plan)
+        await db.commit()
+        await db.refresh(db_plan)
+
+        task = asyncio.create_task(self._compute_plan(db_plan.plan_id))
+        _running_plans.add(task)
+        task.add_done_callback(_running_plans.discard)
+        return db_plan
+
+    async def get_plan(self, db: AsyncSession, plan_id: int) -> RebalancePlan | None:
+        """Get a rebalancing plan by ID."""
+        result = await db.execute(select(RebalancePlan).where(RebalancePlan.plan_id == plan_id))
+        return result.scalar_one_or_none()
+
+    async def get_transfers(
+        self, db: AsyncSession, plan_id: int, page: int = 1, page_size: int = 100
+    ) -> PaginatedRebalanceTransferResponse:
+        """Get the transfers of a rebalancing plan with pagination, longest first."""
+        count_result = await db.execute(
+            select(func.count())
+            .select_from(RebalanceTransfer)
+            .where(RebalanceTransfer.plan_id == plan_id)
+        )
+        total_items = count_result.scalar_one()
+
+        result = await db.execute(
+            select(RebalanceTransfer)
+            .where(RebalanceTransfer.plan_id == plan_id)
+            .order_by(
+                RebalanceTransfer.distance_km.desc(),
+                RebalanceTransfer.source_warehouse_id,
+                RebalanceTransfer.destination_warehouse_id,
+                RebalanceTransfer.item_id,
+            )
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        transfers = [
+            RebalanceTransferRead.model_validate(transfer) for transfer in result.scalars()
+        ]
+
+        total_pages = (total_items + page_size - 1) // page_size if total_items > 0 else 1
+        page_info = PageInfo(
+            total_items=total_items,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next_page=page < total_pages,
+        )
+        return PaginatedRebalanceTransferResponse(items=transfers, page_info=page_info)
+
+    async def apply_plan(self, db: AsyncSession, plan_id: int) -> tuple[RebalancePlan | None, bool]:
+        """
+        Apply all transfers of a ready plan in one transaction.
+
+        Sources are decremented and destinations upserted with one statement each, and
+        the ledger entries are copied from the plan inside Postgres. Returns a tuple of
+        (plan, applied). Nothing is applied if the plan is not ready. If any source no
+        longer has the unreserved stock the plan expects to take from it, or any destination no
+        longer has the floor space for what it receives, the plan is marked stale
+        instead.
+        """
+        result = await db.execute(
+            select(RebalancePlan).where(RebalancePlan.plan_id == plan_id).with_for_update()
+        )
+        db_plan = result.scalar_one_or_none()
+        if db_plan is None or db_plan.status != "ready":
+            return db_plan, False
+
+        outgoing = (
+            select(
+                RebalanceTransfer.source_warehouse_id.label("warehouse_id"),
+                RebalanceTransfer.item_id,
+                func.sum(RebalanceTransfer.quantity).label("quantity"),
+            )
+            .where(RebalanceTransfer.plan_id == plan_id)
+            .group_by(RebalanceTransfer.source_warehouse_id, RebalanceTransfer.item_id)
+            .subquery()
+        )
+        incoming = (
+            select(
+                RebalanceTransfer.destination_warehouse_id.label("warehouse_id"),
+                RebalanceTransfer.item_id,
+                func.sum(RebalanceTransfer.quantity).label("quantity"),
+            )
+            .where(RebalanceTransfer.plan_id == plan_id)
+            .group_by(RebalanceTransfer.destination_warehouse_id, RebalanceTransfer.item_id)
+        )
+
+        # Lock the warehouses in ID order, like transfers and the ledger trigger do, and
+        # check each has room for the footprint it gains
+        moves = union_all(
+            select(
+                RebalanceTransfer.destination_warehouse_id.label("warehouse_id"),
+                RebalanceTransfer.item_id,
+                RebalanceTransfer.quantity.label("delta"),
+            ).where(RebalanceTransfer.plan_id == plan_id),
+            select(
+                RebalanceTransfer.source_warehouse_id,
+                RebalanceTransfer.item_id,
+                -RebalanceTransfer.quantity,
+            ).where(RebalanceTransfer.plan_id == plan_id),
+        ).subquery()
+        changes = (
+            select(
+                moves.c.warehouse_id,
+                func.sum(moves.c.delta * func.coalesce(Item.unit_footprint, 0)).label("footprint"),
+                func.max(moves.c.delta).label("largest_delta"),
+            )
+            .join(Item, Item.item_id == moves.c.item_id)
+            .group_by(moves.c.warehouse_id)
+            .subquery()
+        )
+        warehouse_result = await db.execute(
+            select(
+                Warehouse.warehouse_id,
+                Warehouse.square_footage,
+                Warehouse.used_footprint,
+                Warehouse.deleting,
+                changes.c.footprint,
+                changes.c.largest_delta,
+            )
+            .join(changes, changes.c.warehouse_id == Warehouse.warehouse_id)
+            .order_by(Warehouse.warehouse_id)
+            .with_for_update(of=Warehouse)
+        )
+        for row in warehouse_result:
+            if row.largest_delta > 0 and row.deleting:
+                return await self._mark_stale(
+                    db, plan_id, f"Warehouse {row.warehouse_id} is being deleted"
+                )
+            if row.footprint > 0 and row.used_footprint + row.footprint > row.square_footage:
+                return await self._mark_stale(
+                    db, plan_id, f"Warehouse {row.warehouse_id} lacks the floor space"
+                )
+
+        count_result = await db.execute(select(func.count()).select_from(outgoing))
+        expected_sources = count_result.scalar_one()
+
+        # Take stock from the sources, skipping any that no longer have enough unreserved
+        source_result = await db.execute(
+            update(Inventory)
+            .where(
+                Inventory.warehouse_id == outgoing.c.warehouse_id,
+                Inventory.item_id == outgoing.c.item_id,
+                Inventory.quantity - Inventory.reserved_quantity >= outgoing.c.quantity,
+            )
+            .values(quantity=Inventory.quantity - outgoing.c.quantity)
+            .execution_options(synchronize_session=False)
+        )
+        if source_result.rowcount != expected_sources:
+            # The plan was computed from stock that has since changed
+            return await self._mark_stale(db, plan_id)
+        await location_repository.fit_to_inventory(
+            db,
+            tuple_(LocationStock.warehouse_id, LocationStock.item_id).in_(
+                select(outgoing.c.warehouse_id, outgoing.c.item_id)
+            ),
+        )
+
+        # Add stock to the destinations, creating records where needed
+        upsert = insert(Inventory).from_select(["warehouse_id", "item_id", "quantity"], incoming)
+        await db.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[Inventory.warehouse_id, Inventory.item_id],
+                set_={"quantity": Inventory.quantity + upsert.excluded.quantity},
+            )
+        )
+
+        transfers = select(RebalanceTransfer).where(RebalanceTransfer.plan_id == plan_id).subquery()
+        await movement_repository.record_from_select(
+            db,
+            union_all(
+                select(
+                    transfers.c.source_warehouse_id,
+                    transfers.c.item_id,
+                    -transfers.c.quantity,
+                    literal("rebalance_out"),
+                ),
+                select(
+                    transfers.c.destination_warehouse_id,
+                    transfers.c.item_id,
+                    transfers.c.quantity,
+                    literal("rebalance_in"),
+                ),
+            ),
+        )
+
+        db_plan.status = "applied"
+        db_plan.applied_at = datetime.now()
+        # One event for the whole batch; subscribers refetch instead of replaying it
+        await publish_event(db, "inventory", "rebalanced", plan_id=plan_id)
+        await db.commit()
+        await cache.invalidate("inventory")
+        await db.refresh(db_plan)
+        return db_plan, True
+
+    async def _mark_stale(
+        self, db: AsyncSession, plan_id: int, error: str | None = None
+    ) -> tuple[RebalancePlan, bool]:
+        """Roll back a partly applied plan and mark it stale."""
+        await db.rollback()
+        db_plan = await self.get_plan(db, plan_id)
+        db_plan.status = "stale"
+        db_plan.error = error
+        await db.commit()
+        await db.refresh(db_plan)
+        return db_plan, False
+
+    async def _compute_plan(self, plan_id: int) -> None:
+        """Compute a plan's transfers from the whole inventory and store them."""
+        try:
+            async with get_db_session_context() as db:
+                db_plan = await self.get_plan(db, plan_id)
+
+                warehouse_result = await db.execute(
+                    select(
+                        Warehouse.warehouse_id,
+                        Warehouse.latitude,
+                        Warehouse.longitude,
+                        Warehouse.square_footage,
+                    )
+                    .where(Warehouse.deleting.is_(False))
+                    .order_by(Warehouse.warehouse_id)
+                )
+                warehouses = warehouse_result.all()
+
+                # Aggregate into arrays so a million rows arrive as three values. Only
+                # unreserved stock can move; stock in warehouses being purged is left out
+                # with them
+                inventory_result = await db.execute(
+                    select(
+                        func.array_agg(Inventory.warehouse_id),
+                        func.array_agg(Inventory.item_id),
+                        func.array_agg(Inventory.quantity - Inventory.reserved_quantity),
+                    )
+                    .join(Warehouse, Warehouse.warehouse_id == Inventory.warehouse_id)
+                    .where(Warehouse.deleting.is_(False))
+                )
+                warehouse_ids, item_ids, quantities = inventory_result.one()
+
+                # Keep the event loop free while the matrix is solved
+                sources, destinations, items, moved, distances = await asyncio.to_thread(
+                    self._solve,
+                    db_plan.strategy,
+                    db_plan.tolerance,
+                    warehouses,
+                    warehouse_ids or [],
+                    item_ids or [],
+                    quantities or [],
+                )
+
+                if len(moved):
+                    batch = (
+                        func.unnest(
+                            bindparam("sources", sources.tolist(), type_=ARRAY(Integer)),
+                            bindparam("destinations", destinations.tolist(), type_=ARRAY(Integer)),
+                            bindparam("items", items.tolist(), type_=ARRAY(Integer)),
+                            bindparam("quantities", moved.tolist(), type_=ARRAY(Integer)),
+                            bindparam("distances", distances.tolist(), type_=ARRAY(Float)),
+                        )
+                        .table_valued("source", "destination", "item", "quantity", "distance_km")
+                        .render_derived(name="batch")
+                    )
+                    await db.execute(
+                        insert(RebalanceTransfer).from_select(
+                            [
+                                "plan_id",
+                                "source_warehouse_id",
+                                "destination_warehouse_id",
+                                "item_id",
+                                "quantity",
+                                "distance_km",
+                            ],
+                            select(
+                                literal(plan_id),
+                                batch.c.source,
+                                batch.c.destination,
+                                batch.c.item,
+                                batch.c.quantity,
+                                batch.c.distance_km,
+                            ),
+                        )
+                    )
+
+                db_plan.status = "ready"
+                db_plan.finished_at = datetime.now()
+                db_plan.transfer_count = len(moved)
+                db_plan.units_moved = int(moved.sum())
+                db_plan.unit_km = float((moved * distances).sum())
+        except Exception as e:
+            logger.exception("Failed to compute rebalancing plan %s", plan_id)
+            async with get_db_session_context() as db:
+                db_plan = await self.get_plan(db, plan_id)
+                db_plan.status = "failed"
+                db_plan.finished_at = datetime.now()
+                db_plan.error = str(e)
+
+    @staticmethod
+    def _solve(
+        strategy: str,
+        tolerance: float,
+        warehouses: list,
+        warehouse_ids: list[int],
+        item_ids: list[int],
+        quantities: list[int],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build the warehouse × item stock matrix and plan transfers over it.
+
+        Returns (source_warehouse_id, destination_warehouse_id, item_id, quantity,
+        distance_km) arrays with one entry per transfer.
+        """
+        if not warehouses or not item_ids:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty, empty, np.empty(0)
+
+        all_warehouse_ids = np.array([row.warehouse_id for row in warehouses], dtype=np.int64)
+        latitudes = np.array([float(row.latitude) for row in warehouses])
+        longitudes = np.array([float(row.longitude) for row in warehouses])
+        weights = np.ones(len(warehouses))
+        if strategy == "capacity":
+            square_footage = np.array([row.square_footage for row in warehouses], dtype=float)
+            if square_footage.sum() > 0:
+                weights = square_footage
+
+        # Warehouses are sorted by ID, so positions can be found by binary search
+        unique_item_ids, item_positions = np.unique(np.array(item_ids), return_inverse=True)
+        warehouse_positions = np.searchsorted(all_warehouse_ids, np.array(warehouse_ids))
+        stock = np.zeros((len(all_warehouse_ids), len(unique_item_ids)), dtype=np.int64)
+        stock[warehouse_positions, item_positions] = quantities
+
+        distances = haversine_km(
+            latitudes[:, None], longitudes[:, None], latitudes[None, :], longitudes[None, :]
+        )
+        targets = rebalance_targets(stock, weights)
+        sources, destinations, items, moved = plan_rebalance(stock, targets, distances, tolerance)
+        return (
+            all_warehouse_ids[sources],
+            all_warehouse_ids[destinations],
+            unique_item_ids[items],
+            moved,
+            distances[sources, destinations],
+        )
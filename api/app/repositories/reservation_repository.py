@@ -0,0 +1,248 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy import delete, func, insert, select, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.db import get_db_session_context
+from app.core.events import publish_event
+from app.models.inventory import Inventory
+from app.models.location import LocationStock
+from app.models.reservation import Reservation, ReservationCreate
+from app.repositories.location_repository import location_repository
+from app.repositories.movement_repository import movement_repository
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationRepository:
+    """Repository for stock reservations."""
+
+    async def create(self, db: AsyncSession, reservation: ReservationCreate) -> Reservation | None:
+        """
+        Reserve stock until the reservation expires.
+
+        Returns None if the inventory record doesn't exist or has less stock available
+        than requested. The check and the reservation are one conditional update, so
+        concurrent reservations cannot promise the same units.
+        """
+        result = await db.execute(
+            update(Inventory)
+            .where(
+                Inventory.warehouse_id == reservation.warehouse_id,
+                Inventory.item_id == reservation.item_id,
+                Inventory.quantity - Inventory.reserved_quantity >= reservation.quantity,
+            )
+            .values(reserved_quantity=Inventory.reserved_quantity + reservation.quantity)
+            .returning(Inventory.reserved_quantity)
+            .execution_options(synchronize_session=False)
+        )
+        reserved_quantity = result.scalar_one_or_none()
+        if reserved_quantity is None:
+            return None
+
+        ttl_seconds = reservation.ttl_seconds or settings.RESERVATION_TTL_SECONDS
+        result = await db.execute(
+            insert(Reservation)
+            .values(
+                warehouse_id=reservation.warehouse_id,
+                item_id=reservation.item_id,
+                quantity=reservation.quantity,
+                expires_at=func.now() + timedelta(seconds=ttl_seconds),
+            )
+            .returning(Reservation)
+        )
+        db_reservation = result.scalar_one()
+        await publish_event(
+            db,
+            "inventory",
+            "reserved",
+            warehouse_id=reservation.warehouse_id,
+            item_id=reservation.item_id,
+            reserved_quantity=reserved_quantity,
+        )
+        await db.commit()
+        await db.refresh(db_reservation)
+        return db_reservation
+
+    async def get_by_id(self, db: AsyncSession, reservation_id: int) -> Reservation | None:
+        """Get a reservation by ID."""
+        result = await db.execute(
+            select(Reservation).where(Reservation.reservation_id == reservation_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def release(self, db: AsyncSession, reservation_id: int) -> bool:
+        """Release a reservation, making its stock available again."""
+        result = await db.execute(
+            delete(Reservation)
+            .where(Reservation.reservation_id == reservation_id)
+            .returning(Reservation.warehouse_id, Reservation.item_id, Reservation.quantity)
+        )
+        released = result.one_or_none()
+        if released is None:
+            return False
+
+        warehouse_id, item_id, quantity = released
+        result = await db.execute(
+            update(Inventory)
+            .where(Inventory.warehouse_id == warehouse_id, Inventory.item_id == item_id)
+            .values(reserved_quantity=Inventory.reserved_quantity - quantity)
+            .returning(Inventory.reserved_quantity)
+            .execution_options(synchronize_session=False)
+        )
+        await publish_event(
+            db,
+            "inventory",
+            "released",
+            warehouse_id=warehouse_id,
+            item_id=item_id,
+            reserved_quantity=result.scalar_one_or_none(),
+        )
+        await db.commit()
+        return True
+
+    async def fulfil(self, db: AsyncSession, reservation_id: int) -> Inventory | None:
+        """
+        Ship the stock of a reservation, removing it from on-hand stock.
+
+        Returns the updated inventory record, or None if the reservation doesn't exist or
+        has expired.
+        """
+        result = await db.execute(
+            delete(Reservation)
+            .where(
+                Reservation.reservation_id == reservation_id,
+                Reservation.expires_at > func.now(),
+            )
+            .returning(Reservation.warehouse_id, Reservation.item_id, Reservation.quantity)
+        )
+        fulfilled = result.one_or_none()
+        if fulfilled is None:
+            return None
+
+        warehouse_id, item_id, quantity = fulfilled
+        result = await db.execute(
+            update(Inventory)
+            .where(Inventory.warehouse_id == warehouse_id, Inventory.item_id == item_id)
+            .values(
+                quantity=Inventory.quantity - quantity,
+                reserved_quantity=Inventory.reserved_quantity - quantity,
+            )
+            .returning(Inventory)
+            .execution_options(synchronize_session=False)
+        )
+        db_inventory = result.scalar_one()
+        await movement_repository.record(
+            db,
+            [
+                {
+                    "warehouse_id": warehouse_id,
+                    "item_id": item_id,
+                    "delta": -quantity,
+                    "kind": "fulfilled",
+                }
+            ],
+        )
+        await location_repository.fit_to_inventory(
+            db, LocationStock.warehouse_id == warehouse_id, LocationStock.item_id == item_id
+        )
+        await publish_event(
+            db,
+            "inventory",
+            "updated",
+            warehouse_id=warehouse_id,
+            item_id=item_id,
+            quantity=db_inventory.quantity,
+        )
+        await db.commit()
+        await cache.invalidate("inventory")
+        await db.refresh(db_inventory)
+        return db_inventory
+
+    async def sweep_expired(self, db: AsyncSession, batch_size: int) -> int:
+        """
+        Delete a batch of expired reservations and release their stock.
+
+        Reservations locked by another sweeper are skipped, so several workers can sweep
+        at once. An event is published for each inventory record released, as for a
+        single release. Returns the number of reservations released.
+        """
+        expired_ids = (
+            select(Reservation.reservation_id)
+            .where(Reservation.expires_at <= func.now())
+            .order_by(Reservation.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        expired = (
+            delete(Reservation)
+            .where(Reservation.reservation_id.in_(expired_ids))
+            .returning(Reservation.warehouse_id, Reservation.item_id, Reservation.quantity)
+            .cte("expired_reservations")
+        )
+        released = (
+            select(
+                expired.c.warehouse_id,
+                expired.c.item_id,
+                func.sum(expired.c.quantity).label("quantity"),
+            )
+            .group_by(expired.c.warehouse_id, expired.c.item_id)
+            .cte("released_stock")
+        )
+        release = (
+            update(Inventory)
+            .where(
+                Inventory.warehouse_id == released.c.warehouse_id,
+                Inventory.item_id == released.c.item_id,
+            )
+            .values(reserved_quantity=Inventory.reserved_quantity - released.c.quantity)
+            .returning(Inventory.warehouse_id, Inventory.item_id, Inventory.reserved_quantity)
+            .cte("released_inventory")
+        )
+        # One row per released inventory record, or a single row of NULLs if none was
+        released_count = (
+            select(func.count().label("released_count")).select_from(expired).subquery()
+        )
+        result = await db.execute(
+            select(
+                released_count.c.released_count,
+                release.c.warehouse_id,
+                release.c.item_id,
+                release.c.reserved_quantity,
+            ).select_from(released_count.outerjoin(release, true()))
+        )
+        rows = result.all()
+        for row in rows:
+            if row.warehouse_id is None:
+                continue
+            await publish_event(
+                db,
+                "inventory",
+                "released",
+                warehouse_id=row.warehouse_id,
+                item_id=row.item_id,
+                reserved_quantity=row.reserved_quantity,
+            )
+        return rows[0].released_count
+
+    async def run_sweeper(self) -> None:
+        """Release expired reservations in batches until cancelled."""
+        batch_size = settings.RESERVATION_SWEEP_BATCH_SIZE
+        while True:
+            try:
+                released_count = batch_size
+                while released_count == batch_size:
+                    async with get_db_session_context() as db:
+                        released_count = await self.sweep_expired(db, batch_size)
+                    if released_count:
+                        logger.info("Released %s expired reservations", released_count)
+            except Exception:
+                logger.exception("Sweeping expired reservations failed")
+            await asyncio.sleep(settings.RESERVATION_SWEEP_INTERVAL_SECONDS)
+
+
+reservation_repository = ReservationRepository()
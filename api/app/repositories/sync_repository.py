@@ -0,0 +1,53 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.inventory import Inventory
+from app.models.item import Item
+from app.models.sync import DeletedRow, SyncResponse
+from app.models.warehouse import Warehouse
+
+
+class SyncRepository:
+    """Repository for delta sync operations."""
+
+    async def get_changes(self, db: AsyncSession, since: int, limit: int) -> SyncResponse:
+        """
+        Get rows upserted or deleted after the given change sequence.
+
+        Each table is read through its change_seq index, so the cost is proportional
+        to the number of changes. At most `limit` changes are returned in sequence
+        order; when more remain, has_more is set and the watermark points at the last
+        returned change so the next call continues from there.
+
+        Sequence values are taken at write time, so a transaction still in flight may
+        commit a value below changes that are already visible. Only changes up to the
+        horizon below every such transaction are returned, so the watermark never
+        passes a change that has yet to appear.
+        """
+        # Read before the changes, so their snapshot includes everything under it
+        horizon_result = await db.execute(select(func.change_seq_horizon()))
+        horizon = horizon_result.scalar_one()
+
+        changes = []
+        for model in (Warehouse, Item, Inventory, DeletedRow):
+            # Fetch one extra row per table to know whether the page is complete
+            result = await db.execute(
+                select(model)
+                .where(model.change_seq > since, model.change_seq <= horizon)
+                .order_by(model.change_seq)
+                .limit(limit + 1)
+            )
+            changes.extend(result.scalars().all())
+
+        changes.sort(key=lambda row: row.change_seq)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        return SyncResponse(
+            watermark=changes[-1].change_seq if changes else since,
+            has_more=has_more,
+            warehouses=[row for row in changes if isinstance(row, Warehouse)],
+            items=[row for row in changes if isinstance(row, Item)],
+            inventory=[row for row in changes if isinstance(row, Inventory)],
+            deleted=[row for row in changes if isinstance(row, DeletedRow)],
+        )
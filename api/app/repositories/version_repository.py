@@ -0,0 +1,68 @@
+from sqlalchemy import ColumnElement, ScalarSelect, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.inventory import Inventory
+from app.models.item import Item
+from app.models.sync import DeletedRow
+from app.models.warehouse import Warehouse
+
+SyncedModel = type[Warehouse] | type[Item] | type[Inventory]
+
+
+def _latest_change(model: SyncedModel, *criteria) -> ScalarSelect:
+    return select(func.coalesce(func.max(model.change_seq), 0)).where(*criteria).scalar_subquery()
+
+
+def _latest_deletion(model: SyncedModel) -> ScalarSelect:
+    return (
+        select(func.coalesce(func.max(DeletedRow.change_seq), 0))
+        .where(DeletedRow.entity == model.__tablename__)
+        .scalar_subquery()
+    )
+
+
+class VersionRepository:
+    """
+    Repository for the change versions that ETags are built from.
+
+    Every insert and update takes the next value of the shared change sequence, and
+    every delete leaves a tombstone with one, so the highest value seen in a set of
+    rows changes whenever any of them does. Each maximum is read from the top of an
+    index.
+
+    Sequence values are taken at write time, so a transaction still in flight may
+    commit a value below the highest one visible, without changing it. A version above
+    the change sequence horizon is therefore not settled yet, and None is returned for
+    it; versions at or below the horizon change with every later commit.
+    """
+
+    async def get_table_version(self, db: AsyncSession, *models: SyncedModel) -> int | None:
+        """Get the latest change to any row of the models' tables, deletions included."""
+        versions = []
+        for model in models:
+            versions += [_latest_change(model), _latest_deletion(model)]
+        return await self._settled(db, func.greatest(*versions))
+
+    async def get_warehouse_version(self, db: AsyncSession, warehouse_id: int) -> int | None:
+        """Get the latest change to a warehouse, its inventory or any item."""
+        return await self._settled(
+            db,
+            func.greatest(
+                _latest_change(Warehouse, Warehouse.warehouse_id == warehouse_id),
+                _latest_change(Inventory, Inventory.warehouse_id == warehouse_id),
+                _latest_deletion(Inventory),
+                _latest_change(Item),
+                _latest_deletion(Item),
+            ),
+        )
+
+    async def _settled(self, db: AsyncSession, latest: ColumnElement[int]) -> int | None:
+        # Read before the version, so its snapshot includes everything under it
+        horizon_result = await db.execute(select(func.change_seq_horizon()))
+        horizon = horizon_result.scalar_one()
+        result = await db.execute(select(latest))
+        version = result.scalar_one()
+        return version if version <= horizon else None
+
+
+version_repository = VersionRepository()
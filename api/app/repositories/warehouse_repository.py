@@ -1,11 +1,42 @@
-from sqlalchemy import select
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import Select, delete, func, or_, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.db import get_db_session_context
+from app.core.events import publish_event
+from app.core.geo import warehouse_index
+from app.models.inventory import (
+    Inventory,
+    PaginatedInventoryWithItemResponse,
+    WarehouseDashboard,
+)
+from app.models.pagination import PageInfo
 from app.models.warehouse import (
+    NearestWarehouse,
+    PaginatedWarehouseResponse,
     Warehouse,
     WarehouseCreate,
+    WarehouseFieldsRead,
+    WarehousePurge,
+    WarehouseRead,
     WarehouseUpdate,
+    WarehouseUtilization,
 )
+from app.repositories.movement_repository import movement_repository
+
+logger = logging.getLogger(__name__)
+
+# Keep references to running purges so they are not garbage collected
+_running_purges: dict[int, asyncio.Task] = {}
+
+# Warehouses being purged are hidden from every read
+_visible = Warehouse.deleting.is_(False)
 
 
 class WarehouseRepository:
@@ -15,25 +46,292 @@ class WarehouseRepository:
         """Create a new warehouse."""
         db_warehouse = Warehouse.model_validate(warehouse)
         db.add(db_warehouse)
+        await db.flush()
+        await publish_event(db, "warehouse", "created", warehouse_id=db_warehouse.warehouse_id)
         await db.commit()
         await db.refresh(db_warehouse)
+        warehouse_index.upsert(
+            db_warehouse.warehouse_id, db_warehouse.latitude, db_warehouse.longitude
+        )
+        await cache.invalidate("warehouses")
         return db_warehouse
 
-    async def get_by_id(self, db: AsyncSession, warehouse_id: int) -> Warehouse | None:
-        """Get a warehouse by ID."""
-        result = await db.execute(select(Warehouse).where(Warehouse.warehouse_id == warehouse_id))
-        return result.scalar_one_or_none()
+    async def get_by_id(
+        self, db: AsyncSession, warehouse_id: int, version: int | None = None
+    ) -> WarehouseRead | None:
+        """
+        Get a warehouse by ID. Results are cached until the warehouse is changed.
+
+        version is the database version the caller's ETag was built from. It is part of
+        the cache key, so the warehouse returned is never older than that version.
+        """
+        cache_key = (warehouse_id, version)
+        cached = await cache.get("warehouse", cache_key)
+        if cached is not None:
+            return cached
+        tags = [f"warehouse:{warehouse_id}"]
+        versions = await cache.tag_versions("warehouse", tags)
+
+        result = await db.execute(
+            select(Warehouse).where(Warehouse.warehouse_id == warehouse_id, _visible)
+        )
+        db_warehouse = result.scalar_one_or_none()
+        if db_warehouse is None:
+            return None
+
+        warehouse = WarehouseRead.model_validate(db_warehouse)
+        await cache.set("warehouse", cache_key, warehouse, tags, versions)
+        return warehouse
+
+    def export_statement(self) -> Select:
+        """Build a query for all warehouses."""
+        columns = [
+            getattr(Warehouse, field)
+            for field in WarehouseRead.model_fields
+            if field != "warehouse_id"
+        ]
+        return (
+            select(Warehouse.warehouse_id, *columns)
+            .where(_visible)
+            .order_by(Warehouse.warehouse_id)
+        )
+
+    async def get_warehouses(
+        self,
+        db: AsyncSession,
+        name: str | None = None,
+        manager: str | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+        fields: list[str] | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        version: int | None = None,
+    ) -> list[WarehouseFieldsRead] | PaginatedWarehouseResponse:
+        """
+        Get warehouses ordered by ID, as a page when page_size is given or else all of them.
+
+        name and manager filter by substring, bbox is (min_lon, min_lat, max_lon, max_lat)
+        and may cross the antimeridian. When fields is given, only those columns are
+        loaded and returned. Results are cached until the next warehouse write, keyed by
+        the version the caller's ETag was built from, like get_by_id.
+        """
+        cache_key = (
+            name,
+            manager,
+            bbox,
+            tuple(fields) if fields is not None else None,
+            page,
+            page_size,
+            version,
+        )
+        cached = await cache.get("warehouses", cache_key)
+        if cached is not None:
+            return cached
+        versions = await cache.tag_versions("warehouses")
+
+        # Build the filters shared by the list and count queries
+        filters = [_visible]
+        if name:
+            filters.append(Warehouse.name.ilike(f"%{name}%"))
+        if manager:
+            filters.append(Warehouse.manager_name.ilike(f"%{manager}%"))
+        if bbox is not None:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            filters.append(Warehouse.latitude.between(min_lat, max_lat))
+            if min_lon <= max_lon:
+                filters.append(Warehouse.longitude.between(min_lon, max_lon))
+            else:
+                filters.append(or_(Warehouse.longitude >= min_lon, Warehouse.longitude <= max_lon))
+
+        # Load only the selected columns
+        columns = [
+            getattr(Warehouse, field) for field in fields or WarehouseFieldsRead.model_fields
+        ]
+        query = select(*columns).where(*filters).order_by(Warehouse.warehouse_id)
+        if page_size is None:
+            result = await db.execute(query)
+            warehouses = [WarehouseFieldsRead(**row._mapping) for row in result]
+            await cache.set("warehouses", cache_key, warehouses, (), versions)
+            return warehouses
+
+        count_result = await db.execute(select(func.count()).select_from(Warehouse).where(*filters))
+        total_items = count_result.scalar_one()
+
+        result = await db.execute(query.offset((page - 1) * page_size).limit(page_size))
+        warehouses = [WarehouseFieldsRead(**row._mapping) for row in result]
+
+        # Calculate pagination info
+        total_pages = (total_items + page_size - 1) // page_size if total_items > 0 else 1
+        page_info = PageInfo(
+            total_items=total_items,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next_page=page < total_pages,
+        )
+
+        response = PaginatedWarehouseResponse(items=warehouses, page_info=page_info)
+        await cache.set("warehouses", cache_key, response, (), versions)
+        return response
+
+    async def get_utilization(
+        self, db: AsyncSession, min_utilization: float | None = None
+    ) -> list[WarehouseUtilization]:
+        """
+        Get the floor space utilization of every warehouse, fullest first.
+
+        The used footprint is kept up to date by the ledger, so no stock is scanned.
+        Warehouses without square footage have no utilization.
+        """
+        utilization = (Warehouse.used_footprint / func.nullif(Warehouse.square_footage, 0)).label(
+            "utilization"
+        )
+        query = (
+            select(
+                Warehouse.warehouse_id,
+                Warehouse.name,
+                Warehouse.square_footage,
+                Warehouse.used_footprint,
+                utilization,
+                (Warehouse.square_footage - Warehouse.used_footprint).label("available_footprint"),
+            )
+            .where(_visible)
+            .order_by(utilization.desc().nulls_last(), Warehouse.warehouse_id)
+        )
+        if min_utilization is not None:
+            query = query.where(utilization >= min_utilization)
+
+        result = await db.execute(query)
+        return [WarehouseUtilization(**row._mapping) for row in result]
+
+    async def get_dashboard(
+        self,
+        db: AsyncSession,
+        warehouse_id: int,
+        low_stock_threshold: int = 10,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> WarehouseDashboard | None:
+        """
+        Get a warehouse with its stock summary and a page of its inventory.
+
+        The warehouse and its totals are read in one query and the inventory page with
+        items in a second, so the whole dashboard costs two round trips.
+        """
+        totals = (
+            select(
+                func.count().label("sku_count"),
+                func.coalesce(func.sum(Inventory.quantity), 0).label("total_units"),
+                func.count()
+                .filter(Inventory.quantity <= low_stock_threshold)
+                .label("low_stock_count"),
+            )
+            .where(Inventory.warehouse_id == warehouse_id)
+            .subquery()
+        )
+        result = await db.execute(
+            select(Warehouse, totals.c.sku_count, totals.c.total_units, totals.c.low_stock_count)
+            .join(totals, true())
+            .where(Warehouse.warehouse_id == warehouse_id, _visible)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        db_warehouse, sku_count, total_units, low_stock_count = row
 
-    async def get_all_warehouses(self, db: AsyncSession) -> list[Warehouse]:
-        """Get all warehouses from the database."""
-        result = await db.execute(select(Warehouse))
-        return result.scalars().all()
+        result = await db.execute(
+            select(Inventory)
+            .options(joinedload(Inventory.item))
+            .where(Inventory.warehouse_id == warehouse_id)
+            .order_by(Inventory.item_id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        inventory = result.scalars().all()
+
+        # Calculate pagination info
+        total_pages = (sku_count + page_size - 1) // page_size if sku_count > 0 else 1
+        page_info = PageInfo(
+            total_items=sku_count,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next_page=page < total_pages,
+        )
+
+        return WarehouseDashboard(
+            warehouse=db_warehouse,
+            sku_count=sku_count,
+            total_units=total_units,
+            low_stock_count=low_stock_count,
+            inventory=PaginatedInventoryWithItemResponse(items=inventory, page_info=page_info),
+        )
+
+    async def get_nearest(
+        self,
+        db: AsyncSession,
+        latitude: float,
+        longitude: float,
+        k: int,
+        item_id: int | None = None,
+        min_quantity: int = 1,
+    ) -> list[NearestWarehouse]:
+        """
+        Get the k warehouses closest to a point, nearest first.
+
+        Distances come from the in-memory spatial index, which is loaded on first use
+        and reloaded periodically to pick up writes made by other workers. When item_id
+        is given, only warehouses holding at least min_quantity of the item are returned.
+        """
+        if not warehouse_index.is_fresh:
+            result = await db.execute(
+                select(Warehouse.warehouse_id, Warehouse.latitude, Warehouse.longitude).where(
+                    _visible
+                )
+            )
+            warehouse_index.load(result.all())
+
+        quantities = None
+        if item_id is not None:
+            result = await db.execute(
+                select(Inventory.warehouse_id, Inventory.quantity).where(
+                    Inventory.item_id == item_id, Inventory.quantity >= min_quantity
+                )
+            )
+            quantities = dict(result.all())
+
+        nearest = warehouse_index.nearest(
+            latitude, longitude, k, set(quantities) if quantities is not None else None
+        )
+        if not nearest:
+            return []
+
+        result = await db.execute(
+            select(Warehouse).where(
+                Warehouse.warehouse_id.in_([warehouse_id for warehouse_id, _ in nearest]),
+                _visible,
+            )
+        )
+        warehouses = {warehouse.warehouse_id: warehouse for warehouse in result.scalars()}
+
+        return [
+            NearestWarehouse(
+                warehouse=warehouses[warehouse_id],
+                distance_km=distance_km,
+                quantity=quantities[warehouse_id] if quantities is not None else None,
+            )
+            for warehouse_id, distance_km in nearest
+            if warehouse_id in warehouses
+        ]
 
     async def update(
         self, db: AsyncSession, warehouse_id: int, warehouse_update: WarehouseUpdate
     ) -> Warehouse | None:
         """Update a warehouse."""
-        db_warehouse = await self.get_by_id(db, warehouse_id)
+        result = await db.execute(
+            select(Warehouse).where(Warehouse.warehouse_id == warehouse_id, _visible)
+        )
+        db_warehouse = result.scalar_one_or_none()
         if not db_warehouse:
             return None
 
@@ -42,16 +340,170 @@ class WarehouseRepository:
         for key, value in warehouse_data.items():
             setattr(db_warehouse, key, value)
 
+        await publish_event(db, "warehouse", "updated", warehouse_id=warehouse_id)
         await db.commit()
         await db.refresh(db_warehouse)
+        if "latitude" in warehouse_data or "longitude" in warehouse_data:
+            warehouse_index.upsert(warehouse_id, db_warehouse.latitude, db_warehouse.longitude)
+        await cache.invalidate("warehouses", f"warehouse:{warehouse_id}")
         return db_warehouse
 
     async def delete(self, db: AsyncSession, warehouse_id: int) -> bool:
         """Delete a warehouse."""
-        db_warehouse = await self.get_by_id(db, warehouse_id)
-        if not db_warehouse:
+        # Lock the warehouse so no stock can be added to it until it is gone
+        result = await db.execute(
+            select(Warehouse.warehouse_id)
+            .where(Warehouse.warehouse_id == warehouse_id)
+            .with_for_update()
+        )
+        if result.scalar_one_or_none() is None:
             return False
 
-        await db.delete(db_warehouse)
+        # Delete the stock explicitly so the ledger records it leaving; the foreign key
+        # cascade would remove it without a trace
+        await movement_repository.delete_stock(db, Inventory.warehouse_id == warehouse_id)
+        await db.execute(
+            delete(Warehouse)
+            .where(Warehouse.warehouse_id == warehouse_id)
+            .execution_options(synchronize_session=False)
+        )
+        await publish_event(db, "warehouse", "deleted", warehouse_id=warehouse_id)
         await db.commit()
+        warehouse_index.remove(warehouse_id)
+        await cache.invalidate("inventory", "warehouses", f"warehouse:{warehouse_id}")
         return True
+
+    async def start_purge(self, db: AsyncSession, warehouse_id: int) -> WarehousePurge | None:
+        """
+        Start deleting a warehouse in the background.
+
+        The warehouse is hidden at once. Its stock is then deleted in chunks of
+        PURGE_CHUNK_SIZE rows, each in its own short transaction, before the warehouse
+        itself is deleted. The purge is recorded so it can be polled, and resumed when
+        the worker running it stops. Starting a purge of a warehouse that is already
+        being deleted returns its purge, restarting it if it failed. Returns None if the
+        warehouse does not exist.
+        """
+        result = await db.execute(
+            select(Warehouse).where(Warehouse.warehouse_id == warehouse_id).with_for_update()
+        )
+        db_warehouse = result.scalar_one_or_none()
+        if db_warehouse is None:
+            return None
+
+        if db_warehouse.deleting:
+            result = await db.execute(
+                select(WarehousePurge)
+                .where(WarehousePurge.warehouse_id == warehouse_id)
+                .order_by(WarehousePurge.purge_id.desc())
+                .limit(1)
+            )
+            db_purge = result.scalar_one()
+            if db_purge.status != "failed":
+                return db_purge
+            db_purge.status = "running"
+            db_purge.heartbeat_at = datetime.now()
+            db_purge.finished_at = None
+            db_purge.error = None
+        else:
+            db_warehouse.deleting = True
+            db_purge = WarehousePurge(warehouse_id=warehouse_id)
+            db.add(db_purge)
+            await publish_event(db, "warehouse", "deleting", warehouse_id=warehouse_id)
+
+        await db.commit()
+        await db.refresh(db_purge)
+        warehouse_index.remove(warehouse_id)
+        await cache.invalidate("warehouses", f"warehouse:{warehouse_id}")
+        self._run_purge(db_purge.purge_id, warehouse_id)
+        return db_purge
+
+    async def get_purge(self, db: AsyncSession, purge_id: int) -> WarehousePurge | None:
+        """Get a warehouse purge by ID."""
+        result = await db.execute(select(WarehousePurge).where(WarehousePurge.purge_id == purge_id))
+        return result.scalar_one_or_none()
+
+    async def claim_stale_purges(self, db: AsyncSession) -> list[tuple[int, int]]:
+        """
+        Take over running purges that were not renewed within PURGE_LEASE_SECONDS.
+
+        Renewing them in the same statement means only one worker takes each. Returns
+        (purge_id, warehouse_id) pairs.
+        """
+        now = datetime.now()
+        result = await db.execute(
+            update(WarehousePurge)
+            .where(
+                WarehousePurge.status == "running",
+                WarehousePurge.heartbeat_at < now - timedelta(seconds=settings.PURGE_LEASE_SECONDS),
+            )
+            .values(heartbeat_at=now)
+            .returning(WarehousePurge.purge_id, WarehousePurge.warehouse_id)
+            .execution_options(synchronize_session=False)
+        )
+        return [tuple(row) for row in result]
+
+    async def run_purge_resumer(self) -> None:
+        """Resume the purges of stopped workers until cancelled, starting at once."""
+        while True:
+            try:
+                async with get_db_session_context() as db:
+                    purges = await self.claim_stale_purges(db)
+                for purge_id, warehouse_id in purges:
+                    logger.info("Resuming purge of warehouse %s", warehouse_id)
+                    self._run_purge(purge_id, warehouse_id)
+            except Exception:
+                logger.exception("Resuming warehouse purges failed")
+            await asyncio.sleep(settings.PURGE_LEASE_SECONDS)
+
+    def _run_purge(self, purge_id: int, warehouse_id: int) -> None:
+        """Run a purge in the background unless this worker is already running it."""
+        if purge_id not in _running_purges:
+            task = asyncio.create_task(self._purge(purge_id, warehouse_id))
+            _running_purges[purge_id] = task
+            task.add_done_callback(lambda _: _running_purges.pop(purge_id, None))
+
+    async def _purge(self, purge_id: int, warehouse_id: int) -> None:
+        """Delete a warehouse's stock chunk by chunk, then the warehouse."""
+        try:
+            removed_count = settings.PURGE_CHUNK_SIZE
+            while removed_count == settings.PURGE_CHUNK_SIZE:
+                async with get_db_session_context() as db:
+                    removed_count = await movement_repository.delete_stock(
+                        db,
+                        Inventory.warehouse_id == warehouse_id,
+                        limit=settings.PURGE_CHUNK_SIZE,
+                    )
+                    await db.execute(
+                        update(WarehousePurge)
+                        .where(WarehousePurge.purge_id == purge_id)
+                        .values(
+                            removed_count=WarehousePurge.removed_count + removed_count,
+                            heartbeat_at=datetime.now(),
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+                    await publish_event(db, "inventory", "purged", warehouse_id=warehouse_id)
+                await cache.invalidate("inventory")
+
+            # Finished in the same transaction as the delete
+            async with get_db_session_context() as db:
+                await db.execute(
+                    update(WarehousePurge)
+                    .where(WarehousePurge.purge_id == purge_id)
+                    .values(status="done", finished_at=datetime.now())
+                    .execution_options(synchronize_session=False)
+                )
+                await self.delete(db, warehouse_id)
+        except Exception as e:
+            logger.exception("Purging warehouse %s failed", warehouse_id)
+            async with get_db_session_context() as db:
+                await db.execute(
+                    update(WarehousePurge)
+                    .where(WarehousePurge.purge_id == purge_id)
+                    .values(status="failed", finished_at=datetime.now(), error=str(e))
+                    .execution_options(synchronize_session=False)
+                )
+
+
+warehouse_repository = WarehouseRepository()
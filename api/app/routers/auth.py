@@ -6,6 +6,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_db_session
+from app.core.metrics import auth_logins
 from app.core.security import (
     create_access_token,
     get_password_hash,
@@ -38,7 +39,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db_sess
         )
 
     # Hash the password
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
 
     # Create the user
     db_user = await user_repository.create(db, user_data, hashed_password)
@@ -67,13 +68,16 @@ async def login(
         user = await user_repository.get_by_email(db, form_data.username)
 
     # If still not found or password doesn't match, raise an exception
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
+        auth_logins("failure").inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    auth_logins("success").inc()
+
     # Create the JWT token
     access_token = create_access_token(
         data={"sub": str(user.id)},
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+
+from app.core.cache import cache
+from app.models.cache import CacheStats
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/stats", response_model=CacheStats)
+async def get_cache_stats():
+    """
+    Get the hits, misses and hit ratios of this process's repository cache.
+
+    entries counts the in-process tier; shared tells whether a Redis tier is in use.
+    """
+    return cache.stats()
@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_db_session
+from app.models.count import CountLinesRequest, CountReport, CountSessionCreate, CountSessionRead
+from app.repositories.count_repository import CountRepository
+
+router = APIRouter(prefix="/counts", tags=["counts"])
+count_repository = CountRepository()
+
+
+@router.post("/", response_model=CountSessionRead, status_code=status.HTTP_201_CREATED)
+async def create_count_session(
+    session: CountSessionCreate, db: AsyncSession = Depends(get_db_session)
+):
+    """Open a cycle-count session for a warehouse."""
+    return await count_repository.create(db, session)
+
+
+@router.get("/{session_id}", response_model=CountSessionRead)
+async def get_count_session(session_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Get a cycle-count session by ID."""
+    db_session = await count_repository.get_by_id(db, session_id)
+    if db_session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Count session not found")
+    return db_session
+
+
+@router.post("/{session_id}/lines", response_model=CountSessionRead)
+async def add_count_lines(
+    session_id: int, request: CountLinesRequest, db: AsyncSession = Depends(get_db_session)
+):
+    """
+    Add a batch of counted lines to an open session.
+
+    Lines can be sent in as many batches as needed while counting. Counts of the same
+    item are added together. Batches are identified by their batch_id, so a batch sent
+    again, e.g. after a timeout, is not counted twice.
+    """
+    db_session, added = await count_repository.add_lines(db, session_id, request)
+    if db_session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Count session not found")
+    if not added:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Lines cannot be added: status is {db_session.status}",
+        )
+    return db_session
+
+
+@router.post("/{session_id}/close", response_model=CountReport)
+async def close_count_session(session_id: int, db: AsyncSession = Depends(get_db_session)):
+    """
+    Close a session and apply its counts to the warehouse's inventory.
+
+    Every counted item is set to its counted quantity in one transaction, and each
+    difference is recorded in the ledger. Items that were not counted are left alone.
+    Returns the variances found.
+    """
+    db_session, report = await count_repository.close(db, session_id)
+    if db_session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Count session not found")
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Session cannot be closed: status is {db_session.status}",
+        )
+    return report
+
+
+@router.get("/{session_id}/report", response_model=CountReport)
+async def get_count_report(session_id: int, db: AsyncSession = Depends(get_db_session)):
+    """
+    Get the variances of a session, largest first.
+
+    Open sessions preview the variances against current stock.
+    """
+    report = await count_repository.get_report(db, session_id)
+    if report is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Count session not found")
+    return report
@@ -0,0 +1,59 @@
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.events import event_broker
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _matches(event: dict, warehouse_ids: set[int] | None) -> bool:
+    """Check whether an event concerns one of the requested warehouses."""
+    if not warehouse_ids or "warehouse_id" not in event:
+        return True
+    return event["warehouse_id"] in warehouse_ids
+
+
+async def _event_stream(warehouse_ids: set[int] | None) -> AsyncGenerator[str]:
+    """Format events as server-sent events until the client disconnects."""
+    # Subscribe once the response is being sent, so one that never starts has no queue
+    queue = await event_broker.subscribe()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.EVENTS_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                # Keep proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+
+            if _matches(event, warehouse_ids):
+                yield f"event: {event['entity']}\ndata: {json.dumps(event)}\n\n"
+    finally:
+        await event_broker.unsubscribe(queue)
+
+
+@router.get("/")
+async def stream_events(
+    warehouse_ids: list[int] | None = Query(
+        None, description="Only send inventory and warehouse events for these warehouses"
+    ),
+):
+    """
+    Stream inventory, item and warehouse change events as server-sent events.
+
+    Each event is named after the changed entity and carries the action and keys of
+    the changed row. A "resync" event means events were missed and lists should be
+    refetched.
+    """
+    return StreamingResponse(
+        _event_stream(set(warehouse_ids) if warehouse_ids else None),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
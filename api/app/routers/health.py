@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Response, status
+
+from app.core.health import check_readiness
+from app.models.health import LivenessReport, ReadinessReport
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live", response_model=LivenessReport)
+async def get_liveness():
+    """Check that the worker is running. Doesn't touch the database."""
+    return LivenessReport()
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessReport,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessReport}},
+)
+async def get_readiness(response: Response):
+    """
+    Check that the worker can serve traffic.
+
+    Returns 503 if the database doesn't answer a ping in time, the connection pool is
+    nearly exhausted or the event loop lags, so load balancers stop sending requests
+    to an overloaded worker before they time out.
+    """
+    report = await check_readiness()
+    if not report.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
@@ -1,20 +1,83 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db_session
+from app.core.db import get_db_session, get_db_session_context
+from app.core.etag import check_not_modified, etag_headers, make_etag
+from app.core.fieldsets import parse_fieldset
+from app.core.responses import (
+    arrow_response,
+    model_response,
+    negotiate_format,
+    query_response,
+)
+from app.core.singleflight import request_key, single_flight
 from app.models.inventory import (
+    AvailabilityRequest,
+    AvailabilityResponse,
+    Inventory,
     InventoryCreate,
+    InventoryFieldsRead,
+    InventoryMatrix,
     InventoryRead,
     InventoryTransfer,
     InventoryTransferResponse,
     InventoryUpdate,
     InventoryWithItem,
     InventoryWithWarehouse,
+    SourcingPlan,
+    SourcingRequest,
 )
+from app.models.item import ItemFieldsRead
+from app.models.movement import InventoryHistory
+from app.models.rebalance import (
+    PaginatedRebalanceTransferResponse,
+    RebalancePlanRead,
+    RebalanceRequest,
+)
+from app.models.reservation import ReservationCreate, ReservationRead
+from app.models.warehouse import Warehouse, WarehouseFieldsRead
 from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.movement_repository import movement_repository
+from app.repositories.rebalance_repository import RebalanceRepository
+from app.repositories.reservation_repository import reservation_repository
+from app.repositories.version_repository import version_repository
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 inventory_repository = InventoryRepository()
+rebalance_repository = RebalanceRepository()
+
+INVENTORY_FIELDS = ["warehouse_id", "item_id", "quantity", "reserved_quantity"]
+LIST_FORMATS = ["json", "msgpack", "arrow"]
+
+
+def _parse_inventory_fieldset(
+    fields: str | None, expand: str | None, relation: str, relation_fields: list[str]
+) -> tuple[list[str], str | None, list[str] | None] | None:
+    """
+    Parse the fields and expand parameters of an inventory list.
+
+    Returns the inventory fields, the relation to embed and its fields, or None when the
+    full records with the relation embedded are requested. Fields of the relation are
+    selected as relation.field, which also embeds it.
+    """
+    selected = parse_fieldset(
+        fields, INVENTORY_FIELDS + [f"{relation}.{field}" for field in relation_fields]
+    )
+    expanded = parse_fieldset(expand, [relation], "expand", allow_empty=True)
+    if selected is None:
+        if expanded is None or expanded == [relation]:
+            return None
+        return INVENTORY_FIELDS, None, None
+
+    own_fields = [field for field in selected if "." not in field]
+    embed_fields = [field.split(".", 1)[1] for field in selected if "." in field]
+    if not embed_fields and expanded == [relation]:
+        embed_fields = relation_fields
+    if not embed_fields:
+        return own_fields, None, None
+    return own_fields, relation, embed_fields
 
 
 @router.post("/", response_model=InventoryRead, status_code=status.HTTP_201_CREATED)
@@ -23,31 +86,334 @@ async def create_inventory(inventory: InventoryCreate, db: AsyncSession = Depend
     return await inventory_repository.create(db, inventory)
 
 
-@router.get("/warehouse/{warehouse_id}", response_model=list[InventoryWithItem])
+@router.get(
+    "/warehouse/{warehouse_id}",
+    response_model=list[InventoryWithItem] | list[InventoryFieldsRead],
+)
 async def get_inventory_by_warehouse(
     warehouse_id: int,
-    db: AsyncSession = Depends(get_db_session),
+    request: Request,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return, item.<field> for item fields",
+        examples=["item_id,quantity,item.name"],
+    ),
+    expand: str | None = Query(
+        None, description="Embed the item (item), or nothing when empty", examples=["item"]
+    ),
 ):
-    """Get all inventory records for a specific warehouse with item information."""
-    return await inventory_repository.get_by_warehouse(db, warehouse_id)
+    """
+    Get all inventory records for a specific warehouse with item information.
+    Optionally return only selected fields, with or without the item embedded.
+    Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
+    """
+    format_name = negotiate_format(request, LIST_FORMATS)
+    item_fields = list(ItemFieldsRead.model_fields)
+    fieldset = _parse_inventory_fieldset(fields, expand, "item", item_fields)
+    # Read the version in a session of its own, so no connection is held while waiting
+    # on a shared call
+    async with get_db_session_context() as db:
+        version = await version_repository.get_warehouse_version(db, warehouse_id)
+    etag = make_etag("warehouse-inventory", warehouse_id, version, format_name)
+    check_not_modified(request, etag)
+    headers = etag_headers(etag, "Accept")
+    if format_name == "arrow":
+        statement = inventory_repository.fields_statement(
+            *(fieldset or (INVENTORY_FIELDS, "item", item_fields)), warehouse_id=warehouse_id
+        )
+        return arrow_response(statement, headers)
+
+    async def load_inventory() -> Response:
+        async with get_db_session_context() as session:
+            if fieldset is None:
+                inventory = await inventory_repository.get_by_warehouse(session, warehouse_id)
+                return model_response(
+                    list[InventoryWithItem], inventory, headers=headers, format_name=format_name
+                )
+
+            inventory = await inventory_repository.get_fields(
+                session, *fieldset, warehouse_id=warehouse_id
+            )
+            return model_response(
+                list[InventoryFieldsRead],
+                inventory,
+                headers=headers,
+                exclude_unset=True,
+                format_name=format_name,
+            )
 
+    # Identical concurrent requests for a settled version share one query
+    if etag is None:
+        return await load_inventory()
+    return await single_flight.response(request_key(request, etag), load_inventory)
 
-@router.get("/item/{item_id}", response_model=list[InventoryWithWarehouse])
+
+@router.get(
+    "/item/{item_id}",
+    response_model=list[InventoryWithWarehouse] | list[InventoryFieldsRead],
+)
 async def get_inventory_by_item(
     item_id: int,
+    request: Request,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to return, warehouse.<field> for warehouse fields",
+        examples=["warehouse_id,quantity,warehouse.name"],
+    ),
+    expand: str | None = Query(
+        None,
+        description="Embed the warehouse (warehouse), or nothing when empty",
+        examples=["warehouse"],
+    ),
+):
+    """
+    Get all inventory records for a specific item with warehouse information.
+    Optionally return only selected fields, with or without the warehouse embedded.
+    Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
+    """
+    format_name = negotiate_format(request, LIST_FORMATS)
+    warehouse_fields = list(WarehouseFieldsRead.model_fields)
+    fieldset = _parse_inventory_fieldset(fields, expand, "warehouse", warehouse_fields)
+    async with get_db_session_context() as db:
+        version = await version_repository.get_table_version(db, Inventory, Warehouse)
+    etag = make_etag("item-inventory", item_id, version, format_name)
+    check_not_modified(request, etag)
+    headers = etag_headers(etag, "Accept")
+    if format_name == "arrow":
+        statement = inventory_repository.fields_statement(
+            *(fieldset or (INVENTORY_FIELDS, "warehouse", warehouse_fields)), item_id=item_id
+        )
+        return arrow_response(statement, headers)
+
+    async def load_inventory() -> Response:
+        async with get_db_session_context() as session:
+            if fieldset is None:
+                inventory = await inventory_repository.get_by_item(session, item_id)
+                return model_response(
+                    list[InventoryWithWarehouse],
+                    inventory,
+                    headers=headers,
+                    format_name=format_name,
+                )
+
+            inventory = await inventory_repository.get_fields(session, *fieldset, item_id=item_id)
+            return model_response(
+                list[InventoryFieldsRead],
+                inventory,
+                headers=headers,
+                exclude_unset=True,
+                format_name=format_name,
+            )
+
+    # Identical concurrent requests for a settled version share one query
+    if etag is None:
+        return await load_inventory()
+    return await single_flight.response(request_key(request, etag), load_inventory)
+
+
+@router.get("/export", response_model=list[InventoryRead])
+async def export_inventory(request: Request, db: AsyncSession = Depends(get_db_session)):
+    """
+    Export all inventory records as flat rows.
+    Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
+    """
+    format_name = negotiate_format(request, LIST_FORMATS)
+    version = await version_repository.get_table_version(db, Inventory)
+    etag = make_etag("inventory", version, format_name)
+    check_not_modified(request, etag)
+    return await query_response(
+        db,
+        inventory_repository.export_statement(),
+        list[InventoryRead],
+        format_name,
+        headers=etag_headers(etag, "Accept"),
+    )
+
+
+@router.get("/matrix", response_model=InventoryMatrix, response_model_exclude_none=True)
+async def get_inventory_matrix(
+    request: Request,
+    response: Response,
+    warehouse_ids: list[int] | None = Query(None, description="Only include these warehouses"),
+    item_ids: list[int] | None = Query(None, description="Only include these items"),
+    sparse: bool = Query(False, description="Return non-zero cells instead of a dense grid"),
     db: AsyncSession = Depends(get_db_session),
 ):
-    """Get all inventory records for a specific item with warehouse information."""
-    return await inventory_repository.get_by_item(db, item_id)
+    """
+    Get stock per item per warehouse as a compact pivot.
+
+    Dense results contain one row of quantities per item, ordered like warehouse_ids.
+    Sparse results contain [item_index, warehouse_index, quantity] cells.
+    """
+    version = await version_repository.get_table_version(db, Inventory)
+    etag = make_etag("inventory", version)
+    check_not_modified(request, etag)
+    response.headers.update(etag_headers(etag))
+    return await inventory_repository.get_matrix(db, warehouse_ids, item_ids, sparse, version)
+
+
+@router.post("/availability", response_model=AvailabilityResponse, status_code=status.HTTP_200_OK)
+async def check_availability(
+    request: AvailabilityRequest, db: AsyncSession = Depends(get_db_session)
+):
+    """
+    Check the availability of up to 1000 order lines in one request.
+
+    Lines with a warehouse_id are checked against that warehouse, other lines against all
+    warehouses. Every line also reports the warehouse holding the most of its item.
+    """
+    return await inventory_repository.check_availability(db, request)
+
+
+@router.post("/sourcing-plan", response_model=SourcingPlan, status_code=status.HTTP_200_OK)
+async def plan_sourcing(request: SourcingRequest, db: AsyncSession = Depends(get_db_session)):
+    """
+    Plan which warehouses should ship an order to a destination.
+
+    Each unit is taken from the nearest warehouse that still has stock, which minimizes
+    the total units × distance shipped. Lines that cannot be fully covered report a
+    shortfall and make the plan not fulfillable.
+    """
+    return await inventory_repository.plan_sourcing(db, request)
+
+
+@router.post("/rebalance", response_model=RebalancePlanRead, status_code=status.HTTP_202_ACCEPTED)
+async def create_rebalance_plan(
+    request: RebalanceRequest, db: AsyncSession = Depends(get_db_session)
+):
+    """
+    Start computing a plan that rebalances stock across warehouses.
+
+    Each item's unreserved stock is split across warehouses evenly or in proportion to their
+    square footage. Warehouses outside the tolerance band around their target send or
+    receive stock, with the closest warehouse pairs used first. The plan is computed in
+    the background; poll it until its status is ready.
+    """
+    return await rebalance_repository.create_plan(db, request)
+
+
+@router.get("/rebalance/{plan_id}", response_model=RebalancePlanRead)
+async def get_rebalance_plan(plan_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Get a rebalancing plan with its status and totals."""
+    db_plan = await rebalance_repository.get_plan(db, plan_id)
+    if db_plan is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
+    return db_plan
+
+
+@router.get("/rebalance/{plan_id}/transfers", response_model=PaginatedRebalanceTransferResponse)
+async def get_rebalance_transfers(
+    plan_id: int,
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(100, ge=1, le=1000, description="Number of transfers per page"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Get the transfers of a rebalancing plan with pagination, longest first."""
+    return await rebalance_repository.get_transfers(db, plan_id, page, page_size)
+
+
+@router.post("/rebalance/{plan_id}/apply", response_model=RebalancePlanRead)
+async def apply_rebalance_plan(plan_id: int, db: AsyncSession = Depends(get_db_session)):
+    """
+    Apply all transfers of a ready plan in one transaction.
+
+    If stock changed since the plan was computed, nothing is applied and the plan is
+    marked stale.
+    """
+    db_plan, applied = await rebalance_repository.apply_plan(db, plan_id)
+    if db_plan is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
+    if not applied:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Plan cannot be applied: status is {db_plan.status}",
+        )
+    return db_plan
+
+
+@router.post("/reservations", response_model=ReservationRead, status_code=status.HTTP_201_CREATED)
+async def create_reservation(
+    reservation: ReservationCreate, db: AsyncSession = Depends(get_db_session)
+):
+    """
+    Hold stock for an order until it ships or the reservation expires.
+
+    Reserved stock stays on hand but is no longer available to other orders.
+    """
+    db_reservation = await reservation_repository.create(db, reservation)
+    if db_reservation is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Not enough available stock to reserve",
+        )
+    return db_reservation
+
+
+@router.get("/reservations/{reservation_id}", response_model=ReservationRead)
+async def get_reservation(reservation_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Get a reservation by ID."""
+    db_reservation = await reservation_repository.get_by_id(db, reservation_id)
+    if db_reservation is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reservation not found")
+    return db_reservation
+
+
+@router.delete("/reservations/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def release_reservation(reservation_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Release a reservation, making its stock available again."""
+    released = await reservation_repository.release(db, reservation_id)
+    if not released:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reservation not found")
+    return None
+
+
+@router.post("/reservations/{reservation_id}/fulfil", response_model=InventoryRead)
+async def fulfil_reservation(reservation_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Ship the reserved stock, removing it from the warehouse."""
+    db_inventory = await reservation_repository.fulfil(db, reservation_id)
+    if db_inventory is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reservation not found or expired",
+        )
+    return db_inventory
+
+
+@router.get("/history", response_model=InventoryHistory)
+async def get_inventory_history(
+    at: datetime = Query(..., description="Point in time to rebuild stock for"),
+    warehouse_id: int | None = Query(None, description="Only include this warehouse"),
+    item_id: int | None = Query(None, description="Only include this item"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get inventory quantities as they were at a point in time.
+
+    Stock is rebuilt from the nearest snapshot plus the movements recorded after it.
+    Only records with non-zero stock are returned.
+    """
+    history = await movement_repository.get_history(db, at, warehouse_id, item_id)
+    if history is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No inventory history recorded at that time",
+        )
+    return history
 
 
 @router.get("/{warehouse_id}/{item_id}", response_model=InventoryRead)
 async def get_inventory_by_warehouse_and_item(
     warehouse_id: int,
     item_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
 ):
     """Get a specific inventory record by warehouse_id and item_id with full details."""
+    version = await version_repository.get_table_version(db, Inventory)
+    etag = make_etag("inventory", version)
+    check_not_modified(request, etag)
+    response.headers.update(etag_headers(etag))
     db_inventory = await inventory_repository.get_by_ids(db, warehouse_id, item_id)
     if db_inventory is None:
         raise HTTPException(
@@ -95,6 +461,8 @@ async def transfer_inventory(
     This endpoint moves a specified quantity of an item from a source to a destination warehouse.
     If the source warehouse doesn't have enough quantity, the transfer will fail.
     If the item doesn't exist in the destination warehouse, a new inventory record will be created.
+    If the item's footprint would not fit in the destination's free floor space, the transfer
+    will fail.
     """
     # Validate that source and destination warehouses are different
     if transfer.source_warehouse_id == transfer.destination_warehouse_id:
@@ -110,6 +478,19 @@ async def transfer_inventory(
             detail="Transfer quantity must be greater than zero",
         )
 
+    # Validate that the destination has room for the stock
+    if not await inventory_repository.can_receive(
+        db,
+        transfer.source_warehouse_id,
+        transfer.destination_warehouse_id,
+        transfer.item_id,
+        transfer.quantity,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Transfer failed: Destination warehouse does not have enough free floor space",
+        )
+
     # Perform the transfer
     source_inventory, destination_inventory = await inventory_repository.transfer(
         db,
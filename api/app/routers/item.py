@@ -1,14 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_db_session
+from app.core.etag import check_not_modified, etag_headers, make_etag
+from app.core.responses import model_response, negotiate_format, query_response
+from app.models.inventory import Inventory
 from app.models.item import (
+    Item,
     ItemCreate,
+    ItemExportRead,
     ItemReadWithInventory,
     ItemUpdate,
     PaginatedItemWithInventoryResponse,
 )
 from app.repositories.item_repository import ItemRepository
+from app.repositories.version_repository import version_repository
 
 router = APIRouter(prefix="/items", tags=["items"])
 item_repository = ItemRepository()
@@ -22,10 +28,38 @@ async def create_item(item: ItemCreate, db: AsyncSession = Depends(get_db_sessio
     return await item_repository.get_by_id(db, db_item.item_id)
 
 
+@router.get("/export", response_model=list[ItemExportRead])
+async def export_items(request: Request, db: AsyncSession = Depends(get_db_session)):
+    """
+    Export all items as flat rows.
+    Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
+    """
+    format_name = negotiate_format(request, ["json", "msgpack", "arrow"])
+    version = await version_repository.get_table_version(db, Item)
+    etag = make_etag("items", version, format_name)
+    check_not_modified(request, etag)
+    return await query_response(
+        db,
+        item_repository.export_statement(),
+        list[ItemExportRead],
+        format_name,
+        headers=etag_headers(etag, "Accept"),
+    )
+
+
 @router.get("/{item_id}", response_model=ItemReadWithInventory)
-async def get_item(item_id: int, db: AsyncSession = Depends(get_db_session)):
+async def get_item(
+    item_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_session),
+):
     """Get an item by ID with total inventory information."""
-    db_item = await item_repository.get_by_id(db, item_id)
+    version = await version_repository.get_table_version(db, Item, Inventory)
+    etag = make_etag("items", version)
+    check_not_modified(request, etag)
+    response.headers.update(etag_headers(etag))
+    db_item = await item_repository.get_by_id(db, item_id, version)
     if db_item is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     return db_item
@@ -33,6 +67,7 @@ async def get_item(item_id: int, db: AsyncSession = Depends(get_db_session)):
 
 @router.get("/", response_model=PaginatedItemWithInventoryResponse)
 async def get_items(
+    request: Request,
     search: str | None = Query(None, description="Search items by name"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
@@ -42,8 +77,19 @@ async def get_items(
     Get all items with pagination and total inventory information.
     Returns pagination metadata along with the results.
     Optionally filter items by name using the search parameter.
+    Served as JSON or MessagePack, as the Accept header asks.
     """
-    return await item_repository.get_items(db, search, page, page_size)
+    format_name = negotiate_format(request, ["json", "msgpack"])
+    version = await version_repository.get_table_version(db, Item, Inventory)
+    etag = make_etag("items", version, format_name)
+    check_not_modified(request, etag)
+    items = await item_repository.get_items(db, search, page, page_size, version)
+    return model_response(
+        PaginatedItemWithInventoryResponse,
+        items,
+        headers=etag_headers(etag, "Accept"),
+        format_name=format_name,
+    )
 
 
 @router.patch("/{item_id}", response_model=ItemReadWithInventory)
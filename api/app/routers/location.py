@@ -0,0 +1,108 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_db_session
+from app.models.location import (
+    LocationCreate,
+    LocationRead,
+    LocationStockRead,
+    LocationStockUpdate,
+    LocationUpdate,
+    PickList,
+    PickListRequest,
+)
+from app.repositories.location_repository import location_repository
+
+router = APIRouter(prefix="/locations", tags=["locations"])
+
+
+@router.post("/", response_model=LocationRead, status_code=status.HTTP_201_CREATED)
+async def create_location(location: LocationCreate, db: AsyncSession = Depends(get_db_session)):
+    """Create a new bin location in a warehouse."""
+    db_location = await location_repository.create(db, location)
+    if db_location is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Location code already exists in this warehouse",
+        )
+    return db_location
+
+
+@router.post("/pick-list", response_model=PickList, status_code=status.HTTP_200_OK)
+async def get_pick_list(request: PickListRequest, db: AsyncSession = Depends(get_db_session)):
+    """
+    Plan where to pick an order in a warehouse.
+
+    Each item is taken from the locations earliest on the pick path, which keeps the
+    walk as short as possible. Stops are returned in walking order. Items that cannot
+    be fully picked from locations report a shortfall and make the list incomplete.
+    """
+    return await location_repository.get_pick_list(db, request)
+
+
+@router.get("/warehouse/{warehouse_id}", response_model=list[LocationRead])
+async def get_locations_by_warehouse(warehouse_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Get all locations of a warehouse in walking order."""
+    return await location_repository.get_by_warehouse(db, warehouse_id)
+
+
+@router.get("/{location_id}", response_model=LocationRead)
+async def get_location(location_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Get a location by ID."""
+    db_location = await location_repository.get_by_id(db, location_id)
+    if db_location is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location not found")
+    return db_location
+
+
+@router.patch("/{location_id}", response_model=LocationRead)
+async def update_location(
+    location_id: int,
+    location: LocationUpdate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Update a location."""
+    db_location = await location_repository.update(db, location_id, location)
+    if db_location is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location not found")
+    return db_location
+
+
+@router.delete("/{location_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_location(location_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Delete a location, removing its stock from the warehouse's inventory."""
+    success = await location_repository.delete(db, location_id)
+    if not success:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location not found")
+    return None
+
+
+@router.get("/{location_id}/stock", response_model=list[LocationStockRead])
+async def get_location_stock(location_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Get the stock stored in a location."""
+    return await location_repository.get_stock(db, location_id)
+
+
+@router.put("/{location_id}/stock/{item_id}", response_model=LocationStockRead)
+async def set_location_stock(
+    location_id: int,
+    item_id: int,
+    stock: LocationStockUpdate,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Set the quantity of an item in a location.
+    The difference is added to or removed from the warehouse's inventory, which must have
+    room for any stock added.
+    """
+    db_location, db_stock = await location_repository.set_stock(
+        db, location_id, item_id, stock.quantity
+    )
+    if db_location is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Location not found")
+    if db_stock is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Warehouse is being deleted or does not have enough free floor space",
+        )
+    return db_stock
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+
+from app.core.metrics import metrics_response
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Get request, database, authentication and cache metrics in the Prometheus format.
+
+    Run the workers with PROMETHEUS_MULTIPROC_DIR set to an empty shared directory for
+    metrics summed over all of them. Scrapers authenticate with METRICS_TOKEN as a bearer
+    token, or with a user's access token.
+    """
+    return metrics_response()
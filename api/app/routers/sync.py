@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_db_session
+from app.models.sync import SyncResponse
+from app.repositories.sync_repository import SyncRepository
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+sync_repository = SyncRepository()
+
+
+@router.get("/", response_model=SyncResponse)
+async def get_changes(
+    since: int = Query(0, ge=0, description="Watermark returned by the previous sync"),
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum number of changes"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get warehouses, items and inventory records changed since a watermark.
+
+    Start with since=0 for a full download, then pass the returned watermark on the
+    next call. Keep calling while has_more is true. Changes whose transaction may still
+    be preceded by an uncommitted one are held back until a later call.
+    """
+    return await sync_repository.get_changes(db, since, limit)
@@ -1,16 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_db_session
+from app.core.etag import check_not_modified, etag_headers, make_etag
+from app.core.fieldsets import parse_fieldset
+from app.core.responses import model_response, negotiate_format, query_response
+from app.models.inventory import WarehouseDashboard
 from app.models.warehouse import (
+    NearestWarehouse,
+    PaginatedWarehouseResponse,
+    Warehouse,
     WarehouseCreate,
+    WarehouseFieldsRead,
+    WarehousePurgeRead,
     WarehouseRead,
     WarehouseUpdate,
+    WarehouseUtilization,
 )
-from app.repositories.warehouse_repository import WarehouseRepository
+from app.repositories.version_repository import version_repository
+from app.repositories.warehouse_repository import warehouse_repository
 
 router = APIRouter(prefix="/warehouses", tags=["warehouses"])
-warehouse_repository = WarehouseRepository()
 
 
 @router.post("/", response_model=WarehouseRead, status_code=status.HTTP_201_CREATED)
@@ -19,21 +29,181 @@ async def create_warehouse(warehouse: WarehouseCreate, db: AsyncSession = Depend
     return await warehouse_repository.create(db, warehouse)
 
 
+@router.get("/nearest", response_model=list[NearestWarehouse])
+async def get_nearest_warehouses(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the point"),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude of the point"),
+    k: int = Query(5, ge=1, le=100, description="Number of warehouses to return"),
+    item_id: int | None = Query(None, description="Only warehouses stocking this item"),
+    min_qty: int = Query(1, ge=1, description="Minimum stock of the item"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get the warehouses closest to a point, nearest first, with distances in km.
+    Optionally only include warehouses holding at least min_qty of an item.
+    """
+    return await warehouse_repository.get_nearest(db, lat, lon, k, item_id, min_qty)
+
+
+@router.get("/utilization", response_model=list[WarehouseUtilization])
+async def get_warehouse_utilization(
+    min_utilization: float | None = Query(
+        None, ge=0, description="Only warehouses at least this full, e.g. 0.9 for 90%"
+    ),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get how much of each warehouse's floor space is taken up by stock, fullest first.
+    Only items with a unit footprint count towards utilization.
+    """
+    return await warehouse_repository.get_utilization(db, min_utilization)
+
+
+@router.get("/export", response_model=list[WarehouseRead])
+async def export_warehouses(request: Request, db: AsyncSession = Depends(get_db_session)):
+    """
+    Export all warehouses as flat rows.
+    Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
+    """
+    format_name = negotiate_format(request, ["json", "msgpack", "arrow"])
+    version = await version_repository.get_table_version(db, Warehouse)
+    etag = make_etag("warehouses", version, format_name)
+    check_not_modified(request, etag)
+    return await query_response(
+        db,
+        warehouse_repository.export_statement(),
+        list[WarehouseRead],
+        format_name,
+        headers=etag_headers(etag, "Accept"),
+    )
+
+
+@router.get("/purges/{purge_id}", response_model=WarehousePurgeRead)
+async def get_warehouse_purge(purge_id: int, db: AsyncSession = Depends(get_db_session)):
+    """Get a warehouse purge with its status and the number of stock rows removed."""
+    db_purge = await warehouse_repository.get_purge(db, purge_id)
+    if db_purge is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Purge not found")
+    return db_purge
+
+
 @router.get("/{warehouse_id}", response_model=WarehouseRead)
-async def get_warehouse(warehouse_id: int, db: AsyncSession = Depends(get_db_session)):
+async def get_warehouse(
+    warehouse_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db_session),
+):
     """Get a warehouse by ID."""
-    db_warehouse = await warehouse_repository.get_by_id(db, warehouse_id)
+    version = await version_repository.get_table_version(db, Warehouse)
+    etag = make_etag("warehouses", version)
+    check_not_modified(request, etag)
+    response.headers.update(etag_headers(etag))
+    db_warehouse = await warehouse_repository.get_by_id(db, warehouse_id, version)
     if db_warehouse is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Warehouse not found")
     return db_warehouse
 
 
-@router.get("/", response_model=list[WarehouseRead])
-async def get_warehouses(db: AsyncSession = Depends(get_db_session)):
+@router.get("/{warehouse_id}/dashboard", response_model=WarehouseDashboard)
+async def get_warehouse_dashboard(
+    warehouse_id: int,
+    request: Request,
+    response: Response,
+    low_stock_threshold: int = Query(
+        10, ge=0, description="Quantity at or below which stock counts as low"
+    ),
+    page: int = Query(1, ge=1, description="Inventory page number"),
+    page_size: int = Query(50, ge=1, le=500, description="Number of inventory records per page"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get a warehouse with its SKU count, total units, low-stock count and a page of its
+    inventory with item information, in a single request.
+    """
+    version = await version_repository.get_warehouse_version(db, warehouse_id)
+    etag = make_etag("warehouse-inventory", warehouse_id, version)
+    check_not_modified(request, etag)
+    response.headers.update(etag_headers(etag))
+    dashboard = await warehouse_repository.get_dashboard(
+        db, warehouse_id, low_stock_threshold, page, page_size
+    )
+    if dashboard is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Warehouse not found")
+    return dashboard
+
+
+@router.get(
+    "/",
+    response_model=list[WarehouseFieldsRead] | PaginatedWarehouseResponse,
+    response_model_exclude_unset=True,
+)
+async def get_warehouses(
+    request: Request,
+    name: str | None = Query(None, description="Filter warehouses by name"),
+    manager: str | None = Query(None, description="Filter warehouses by manager name"),
+    bbox: str | None = Query(
+        None,
+        description="Bounding box as min_lon,min_lat,max_lon,max_lat",
+        examples=["14,49,24,55"],
+    ),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return", examples=["warehouse_id,name"]
+    ),
+    page: int | None = Query(None, ge=1, description="Page number, defaults to 1"),
+    page_size: int | None = Query(
+        None, ge=1, le=100, description="Number of warehouses per page, defaults to 10"
+    ),
+    db: AsyncSession = Depends(get_db_session),
+):
     """
-    Get all warehouses from the database.
+    Get all warehouses as a list, or a page of them with page info when page or
+    page_size is given.
+    Optionally filter by name, manager or bounding box and return only selected fields.
+    Served as JSON or MessagePack, as the Accept header asks.
     """
-    return await warehouse_repository.get_all_warehouses(db)
+    bbox_coordinates = None
+    if bbox is not None:
+        try:
+            bbox_coordinates = tuple(float(value) for value in bbox.split(","))
+        except ValueError:
+            bbox_coordinates = None
+        if (
+            bbox_coordinates is None
+            or len(bbox_coordinates) != 4
+            or not all(-180 <= value <= 180 for value in bbox_coordinates[::2])
+            or not all(-90 <= value <= 90 for value in bbox_coordinates[1::2])
+            or bbox_coordinates[1] > bbox_coordinates[3]
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="bbox must be min_lon,min_lat,max_lon,max_lat",
+            )
+
+    selected_fields = parse_fieldset(fields, WarehouseFieldsRead.model_fields)
+
+    format_name = negotiate_format(request, ["json", "msgpack"])
+    version = await version_repository.get_table_version(db, Warehouse)
+    etag = make_etag("warehouses", version, format_name)
+    check_not_modified(request, etag)
+    paginated = page is not None or page_size is not None
+    warehouses = await warehouse_repository.get_warehouses(
+        db,
+        name,
+        manager,
+        bbox_coordinates,
+        selected_fields,
+        page or 1,
+        (page_size or 10) if paginated else None,
+        version,
+    )
+    return model_response(
+        PaginatedWarehouseResponse if paginated else list[WarehouseFieldsRead],
+        warehouses,
+        headers=etag_headers(etag, "Accept"),
+        exclude_unset=True,
+        format_name=format_name,
+    )
 
 
 @router.patch("/{warehouse_id}", response_model=WarehouseRead)
@@ -49,9 +219,36 @@ async def update_warehouse(
     return db_warehouse
 
 
-@router.delete("/{warehouse_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_warehouse(warehouse_id: int, db: AsyncSession = Depends(get_db_session)):
-    """Delete a warehouse."""
+@router.delete(
+    "/{warehouse_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_202_ACCEPTED: {"model": WarehousePurgeRead, "description": "Purge started"}
+    },
+)
+async def delete_warehouse(
+    warehouse_id: int,
+    purge: bool = Query(
+        False, description="Delete the stock in chunks in the background, for huge warehouses"
+    ),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Delete a warehouse with all its stock.
+    With purge, responds 202 at once with the purge to poll. The warehouse is hidden
+    straight away and deleted once its stock is gone.
+    """
+    if purge:
+        db_purge = await warehouse_repository.start_purge(db, warehouse_id)
+        if db_purge is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Warehouse not found")
+        return model_response(
+            WarehousePurgeRead,
+            db_purge,
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": f"/warehouses/purges/{db_purge.purge_id}"},
+        )
+
     success = await warehouse_repository.delete(db, warehouse_id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Warehouse not found")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark for JSON response serialization.
+
+Serializes the response of GET /inventory/warehouse/{id} and GET /inventory/item/{id}
+for in-memory inventory rows in three ways:
+the stock FastAPI pipeline (pydantic to dicts, then stdlib json),
+the same pipeline rendered with orjson (the app-wide default response class),
+and pydantic serializing straight to bytes (model_response, used by both endpoints).
+Times are CPU time of the fastest run.
+
+Usage:
+    python -m benchmarks.json_serialization [--rows N] [--repeat N]
+
+Options:
+    --rows N      Number of inventory rows in each response [default: 10000]
+    --repeat N    Number of timed runs [default: 5]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import ORJSONResponse, model_response
+from app.models.inventory import Inventory, InventoryWithItem, InventoryWithWarehouse
+from app.models.item import Item
+from app.models.warehouse import Warehouse
+
+
+def make_rows(count: int) -> list[Inventory]:
+    """Build inventory rows with their item and warehouse loaded, like the ORM returns."""
+    warehouse = Warehouse(
+        warehouse_id=1,
+        name="Central",
+        address="ul. Marszałkowska 1, Warszawa",
+        square_footage=50000,
+        manager_name="Jan Kowalski",
+        phone="+48 123 456 789",
+        latitude=Decimal("52.229676"),
+        longitude=Decimal("21.012229"),
+        change_seq=1,
+    )
+    rows = []
+    for i in range(count):
+        item = Item(
+            item_id=i + 1,
+            name=f"Item {i}",
+            description=f"Description of item {i}",
+            sku=f"SKU-{i:06d}",
+            unit_footprint=0.5,
+            change_seq=i + 1,
+        )
+        rows.append(
+            Inventory(
+                warehouse_id=1,
+                item_id=i + 1,
+                quantity=i % 500,
+                change_seq=i + 1,
+                item=item,
+                warehouse=warehouse,
+            )
+        )
+    return rows
+
+
+def fastapi_body(field, response_class, rows: list[Inventory]) -> bytes:
+    """Serialize rows the way FastAPI does for an endpoint returning them."""
+    content = asyncio.run(serialize_response(field=field, response_content=rows))
+    return response_class(content).body
+
+
+def best_of(repeat: int, function, *args) -> tuple[float, bytes]:
+    """Run a function several times and return the lowest CPU time and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        result = function(*args)
+        best = min(best, time.process_time() - start)
+    return best, result
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON response serialization")
+    parser.add_argument("--rows", type=int, default=10000, help="Number of inventory rows")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rows = make_rows(args.rows)
+
+    for path, response_type in (
+        ("/inventory/warehouse/{id}", list[InventoryWithItem]),
+        ("/inventory/item/{id}", list[InventoryWithWarehouse]),
+    ):
+        field = create_model_field(name="Response", type_=response_type, mode="serialization")
+        stdlib_time, stdlib_body = best_of(args.repeat, fastapi_body, field, JSONResponse, rows)
+        orjson_time, orjson_body = best_of(args.repeat, fastapi_body, field, ORJSONResponse, rows)
+        direct_time, direct_response = best_of(args.repeat, model_response, response_type, rows)
+        expected = json.loads(stdlib_body)
+        assert json.loads(orjson_body) == expected, "orjson body should match"
+        assert json.loads(direct_response.body) == expected, "Direct body should match"
+
+        print(f"📦 GET {path} with {args.rows} rows ({len(stdlib_body) / 1e6:.1f} MB)")
+        print(f"🐢 FastAPI + json:     {stdlib_time * 1000:8.2f} ms CPU")
+        print(f"⚡ FastAPI + orjson:   {orjson_time * 1000:8.2f} ms CPU")
+        print(f"🚀 pydantic to bytes:  {direct_time * 1000:8.2f} ms CPU")
+        print(f"💾 CPU saved:          {(1 - direct_time / stdlib_time) * 100:8.1f} %")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the fulfilment sourcing planner.
+
+Plans random order lines across random warehouses with the vectorized planner used by
+POST /inventory/sourcing-plan and compares it with a per-line greedy loop that
+produces the same plan.
+
+Usage:
+    python -m benchmarks.sourcing_plan [--warehouses N] [--lines N] [--items N] [--repeat N]
+
+Options:
+    --warehouses N    Number of warehouses [default: 100]
+    --lines N         Number of order lines [default: 10000]
+    --items N         Number of distinct items [default: 2000]
+    --repeat N        Number of timed runs [default: 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from app.core.geo import haversine_km
+from app.core.sourcing import plan_sourcing
+
+
+def plan_sourcing_loop(
+    distances_km: np.ndarray,
+    stock: np.ndarray,
+    line_items: np.ndarray,
+    line_quantities: np.ndarray,
+) -> np.ndarray:
+    """Reference planner taking stock line by line from the nearest warehouse."""
+    remaining = stock.copy()
+    allocation = np.zeros((len(line_items), len(distances_km)), dtype=stock.dtype)
+    order = np.argsort(distances_km, kind="stable")
+    for line, (item, quantity) in enumerate(zip(line_items, line_quantities, strict=True)):
+        for warehouse in order:
+            taken = min(quantity, remaining[item, warehouse])
+            allocation[line, warehouse] = taken
+            remaining[item, warehouse] -= taken
+            quantity -= taken
+            if quantity == 0:
+                break
+    return allocation
+
+
+def best_of(repeat: int, function, *args) -> tuple[float, np.ndarray]:
+    """Run a function several times and return the fastest time and its result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the sourcing planner")
+    parser.add_argument("--warehouses", type=int, default=100, help="Number of warehouses")
+    parser.add_argument("--lines", type=int, default=10000, help="Number of order lines")
+    parser.add_argument("--items", type=int, default=2000, help="Number of distinct items")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rng = np.random.default_rng(42)
+
+    latitudes = rng.uniform(49.0, 55.0, args.warehouses)
+    longitudes = rng.uniform(14.0, 24.0, args.warehouses)
+    stock = rng.integers(0, 50, (args.items, args.warehouses))
+    line_items = rng.integers(0, args.items, args.lines)
+    line_quantities = rng.integers(1, 100, args.lines)
+
+    distance_time, distances = best_of(
+        args.repeat, haversine_km, 52.23, 21.01, latitudes, longitudes
+    )
+    vectorized_time, allocation = best_of(
+        args.repeat, plan_sourcing, distances, stock, line_items, line_quantities
+    )
+    loop_time, expected = best_of(
+        1, plan_sourcing_loop, distances, stock, line_items, line_quantities
+    )
+    assert (allocation == expected).all(), "Vectorized and loop plans should match"
+
+    print(f"🏭 {args.warehouses} warehouses × {args.lines} order lines ({args.items} items)")
+    print(f"📏 Distances:          {distance_time * 1000:8.2f} ms")
+    print(f"⚡ Vectorized planner: {vectorized_time * 1000:8.2f} ms")
+    print(f"🐢 Per-line loop:      {loop_time * 1000:8.2f} ms")
+    print(f"🚀 Speed-up:           {loop_time / vectorized_time:8.1f}×")
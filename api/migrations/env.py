@@ -11,6 +11,12 @@ from app.models.user_db import User
 from app.models.item import Item
 from app.models.warehouse import Warehouse
 from app.models.inventory import Inventory
+from app.models.sync import DeletedRow
+from app.models.movement import InventoryMovement, InventorySnapshot, InventorySnapshotLine
+from app.models.rebalance import RebalancePlan, RebalanceTransfer
+from app.models.location import Location, LocationStock
+from app.models.reservation import Reservation
+from app.models.count import CountLine, CountSession
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
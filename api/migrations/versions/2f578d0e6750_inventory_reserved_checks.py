@@ -0,0 +1,31 @@
+"""inventory reserved checks
+
+Revision ID: 2f578d0e6750
+Revises: f2a8c61d7b04
+Create Date: 2026-10-19 23:02:44.618390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f578d0e6750'
+down_revision: Union[str, None] = 'f2a8c61d7b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_check_constraint('ck_inventory_quantity_covers_reserved', 'inventory', 'quantity >= reserved_quantity')
+    op.create_check_constraint('ck_inventory_reserved_quantity', 'inventory', 'reserved_quantity >= 0')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_inventory_reserved_quantity', 'inventory', type_='check')
+    op.drop_constraint('ck_inventory_quantity_covers_reserved', 'inventory', type_='check')
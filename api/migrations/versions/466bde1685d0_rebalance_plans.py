@@ -0,0 +1,53 @@
+"""rebalance plans
+
+Revision ID: 466bde1685d0
+Revises: 5f4688557386
+Create Date: 2026-10-19 11:24:51.302817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '466bde1685d0'
+down_revision: Union[str, None] = '5f4688557386'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rebalance_plans',
+    sa.Column('strategy', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('tolerance', sa.Float(), nullable=False),
+    sa.Column('plan_id', sa.Integer(), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('applied_at', sa.DateTime(), nullable=True),
+    sa.Column('transfer_count', sa.Integer(), nullable=False),
+    sa.Column('units_moved', sa.Integer(), nullable=False),
+    sa.Column('unit_km', sa.Float(), nullable=False),
+    sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.PrimaryKeyConstraint('plan_id')
+    )
+    op.create_table('rebalance_transfers',
+    sa.Column('plan_id', sa.Integer(), nullable=False),
+    sa.Column('source_warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('destination_warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('distance_km', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['plan_id'], ['rebalance_plans.plan_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('plan_id', 'source_warehouse_id', 'destination_warehouse_id', 'item_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('rebalance_transfers')
+    op.drop_table('rebalance_plans')
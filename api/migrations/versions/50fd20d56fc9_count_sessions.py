@@ -0,0 +1,51 @@
+"""count sessions
+
+Revision ID: 50fd20d56fc9
+Revises: 898024682160
+Create Date: 2026-10-19 17:24:38.715204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '50fd20d56fc9'
+down_revision: Union[str, None] = '898024682160'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('count_sessions',
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('opened_at', sa.DateTime(), nullable=False),
+    sa.Column('closed_at', sa.DateTime(), nullable=True),
+    sa.Column('lines_counted', sa.Integer(), nullable=False),
+    sa.Column('lines_adjusted', sa.Integer(), nullable=False),
+    sa.Column('net_variance', sa.Integer(), nullable=False),
+    sa.Column('absolute_variance', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['warehouse_id'], ['warehouses.warehouse_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('session_id')
+    )
+    op.create_table('count_lines',
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('counted_quantity', sa.Integer(), nullable=False),
+    sa.Column('system_quantity', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['item_id'], ['items.item_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['session_id'], ['count_sessions.session_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('session_id', 'item_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('count_lines')
+    op.drop_table('count_sessions')
@@ -0,0 +1,71 @@
+"""inventory ledger
+
+Revision ID: 5f4688557386
+Revises: 7c5ba8721611
+Create Date: 2026-10-19 10:03:27.846113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f4688557386'
+down_revision: Union[str, None] = '7c5ba8721611'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('inventory_movements',
+    sa.Column('movement_id', sa.BigInteger(), nullable=False),
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('delta', sa.Integer(), nullable=False),
+    sa.Column('kind', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('movement_id')
+    )
+    op.create_index(op.f('ix_inventory_movements_item_id'), 'inventory_movements', ['item_id'], unique=False)
+    op.create_index(op.f('ix_inventory_movements_warehouse_id'), 'inventory_movements', ['warehouse_id'], unique=False)
+    op.create_table('inventory_snapshots',
+    sa.Column('snapshot_id', sa.Integer(), nullable=False),
+    sa.Column('taken_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_movement_id', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('snapshot_id')
+    )
+    op.create_index(op.f('ix_inventory_snapshots_taken_at'), 'inventory_snapshots', ['taken_at'], unique=False)
+    op.create_table('inventory_snapshot_lines',
+    sa.Column('snapshot_id', sa.Integer(), nullable=False),
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['snapshot_id'], ['inventory_snapshots.snapshot_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('snapshot_id', 'warehouse_id', 'item_id')
+    )
+
+    # Stock that predates the ledger is captured by an opening snapshot
+    op.execute("""
+        WITH snapshot AS (
+            INSERT INTO inventory_snapshots (taken_at, last_movement_id)
+            VALUES (now(), 0)
+            RETURNING snapshot_id
+        )
+        INSERT INTO inventory_snapshot_lines (snapshot_id, warehouse_id, item_id, quantity)
+        SELECT snapshot.snapshot_id, inventory.warehouse_id, inventory.item_id, inventory.quantity
+        FROM snapshot, inventory
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('inventory_snapshot_lines')
+    op.drop_index(op.f('ix_inventory_snapshots_taken_at'), table_name='inventory_snapshots')
+    op.drop_table('inventory_snapshots')
+    op.drop_index(op.f('ix_inventory_movements_warehouse_id'), table_name='inventory_movements')
+    op.drop_index(op.f('ix_inventory_movements_item_id'), table_name='inventory_movements')
+    op.drop_table('inventory_movements')
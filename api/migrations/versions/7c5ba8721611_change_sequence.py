@@ -0,0 +1,95 @@
+"""change sequence
+
+Revision ID: 7c5ba8721611
+Revises: 5321645f38b1
+Create Date: 2026-10-19 09:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c5ba8721611'
+down_revision: Union[str, None] = '5321645f38b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNCED_TABLES = ('warehouses', 'items', 'inventory')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE SEQUENCE change_seq AS BIGINT')
+
+    for table in SYNCED_TABLES:
+        op.add_column(table, sa.Column(
+            'change_seq',
+            sa.BigInteger(),
+            server_default=sa.text("nextval('change_seq')"),
+            nullable=False,
+        ))
+        op.create_index(op.f(f'ix_{table}_change_seq'), table, ['change_seq'], unique=False)
+
+    op.create_table('deleted_rows',
+    sa.Column('change_seq', sa.BigInteger(), server_default=sa.text("nextval('change_seq')"), nullable=False),
+    sa.Column('entity', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('warehouse_id', sa.Integer(), nullable=True),
+    sa.Column('item_id', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('change_seq')
+    )
+
+    # Every insert and update takes the next sequence value, whatever issued it
+    op.execute("""
+        CREATE FUNCTION bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            NEW.change_seq := nextval('change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Deletes leave a tombstone so clients can drop the row locally
+    op.execute("""
+        CREATE FUNCTION record_deleted_row() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO deleted_rows (entity, warehouse_id, item_id)
+            VALUES (
+                TG_TABLE_NAME,
+                (to_jsonb(OLD) ->> 'warehouse_id')::integer,
+                (to_jsonb(OLD) ->> 'item_id')::integer
+            );
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in SYNCED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_change_seq
+            BEFORE INSERT OR UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION bump_change_seq()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_deleted_row
+            AFTER DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION record_deleted_row()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SYNCED_TABLES:
+        op.execute(f'DROP TRIGGER {table}_deleted_row ON {table}')
+        op.execute(f'DROP TRIGGER {table}_change_seq ON {table}')
+    op.execute('DROP FUNCTION record_deleted_row()')
+    op.execute('DROP FUNCTION bump_change_seq()')
+    op.drop_table('deleted_rows')
+    for table in SYNCED_TABLES:
+        op.drop_index(op.f(f'ix_{table}_change_seq'), table_name=table)
+        op.drop_column(table, 'change_seq')
+    op.execute('DROP SEQUENCE change_seq')
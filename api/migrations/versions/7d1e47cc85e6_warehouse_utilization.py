@@ -0,0 +1,92 @@
+"""warehouse utilization
+
+Revision ID: 7d1e47cc85e6
+Revises: 900d58212db4
+Create Date: 2026-10-19 13:37:52.118420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d1e47cc85e6'
+down_revision: Union[str, None] = '900d58212db4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('items', sa.Column('unit_footprint', sa.Float(), nullable=True))
+    op.add_column('warehouses', sa.Column('used_footprint', sa.Float(), server_default='0', nullable=False))
+
+    # Every stock change goes through the ledger, so its inserts carry the footprint
+    # deltas. Warehouses are locked in ID order to avoid deadlocks between statements
+    # touching the same warehouses.
+    op.execute("""
+        CREATE FUNCTION track_used_footprint() RETURNS trigger AS $$
+        BEGIN
+            PERFORM 1 FROM warehouses
+            WHERE warehouse_id IN (SELECT warehouse_id FROM new_movements)
+            ORDER BY warehouse_id
+            FOR UPDATE;
+
+            UPDATE warehouses
+            SET used_footprint = warehouses.used_footprint + changes.footprint
+            FROM (
+                SELECT new_movements.warehouse_id,
+                       sum(new_movements.delta * items.unit_footprint) AS footprint
+                FROM new_movements
+                JOIN items ON items.item_id = new_movements.item_id
+                WHERE items.unit_footprint IS NOT NULL
+                GROUP BY new_movements.warehouse_id
+            ) AS changes
+            WHERE warehouses.warehouse_id = changes.warehouse_id
+              AND changes.footprint != 0;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER inventory_movements_used_footprint
+        AFTER INSERT ON inventory_movements
+        REFERENCING NEW TABLE AS new_movements
+        FOR EACH STATEMENT EXECUTE FUNCTION track_used_footprint()
+    """)
+
+    # Changing an item's footprint resizes the stock already stored
+    op.execute("""
+        CREATE FUNCTION resize_used_footprint() RETURNS trigger AS $$
+        BEGIN
+            UPDATE warehouses
+            SET used_footprint = warehouses.used_footprint + inventory.quantity
+                * (coalesce(NEW.unit_footprint, 0) - coalesce(OLD.unit_footprint, 0))
+            FROM inventory
+            WHERE inventory.item_id = NEW.item_id
+              AND inventory.warehouse_id = warehouses.warehouse_id
+              AND inventory.quantity != 0;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER items_used_footprint
+        AFTER UPDATE OF unit_footprint ON items
+        FOR EACH ROW
+        WHEN (OLD.unit_footprint IS DISTINCT FROM NEW.unit_footprint)
+        EXECUTE FUNCTION resize_used_footprint()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER items_used_footprint ON items')
+    op.execute('DROP FUNCTION resize_used_footprint()')
+    op.execute('DROP TRIGGER inventory_movements_used_footprint ON inventory_movements')
+    op.execute('DROP FUNCTION track_used_footprint()')
+    op.drop_column('warehouses', 'used_footprint')
+    op.drop_column('items', 'unit_footprint')
@@ -0,0 +1,46 @@
+"""inventory reservations
+
+Revision ID: 898024682160
+Revises: bfce6dbdba1b
+Create Date: 2026-10-19 16:11:05.208417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '898024682160'
+down_revision: Union[str, None] = 'bfce6dbdba1b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('inventory', sa.Column('reserved_quantity', sa.Integer(), server_default='0', nullable=False))
+    op.drop_index('ix_inventory_item_id', table_name='inventory')
+    op.create_index('ix_inventory_item_id', 'inventory', ['item_id'], unique=False, postgresql_include=['warehouse_id', 'quantity', 'reserved_quantity'])
+    op.create_table('reservations',
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('reservation_id', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['warehouse_id', 'item_id'], ['inventory.warehouse_id', 'inventory.item_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('reservation_id')
+    )
+    op.create_index(op.f('ix_reservations_expires_at'), 'reservations', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_reservations_expires_at'), table_name='reservations')
+    op.drop_table('reservations')
+    op.drop_index('ix_inventory_item_id', table_name='inventory')
+    op.create_index('ix_inventory_item_id', 'inventory', ['item_id'], unique=False, postgresql_include=['warehouse_id', 'quantity'])
+    op.drop_column('inventory', 'reserved_quantity')
@@ -0,0 +1,52 @@
+"""bin locations
+
+Revision ID: 8dba451d696a
+Revises: 7d1e47cc85e6
+Create Date: 2026-10-19 14:26:13.904381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8dba451d696a'
+down_revision: Union[str, None] = '7d1e47cc85e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('locations',
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('code', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('pick_sequence', sa.Integer(), nullable=False),
+    sa.Column('location_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['warehouse_id'], ['warehouses.warehouse_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('location_id'),
+    sa.UniqueConstraint('warehouse_id', 'code')
+    )
+    op.create_index('ix_locations_warehouse_id_pick_sequence', 'locations', ['warehouse_id', 'pick_sequence'], unique=False)
+    op.create_table('location_stock',
+    sa.Column('location_id', sa.Integer(), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['items.item_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['location_id'], ['locations.location_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['warehouse_id'], ['warehouses.warehouse_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('location_id', 'item_id')
+    )
+    op.create_index('ix_location_stock_warehouse_id_item_id', 'location_stock', ['warehouse_id', 'item_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_location_stock_warehouse_id_item_id', table_name='location_stock')
+    op.drop_table('location_stock')
+    op.drop_index('ix_locations_warehouse_id_pick_sequence', table_name='locations')
+    op.drop_table('locations')
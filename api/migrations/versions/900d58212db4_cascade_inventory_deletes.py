@@ -0,0 +1,35 @@
+"""cascade inventory deletes
+
+Revision ID: 900d58212db4
+Revises: 466bde1685d0
+Create Date: 2026-10-19 12:41:09.553104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = '900d58212db4'
+down_revision: Union[str, None] = '466bde1685d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('inventory_item_id_fkey', 'inventory', type_='foreignkey')
+    op.drop_constraint('inventory_warehouse_id_fkey', 'inventory', type_='foreignkey')
+    op.create_foreign_key('inventory_item_id_fkey', 'inventory', 'items', ['item_id'], ['item_id'], ondelete='CASCADE')
+    op.create_foreign_key('inventory_warehouse_id_fkey', 'inventory', 'warehouses', ['warehouse_id'], ['warehouse_id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('inventory_warehouse_id_fkey', 'inventory', type_='foreignkey')
+    op.drop_constraint('inventory_item_id_fkey', 'inventory', type_='foreignkey')
+    op.create_foreign_key('inventory_warehouse_id_fkey', 'inventory', 'warehouses', ['warehouse_id'], ['warehouse_id'])
+    op.create_foreign_key('inventory_item_id_fkey', 'inventory', 'items', ['item_id'], ['item_id'])
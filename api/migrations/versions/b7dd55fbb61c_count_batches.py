@@ -0,0 +1,34 @@
+"""count batches
+
+Revision ID: b7dd55fbb61c
+Revises: 2f578d0e6750
+Create Date: 2026-10-19 23:27:19.550731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7dd55fbb61c'
+down_revision: Union[str, None] = '2f578d0e6750'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('count_batches',
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('batch_id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['session_id'], ['count_sessions.session_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('session_id', 'batch_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('count_batches')
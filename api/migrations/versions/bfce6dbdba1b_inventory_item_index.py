@@ -0,0 +1,29 @@
+"""inventory item index
+
+Revision ID: bfce6dbdba1b
+Revises: 8dba451d696a
+Create Date: 2026-10-19 15:02:47.631590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bfce6dbdba1b'
+down_revision: Union[str, None] = '8dba451d696a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_inventory_item_id', 'inventory', ['item_id'], unique=False, postgresql_include=['warehouse_id', 'quantity'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_inventory_item_id', table_name='inventory')
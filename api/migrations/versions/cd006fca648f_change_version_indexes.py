@@ -0,0 +1,31 @@
+"""change version indexes
+
+Revision ID: cd006fca648f
+Revises: 50fd20d56fc9
+Create Date: 2026-10-19 18:03:12.449061
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cd006fca648f'
+down_revision: Union[str, None] = '50fd20d56fc9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_deleted_rows_entity_change_seq', 'deleted_rows', ['entity', 'change_seq'], unique=False)
+    op.create_index('ix_inventory_warehouse_id_change_seq', 'inventory', ['warehouse_id', 'change_seq'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_inventory_warehouse_id_change_seq', table_name='inventory')
+    op.drop_index('ix_deleted_rows_entity_change_seq', table_name='deleted_rows')
@@ -0,0 +1,109 @@
+"""change seq horizon
+
+Revision ID: dce43c4fa1b9
+Revises: cd006fca648f
+Create Date: 2026-10-19 21:14:52.306118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dce43c4fa1b9'
+down_revision: Union[str, None] = 'cd006fca648f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sequence values are taken at write time but become visible at commit, so a
+    # transaction can commit a value below one that is already visible. Before taking
+    # its first value, each transaction holds a shared advisory lock keyed on the
+    # sequence's current value until it ends, which marks a floor for the values it
+    # can still commit. The bigint advisory lock key space is reserved for this.
+    op.execute("""
+        CREATE FUNCTION hold_change_seq_floor() RETURNS void AS $$
+        BEGIN
+            IF current_setting('app.change_seq_floor_held', true) IS DISTINCT FROM 'on' THEN
+                PERFORM pg_advisory_xact_lock_shared(last_value) FROM change_seq;
+                PERFORM set_config('app.change_seq_floor_held', 'on', true);
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            PERFORM hold_change_seq_floor();
+            NEW.change_seq := nextval('change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_deleted_row() RETURNS trigger AS $$
+        BEGIN
+            PERFORM hold_change_seq_floor();
+            INSERT INTO deleted_rows (entity, warehouse_id, item_id)
+            VALUES (
+                TG_TABLE_NAME,
+                (to_jsonb(OLD) ->> 'warehouse_id')::integer,
+                (to_jsonb(OLD) ->> 'item_id')::integer
+            );
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Highest sequence value below which every change is visible or rolled back. The
+    # sequence is read before the locks: a writer that takes a value after that read
+    # gets a higher one, and one that took it before already holds its lock. Locks are
+    # released only after their transaction is visible to new snapshots.
+    op.execute("""
+        CREATE FUNCTION change_seq_horizon() RETURNS bigint AS $$
+        DECLARE
+            latest bigint;
+            held_floor bigint;
+        BEGIN
+            SELECT last_value INTO latest FROM change_seq;
+            SELECT min((classid::bigint << 32) | objid::bigint) INTO held_floor
+            FROM pg_locks
+            WHERE locktype = 'advisory'
+              AND objsubid = 1
+              AND database = (SELECT oid FROM pg_database WHERE datname = current_database());
+            RETURN least(latest, held_floor - 1);
+        END;
+        $$ LANGUAGE plpgsql VOLATILE
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP FUNCTION change_seq_horizon()')
+    op.execute("""
+        CREATE OR REPLACE FUNCTION record_deleted_row() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO deleted_rows (entity, warehouse_id, item_id)
+            VALUES (
+                TG_TABLE_NAME,
+                (to_jsonb(OLD) ->> 'warehouse_id')::integer,
+                (to_jsonb(OLD) ->> 'item_id')::integer
+            );
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            NEW.change_seq := nextval('change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute('DROP FUNCTION hold_change_seq_floor()')
@@ -0,0 +1,43 @@
+"""warehouse purges
+
+Revision ID: e41b7a90c2d3
+Revises: dce43c4fa1b9
+Create Date: 2026-10-19 22:03:17.481552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41b7a90c2d3'
+down_revision: Union[str, None] = 'dce43c4fa1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('warehouse_purges',
+    sa.Column('purge_id', sa.Integer(), nullable=False),
+    sa.Column('warehouse_id', sa.Integer(), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('removed_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    sa.PrimaryKeyConstraint('purge_id')
+    )
+    op.create_index(op.f('ix_warehouse_purges_warehouse_id'), 'warehouse_purges', ['warehouse_id'], unique=False)
+    op.add_column('warehouses', sa.Column('deleting', sa.Boolean(), server_default='false', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('warehouses', 'deleting')
+    op.drop_index(op.f('ix_warehouse_purges_warehouse_id'), table_name='warehouse_purges')
+    op.drop_table('warehouse_purges')
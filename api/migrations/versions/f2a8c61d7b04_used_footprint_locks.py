@@ -0,0 +1,115 @@
+"""used footprint locks
+
+Revision ID: f2a8c61d7b04
+Revises: e41b7a90c2d3
+Create Date: 2026-10-19 22:41:06.935127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c61d7b04'
+down_revision: Union[str, None] = 'e41b7a90c2d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only warehouses whose footprint changes are updated, one by one in ID order, so
+    # each is locked by its update and statements touching the same warehouses lock
+    # them in the same order. Stock without a footprint locks no warehouse.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION track_used_footprint() RETURNS trigger AS $$
+        DECLARE
+            change record;
+        BEGIN
+            FOR change IN
+                SELECT new_movements.warehouse_id,
+                       sum(new_movements.delta * items.unit_footprint) AS footprint
+                FROM new_movements
+                JOIN items ON items.item_id = new_movements.item_id
+                WHERE items.unit_footprint IS NOT NULL
+                GROUP BY new_movements.warehouse_id
+                HAVING sum(new_movements.delta * items.unit_footprint) != 0
+                ORDER BY new_movements.warehouse_id
+            LOOP
+                UPDATE warehouses
+                SET used_footprint = used_footprint + change.footprint
+                WHERE warehouse_id = change.warehouse_id;
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Columns passed as trigger arguments are derived from other tables rather than
+    # synced, so updates changing only them keep the row's sequence value
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND TG_NARGS > 0
+               AND to_jsonb(NEW) - TG_ARGV - 'change_seq' = to_jsonb(OLD) - TG_ARGV - 'change_seq'
+            THEN
+                RETURN NEW;
+            END IF;
+            PERFORM hold_change_seq_floor();
+            NEW.change_seq := nextval('change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute('DROP TRIGGER warehouses_change_seq ON warehouses')
+    op.execute("""
+        CREATE TRIGGER warehouses_change_seq
+        BEFORE INSERT OR UPDATE ON warehouses
+        FOR EACH ROW EXECUTE FUNCTION bump_change_seq('used_footprint')
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER warehouses_change_seq ON warehouses')
+    op.execute("""
+        CREATE TRIGGER warehouses_change_seq
+        BEFORE INSERT OR UPDATE ON warehouses
+        FOR EACH ROW EXECUTE FUNCTION bump_change_seq()
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_change_seq() RETURNS trigger AS $$
+        BEGIN
+            PERFORM hold_change_seq_floor();
+            NEW.change_seq := nextval('change_seq');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION track_used_footprint() RETURNS trigger AS $$
+        BEGIN
+            PERFORM 1 FROM warehouses
+            WHERE warehouse_id IN (SELECT warehouse_id FROM new_movements)
+            ORDER BY warehouse_id
+            FOR UPDATE;
+
+            UPDATE warehouses
+            SET used_footprint = warehouses.used_footprint + changes.footprint
+            FROM (
+                SELECT new_movements.warehouse_id,
+                       sum(new_movements.delta * items.unit_footprint) AS footprint
+                FROM new_movements
+                JOIN items ON items.item_id = new_movements.item_id
+                WHERE items.unit_footprint IS NOT NULL
+                GROUP BY new_movements.warehouse_id
+            ) AS changes
+            WHERE warehouses.warehouse_id = changes.warehouse_id
+              AND changes.footprint != 0;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
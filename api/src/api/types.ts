@@ -53,7 +53,10 @@ export interface paths {
         };
         /**
          * Get Warehouses
-         * @description Get all warehouses from the database.
+         * @description Get all warehouses as a list, or a page of them with page info when page or
+         *     page_size is given.
+         *     Optionally filter by name, manager or bounding box and return only selected fields.
+         *     Served as JSON or MessagePack, as the Accept header asks.
          */
         get: operations["get_warehouses_warehouses__get"];
         put?: never;
@@ -68,6 +71,89 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/warehouses/nearest": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Nearest Warehouses
+         * @description Get the warehouses closest to a point, nearest first, with distances in km.
+         *     Optionally only include warehouses holding at least min_qty of an item.
+         */
+        get: operations["get_nearest_warehouses_warehouses_nearest_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/warehouses/utilization": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Warehouse Utilization
+         * @description Get how much of each warehouse's floor space is taken up by stock, fullest first.
+         *     Only items with a unit footprint count towards utilization.
+         */
+        get: operations["get_warehouse_utilization_warehouses_utilization_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/warehouses/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Warehouses
+         * @description Export all warehouses as flat rows.
+         *     Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
+         */
+        get: operations["export_warehouses_warehouses_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/warehouses/purges/{purge_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Warehouse Purge
+         * @description Get a warehouse purge with its status and the number of stock rows removed.
+         */
+        get: operations["get_warehouse_purge_warehouses_purges__purge_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/warehouses/{warehouse_id}": {
         parameters: {
             query?: never;
@@ -84,7 +170,9 @@ export interface paths {
         post?: never;
         /**
          * Delete Warehouse
-         * @description Delete a warehouse.
+         * @description Delete a warehouse with all its stock.
+         *     With purge, responds 202 at once with the purge to poll. The warehouse is hidden
+         *     straight away and deleted once its stock is gone.
          */
         delete: operations["delete_warehouse_warehouses__warehouse_id__delete"];
         options?: never;
@@ -96,6 +184,27 @@ export interface paths {
         patch: operations["update_warehouse_warehouses__warehouse_id__patch"];
         trace?: never;
     };
+    "/warehouses/{warehouse_id}/dashboard": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Warehouse Dashboard
+         * @description Get a warehouse with its SKU count, total units, low-stock count and a page of its
+         *     inventory with item information, in a single request.
+         */
+        get: operations["get_warehouse_dashboard_warehouses__warehouse_id__dashboard_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/items/": {
         parameters: {
             query?: never;
@@ -108,6 +217,7 @@ export interface paths {
          * @description Get all items with pagination and total inventory information.
          *     Returns pagination metadata along with the results.
          *     Optionally filter items by name using the search parameter.
+         *     Served as JSON or MessagePack, as the Accept header asks.
          */
         get: operations["get_items_items__get"];
         put?: never;
@@ -122,6 +232,27 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/items/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Items
+         * @description Export all items as flat rows.
+         *     Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
+         */
+        get: operations["export_items_items_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/items/{item_id}": {
         parameters: {
             query?: never;
@@ -180,6 +311,8 @@ export interface paths {
         /**
          * Get Inventory By Warehouse
          * @description Get all inventory records for a specific warehouse with item information.
+         *     Optionally return only selected fields, with or without the item embedded.
+         *     Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
          */
         get: operations["get_inventory_by_warehouse_inventory_warehouse__warehouse_id__get"];
         put?: never;
@@ -200,6 +333,8 @@ export interface paths {
         /**
          * Get Inventory By Item
          * @description Get all inventory records for a specific item with warehouse information.
+         *     Optionally return only selected fields, with or without the warehouse embedded.
+         *     Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
          */
         get: operations["get_inventory_by_item_inventory_item__item_id__get"];
         put?: never;
@@ -210,7 +345,7 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
-    "/inventory/{warehouse_id}/{item_id}": {
+    "/inventory/export": {
         parameters: {
             query?: never;
             header?: never;
@@ -218,27 +353,66 @@ export interface paths {
             cookie?: never;
         };
         /**
-         * Get Inventory By Warehouse And Item
-         * @description Get a specific inventory record by warehouse_id and item_id with full details.
+         * Export Inventory
+         * @description Export all inventory records as flat rows.
+         *     Served as JSON, MessagePack or an Arrow stream, as the Accept header asks.
          */
-        get: operations["get_inventory_by_warehouse_and_item_inventory__warehouse_id___item_id__get"];
+        get: operations["export_inventory_inventory_export_get"];
         put?: never;
         post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/matrix": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
         /**
-         * Delete Inventory
-         * @description Delete an inventory record.
+         * Get Inventory Matrix
+         * @description Get stock per item per warehouse as a compact pivot.
+         *
+         *     Dense results contain one row of quantities per item, ordered like warehouse_ids.
+         *     Sparse results contain [item_index, warehouse_index, quantity] cells.
          */
-        delete: operations["delete_inventory_inventory__warehouse_id___item_id__delete"];
+        get: operations["get_inventory_matrix_inventory_matrix_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
         options?: never;
         head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/availability": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
         /**
-         * Update Inventory
-         * @description Update an inventory record.
+         * Check Availability
+         * @description Check the availability of up to 1000 order lines in one request.
+         *
+         *     Lines with a warehouse_id are checked against that warehouse, other lines against all
+         *     warehouses. Every line also reports the warehouse holding the most of its item.
          */
-        patch: operations["update_inventory_inventory__warehouse_id___item_id__patch"];
+        post: operations["check_availability_inventory_availability_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
         trace?: never;
     };
-    "/inventory/transfer": {
+    "/inventory/sourcing-plan": {
         parameters: {
             query?: never;
             header?: never;
@@ -248,373 +422,2851 @@ export interface paths {
         get?: never;
         put?: never;
         /**
-         * Transfer Inventory
-         * @description Transfer inventory from one warehouse to another.
+         * Plan Sourcing
+         * @description Plan which warehouses should ship an order to a destination.
          *
-         *     This endpoint moves a specified quantity of an item from a source to a destination warehouse.
-         *     If the source warehouse doesn't have enough quantity, the transfer will fail.
-         *     If the item doesn't exist in the destination warehouse, a new inventory record will be created.
+         *     Each unit is taken from the nearest warehouse that still has stock, which minimizes
+         *     the total units × distance shipped. Lines that cannot be fully covered report a
+         *     shortfall and make the plan not fulfillable.
          */
-        post: operations["transfer_inventory_inventory_transfer_post"];
+        post: operations["plan_sourcing_inventory_sourcing_plan_post"];
         delete?: never;
         options?: never;
         head?: never;
         patch?: never;
         trace?: never;
     };
-    "/": {
+    "/inventory/rebalance": {
         parameters: {
             query?: never;
             header?: never;
             path?: never;
             cookie?: never;
         };
-        /** Read Root */
-        get: operations["read_root__get"];
+        get?: never;
         put?: never;
-        post?: never;
+        /**
+         * Create Rebalance Plan
+         * @description Start computing a plan that rebalances stock across warehouses.
+         *
+         *     Each item's unreserved stock is split across warehouses evenly or in proportion to their
+         *     square footage. Warehouses outside the tolerance band around their target send or
+         *     receive stock, with the closest warehouse pairs used first. The plan is computed in
+         *     the background; poll it until its status is ready.
+         */
+        post: operations["create_rebalance_plan_inventory_rebalance_post"];
         delete?: never;
         options?: never;
         head?: never;
         patch?: never;
         trace?: never;
     };
-}
-export type webhooks = Record<string, never>;
-export interface components {
-    schemas: {
-        /** Body_login_auth_login_post */
-        Body_login_auth_login_post: {
-            /** Grant Type */
-            grant_type?: string | null;
-            /** Username */
-            username: string;
-            /** Password */
-            password: string;
-            /**
-             * Scope
-             * @default
-             */
-            scope: string;
-            /** Client Id */
-            client_id?: string | null;
-            /** Client Secret */
-            client_secret?: string | null;
-        };
-        /** HTTPValidationError */
-        HTTPValidationError: {
-            /** Detail */
-            detail?: components["schemas"]["ValidationError"][];
+    "/inventory/rebalance/{plan_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * InventoryCreate
-         * @description Schema for creating a new inventory record.
+         * Get Rebalance Plan
+         * @description Get a rebalancing plan with its status and totals.
          */
-        InventoryCreate: {
-            /** Warehouse Id */
-            warehouse_id: number;
-            /** Item Id */
-            item_id: number;
-            /** Quantity */
-            quantity: number;
+        get: operations["get_rebalance_plan_inventory_rebalance__plan_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/rebalance/{plan_id}/transfers": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * InventoryRead
-         * @description Schema for reading inventory data.
+         * Get Rebalance Transfers
+         * @description Get the transfers of a rebalancing plan with pagination, longest first.
          */
-        InventoryRead: {
-            /** Warehouse Id */
-            warehouse_id: number;
-            /** Item Id */
-            item_id: number;
-            /** Quantity */
-            quantity: number;
+        get: operations["get_rebalance_transfers_inventory_rebalance__plan_id__transfers_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/rebalance/{plan_id}/apply": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
         /**
-         * InventoryTransfer
-         * @description Schema for transferring inventory between warehouses.
+         * Apply Rebalance Plan
+         * @description Apply all transfers of a ready plan in one transaction.
+         *
+         *     If stock changed since the plan was computed, nothing is applied and the plan is
+         *     marked stale.
          */
-        InventoryTransfer: {
-            /** Source Warehouse Id */
-            source_warehouse_id: number;
-            /** Destination Warehouse Id */
-            destination_warehouse_id: number;
-            /** Item Id */
-            item_id: number;
-            /** Quantity */
-            quantity: number;
+        post: operations["apply_rebalance_plan_inventory_rebalance__plan_id__apply_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/reservations": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
         /**
-         * InventoryTransferResponse
-         * @description Response model for inventory transfer operations.
+         * Create Reservation
+         * @description Hold stock for an order until it ships or the reservation expires.
+         *
+         *     Reserved stock stays on hand but is no longer available to other orders.
          */
-        InventoryTransferResponse: {
-            /** Message */
-            message: string;
-            source_inventory: components["schemas"]["InventoryRead"];
-            destination_inventory: components["schemas"]["InventoryRead"];
+        post: operations["create_reservation_inventory_reservations_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/reservations/{reservation_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * InventoryUpdate
-         * @description Schema for updating an inventory record.
+         * Get Reservation
+         * @description Get a reservation by ID.
          */
-        InventoryUpdate: {
-            /** Quantity */
-            quantity?: number | null;
-        };
+        get: operations["get_reservation_inventory_reservations__reservation_id__get"];
+        put?: never;
+        post?: never;
         /**
-         * InventoryWithItem
-         * @description Schema for reading inventory data with item information.
+         * Release Reservation
+         * @description Release a reservation, making its stock available again.
          */
-        InventoryWithItem: {
-            /** Warehouse Id */
-            warehouse_id: number;
-            /** Item Id */
-            item_id: number;
-            /** Quantity */
-            quantity: number;
-            item: components["schemas"]["ItemRead"];
+        delete: operations["release_reservation_inventory_reservations__reservation_id__delete"];
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/reservations/{reservation_id}/fulfil": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
         /**
-         * InventoryWithWarehouse
-         * @description Schema for reading inventory data with warehouse information.
+         * Fulfil Reservation
+         * @description Ship the reserved stock, removing it from the warehouse.
          */
-        InventoryWithWarehouse: {
-            /** Warehouse Id */
-            warehouse_id: number;
-            /** Item Id */
-            item_id: number;
-            /** Quantity */
-            quantity: number;
-            warehouse: components["schemas"]["WarehouseRead"];
+        post: operations["fulfil_reservation_inventory_reservations__reservation_id__fulfil_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/history": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * ItemCreate
-         * @description Schema for creating a new item.
+         * Get Inventory History
+         * @description Get inventory quantities as they were at a point in time.
+         *
+         *     Stock is rebuilt from the nearest snapshot plus the movements recorded after it.
+         *     Only records with non-zero stock are returned.
          */
-        ItemCreate: {
-            /** Name */
-            name: string;
-            /** Description */
-            description: string;
-            /** Sku */
-            sku?: string | null;
+        get: operations["get_inventory_history_inventory_history_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/inventory/{warehouse_id}/{item_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * ItemRead
-         * @description Schema for reading item data.
+         * Get Inventory By Warehouse And Item
+         * @description Get a specific inventory record by warehouse_id and item_id with full details.
          */
-        ItemRead: {
-            /** Name */
-            name: string;
-            /** Description */
-            description: string;
-            /** Sku */
-            sku?: string | null;
-        };
+        get: operations["get_inventory_by_warehouse_and_item_inventory__warehouse_id___item_id__get"];
+        put?: never;
+        post?: never;
         /**
-         * ItemReadWithInventory
-         * @description Schema for reading item data with total inventory information.
+         * Delete Inventory
+         * @description Delete an inventory record.
          */
-        ItemReadWithInventory: {
-            /** Name */
-            name: string;
-            /** Description */
-            description: string;
-            /** Sku */
-            sku?: string | null;
-            /** Item Id */
-            item_id: number;
-            /** Total Inventory */
-            total_inventory: number;
-        };
+        delete: operations["delete_inventory_inventory__warehouse_id___item_id__delete"];
+        options?: never;
+        head?: never;
         /**
-         * ItemUpdate
-         * @description Schema for updating an item.
+         * Update Inventory
+         * @description Update an inventory record.
          */
-        ItemUpdate: {
-            /** Name */
-            name?: string | null;
-            /** Description */
-            description?: string | null;
-            /** Sku */
-            sku?: string | null;
+        patch: operations["update_inventory_inventory__warehouse_id___item_id__patch"];
+        trace?: never;
+    };
+    "/inventory/transfer": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
         /**
-         * PageInfo
-         * @description Information about the current page.
+         * Transfer Inventory
+         * @description Transfer inventory from one warehouse to another.
+         *
+         *     This endpoint moves a specified quantity of an item from a source to a destination warehouse.
+         *     If the source warehouse doesn't have enough quantity, the transfer will fail.
+         *     If the item doesn't exist in the destination warehouse, a new inventory record will be created.
+         *     If the item's footprint would not fit in the destination's free floor space, the transfer
+         *     will fail.
          */
-        PageInfo: {
-            /** Total Items */
-            total_items: number;
-            /** Page */
-            page: number;
-            /** Page Size */
-            page_size: number;
-            /** Total Pages */
-            total_pages: number;
-            /** Has Next Page */
-            has_next_page: boolean;
+        post: operations["transfer_inventory_inventory_transfer_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/locations/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
         /**
-         * PaginatedItemWithInventoryResponse
-         * @description Paginated response for items with inventory information.
+         * Create Location
+         * @description Create a new bin location in a warehouse.
          */
-        PaginatedItemWithInventoryResponse: {
-            /** Items */
-            items: components["schemas"]["ItemReadWithInventory"][];
-            page_info: components["schemas"]["PageInfo"];
+        post: operations["create_location_locations__post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/locations/pick-list": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
         /**
-         * Token
-         * @description Model for JWT token.
+         * Get Pick List
+         * @description Plan where to pick an order in a warehouse.
+         *
+         *     Each item is taken from the locations earliest on the pick path, which keeps the
+         *     walk as short as possible. Stops are returned in walking order. Items that cannot
+         *     be fully picked from locations report a shortfall and make the list incomplete.
          */
-        Token: {
-            /** Access Token */
-            access_token: string;
-            /** Token Type */
-            token_type: string;
+        post: operations["get_pick_list_locations_pick_list_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/locations/warehouse/{warehouse_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * UserCreate
-         * @description Model for creating a new user.
+         * Get Locations By Warehouse
+         * @description Get all locations of a warehouse in walking order.
          */
-        UserCreate: {
-            /**
-             * Email
-             * Format: email
-             */
-            email: string;
-            /** Username */
-            username: string;
-            /** Password */
-            password: string;
+        get: operations["get_locations_by_warehouse_locations_warehouse__warehouse_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/locations/{location_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * UserRead
-         * @description Model for reading user data.
+         * Get Location
+         * @description Get a location by ID.
          */
-        UserRead: {
-            /**
-             * Email
-             * Format: email
-             */
-            email: string;
-            /** Username */
-            username: string;
-            /** Id */
-            id: number;
-            /**
-             * Created At
-             * Format: date-time
-             */
-            created_at: string;
-            /**
-             * Updated At
-             * Format: date-time
-             */
-            updated_at: string;
+        get: operations["get_location_locations__location_id__get"];
+        put?: never;
+        post?: never;
+        /**
+         * Delete Location
+         * @description Delete a location, removing its stock from the warehouse's inventory.
+         */
+        delete: operations["delete_location_locations__location_id__delete"];
+        options?: never;
+        head?: never;
+        /**
+         * Update Location
+         * @description Update a location.
+         */
+        patch: operations["update_location_locations__location_id__patch"];
+        trace?: never;
+    };
+    "/locations/{location_id}/stock": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
-        /** ValidationError */
-        ValidationError: {
-            /** Location */
-            loc: (string | number)[];
-            /** Message */
-            msg: string;
-            /** Error Type */
-            type: string;
+        /**
+         * Get Location Stock
+         * @description Get the stock stored in a location.
+         */
+        get: operations["get_location_stock_locations__location_id__stock_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/locations/{location_id}/stock/{item_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
         /**
-         * WarehouseCreate
-         * @description Schema for creating a new warehouse.
+         * Set Location Stock
+         * @description Set the quantity of an item in a location.
+         *     The difference is added to or removed from the warehouse's inventory, which must have
+         *     room for any stock added.
          */
-        WarehouseCreate: {
-            /** Name */
-            name: string;
-            /** Square Footage */
-            square_footage: number;
-            /** Address */
-            address: string;
-            /** Manager Name */
-            manager_name: string;
-            /** Phone */
-            phone: string;
-            /** Latitude */
-            latitude: number | string;
-            /** Longitude */
-            longitude: number | string;
+        put: operations["set_location_stock_locations__location_id__stock__item_id__put"];
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/counts/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
         /**
-         * WarehouseRead
-         * @description Schema for reading warehouse data.
+         * Create Count Session
+         * @description Open a cycle-count session for a warehouse.
          */
-        WarehouseRead: {
-            /** Name */
-            name: string;
-            /** Square Footage */
-            square_footage: number;
-            /** Address */
-            address: string;
-            /** Manager Name */
-            manager_name: string;
-            /** Phone */
-            phone: string;
-            /** Latitude */
-            latitude: string;
-            /** Longitude */
-            longitude: string;
-            /** Warehouse Id */
-            warehouse_id: number;
+        post: operations["create_count_session_counts__post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/counts/{session_id}": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
         /**
-         * WarehouseUpdate
-         * @description Schema for updating a warehouse.
+         * Get Count Session
+         * @description Get a cycle-count session by ID.
          */
-        WarehouseUpdate: {
-            /** Name */
-            name?: string | null;
-            /** Square Footage */
-            square_footage?: number | null;
-            /** Address */
-            address?: string | null;
-            /** Manager Name */
-            manager_name?: string | null;
-            /** Phone */
-            phone?: string | null;
-            /** Latitude */
-            latitude?: number | string | null;
-            /** Longitude */
-            longitude?: number | string | null;
+        get: operations["get_count_session_counts__session_id__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/counts/{session_id}/lines": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
         };
+        get?: never;
+        put?: never;
+        /**
+         * Add Count Lines
+         * @description Add a batch of counted lines to an open session.
+         *
+         *     Lines can be sent in as many batches as needed while counting. Counts of the same
+         *     item are added together. Batches are identified by their batch_id, so a batch sent
+         *     again, e.g. after a timeout, is not counted twice.
+         */
+        post: operations["add_count_lines_counts__session_id__lines_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
     };
-    responses: never;
-    parameters: never;
-    requestBodies: never;
-    headers: never;
-    pathItems: never;
-}
-export type $defs = Record<string, never>;
-export interface operations {
-    register_auth_register_post: {
+    "/counts/{session_id}/close": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Close Count Session
+         * @description Close a session and apply its counts to the warehouse's inventory.
+         *
+         *     Every counted item is set to its counted quantity in one transaction, and each
+         *     difference is recorded in the ledger. Items that were not counted are left alone.
+         *     Returns the variances found.
+         */
+        post: operations["close_count_session_counts__session_id__close_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/counts/{session_id}/report": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Count Report
+         * @description Get the variances of a session, largest first.
+         *
+         *     Open sessions preview the variances against current stock.
+         */
+        get: operations["get_count_report_counts__session_id__report_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/events/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Stream Events
+         * @description Stream inventory, item and warehouse change events as server-sent events.
+         *
+         *     Each event is named after the changed entity and carries the action and keys of
+         *     the changed row. A "resync" event means events were missed and lists should be
+         *     refetched.
+         */
+        get: operations["stream_events_events__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/sync/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Changes
+         * @description Get warehouses, items and inventory records changed since a watermark.
+         *
+         *     Start with since=0 for a full download, then pass the returned watermark on the
+         *     next call. Keep calling while has_more is true. Changes whose transaction may still
+         *     be preceded by an uncommitted one are held back until a later call.
+         */
+        get: operations["get_changes_sync__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/cache/stats": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Cache Stats
+         * @description Get the hits, misses and hit ratios of this process's repository cache.
+         *
+         *     entries counts the in-process tier; shared tells whether a Redis tier is in use.
+         */
+        get: operations["get_cache_stats_cache_stats_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/health/live": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Liveness
+         * @description Check that the worker is running. Doesn't touch the database.
+         */
+        get: operations["get_liveness_health_live_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/health/ready": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Readiness
+         * @description Check that the worker can serve traffic.
+         *
+         *     Returns 503 if the database doesn't answer a ping in time, the connection pool is
+         *     nearly exhausted or the event loop lags, so load balancers stop sending requests
+         *     to an overloaded worker before they time out.
+         */
+        get: operations["get_readiness_health_ready_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Read Root */
+        get: operations["read_root__get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+}
+export type webhooks = Record<string, never>;
+export interface components {
+    schemas: {
+        /**
+         * AvailabilityLine
+         * @description Schema for an order line to check availability for.
+         */
+        AvailabilityLine: {
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Warehouse Id */
+            warehouse_id?: number | null;
+        };
+        /**
+         * AvailabilityLineResult
+         * @description Availability of one order line.
+         *
+         *     available counts the stock in the requested warehouse, or in all warehouses if none
+         *     was requested. The best warehouse is the one holding the most of the item anywhere.
+         */
+        AvailabilityLineResult: {
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Warehouse Id */
+            warehouse_id: number | null;
+            /** Available */
+            available: number;
+            /** Fulfillable */
+            fulfillable: boolean;
+            /** Best Warehouse Id */
+            best_warehouse_id: number | null;
+            /** Best Warehouse Quantity */
+            best_warehouse_quantity: number;
+        };
+        /**
+         * AvailabilityRequest
+         * @description Schema for checking the availability of several order lines.
+         */
+        AvailabilityRequest: {
+            /** Lines */
+            lines: components["schemas"]["AvailabilityLine"][];
+        };
+        /**
+         * AvailabilityResponse
+         * @description Response model for a multi-line availability check.
+         */
+        AvailabilityResponse: {
+            /** All Fulfillable */
+            all_fulfillable: boolean;
+            /** Lines */
+            lines: components["schemas"]["AvailabilityLineResult"][];
+        };
+        /** Body_login_auth_login_post */
+        Body_login_auth_login_post: {
+            /** Grant Type */
+            grant_type?: string | null;
+            /** Username */
+            username: string;
+            /**
+             * Password
+             * Format: password
+             */
+            password: string;
+            /**
+             * Scope
+             * @default
+             */
+            scope: string;
+            /** Client Id */
+            client_id?: string | null;
+            /**
+             * Client Secret
+             * Format: password
+             */
+            client_secret?: string | null;
+        };
+        /**
+         * CacheNamespaceStats
+         * @description Cache lookups of one namespace since the process started.
+         */
+        CacheNamespaceStats: {
+            /** Namespace */
+            namespace: string;
+            /** Hits */
+            hits: number;
+            /** Misses */
+            misses: number;
+            /** Hit Ratio */
+            hit_ratio: number | null;
+        };
+        /**
+         * CacheStats
+         * @description Cache lookups since the process started, in total and per namespace.
+         */
+        CacheStats: {
+            /** Entries */
+            entries: number;
+            /** Shared */
+            shared: boolean;
+            /** Hits */
+            hits: number;
+            /** Misses */
+            misses: number;
+            /** Hit Ratio */
+            hit_ratio: number | null;
+            /** Namespaces */
+            namespaces: components["schemas"]["CacheNamespaceStats"][];
+        };
+        /**
+         * CountLineCreate
+         * @description Schema for a counted line.
+         */
+        CountLineCreate: {
+            /** Item Id */
+            item_id: number;
+            /** Counted Quantity */
+            counted_quantity: number;
+        };
+        /**
+         * CountLinesRequest
+         * @description Schema for adding a batch of counted lines to a session.
+         */
+        CountLinesRequest: {
+            /**
+             * Batch Id
+             * Format: uuid
+             */
+            batch_id: string;
+            /** Lines */
+            lines: components["schemas"]["CountLineCreate"][];
+        };
+        /**
+         * CountReport
+         * @description Response model for the variances found by a cycle-count session, largest first.
+         */
+        CountReport: {
+            session: components["schemas"]["CountSessionRead"];
+            /** Variances */
+            variances: components["schemas"]["CountVariance"][];
+        };
+        /**
+         * CountSessionCreate
+         * @description Schema for opening a new cycle-count session.
+         */
+        CountSessionCreate: {
+            /** Warehouse Id */
+            warehouse_id: number;
+        };
+        /**
+         * CountSessionRead
+         * @description Schema for reading cycle-count session data.
+         */
+        CountSessionRead: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Session Id */
+            session_id: number;
+            /** Status */
+            status: string;
+            /**
+             * Opened At
+             * Format: date-time
+             */
+            opened_at: string;
+            /** Closed At */
+            closed_at: string | null;
+            /** Lines Counted */
+            lines_counted: number;
+            /** Lines Adjusted */
+            lines_adjusted: number;
+            /** Net Variance */
+            net_variance: number;
+            /** Absolute Variance */
+            absolute_variance: number;
+        };
+        /**
+         * CountVariance
+         * @description Difference between the counted and the system quantity of an item.
+         */
+        CountVariance: {
+            /** Item Id */
+            item_id: number;
+            /** Counted Quantity */
+            counted_quantity: number;
+            /** System Quantity */
+            system_quantity: number;
+            /** Variance */
+            variance: number;
+        };
+        /**
+         * DatabaseHealth
+         * @description Result of pinging the database.
+         */
+        DatabaseHealth: {
+            /** Ok */
+            ok: boolean;
+            /** Latency Ms */
+            latency_ms?: number | null;
+            /** Error */
+            error?: string | null;
+        };
+        /**
+         * DeletedRowRead
+         * @description Schema for reading a deleted row's identity.
+         */
+        DeletedRowRead: {
+            /** Entity */
+            entity: string;
+            /** Warehouse Id */
+            warehouse_id?: number | null;
+            /** Item Id */
+            item_id?: number | null;
+        };
+        /** HTTPValidationError */
+        HTTPValidationError: {
+            /** Detail */
+            detail?: components["schemas"]["ValidationError"][];
+        };
+        /**
+         * InventoryCreate
+         * @description Schema for creating a new inventory record.
+         */
+        InventoryCreate: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+        };
+        /**
+         * InventoryFieldsRead
+         * @description Schema for reading a subset of inventory fields, with its item or warehouse embedded
+         *     on request.
+         *
+         *     Fields that were not selected are left unset and omitted from responses.
+         */
+        InventoryFieldsRead: {
+            /** Warehouse Id */
+            warehouse_id?: number | null;
+            /** Item Id */
+            item_id?: number | null;
+            /** Quantity */
+            quantity?: number | null;
+            /** Reserved Quantity */
+            reserved_quantity?: number | null;
+            item?: components["schemas"]["ItemFieldsRead"] | null;
+            warehouse?: components["schemas"]["WarehouseFieldsRead"] | null;
+        };
+        /**
+         * InventoryHistory
+         * @description Inventory quantities as they were at a point in time.
+         */
+        InventoryHistory: {
+            /**
+             * At
+             * Format: date-time
+             */
+            at: string;
+            /**
+             * Snapshot Taken At
+             * Format: date-time
+             */
+            snapshot_taken_at: string;
+            /** Records */
+            records: components["schemas"]["InventoryRead"][];
+        };
+        /**
+         * InventoryMatrix
+         * @description Item × warehouse stock pivot.
+         *
+         *     Dense matrices carry one row of quantities per item, ordered like warehouse_ids.
+         *     Sparse matrices carry (item_index, warehouse_index, quantity) cells instead.
+         */
+        InventoryMatrix: {
+            /** Warehouse Ids */
+            warehouse_ids: number[];
+            /** Item Ids */
+            item_ids: number[];
+            /** Quantities */
+            quantities?: number[][] | null;
+            /** Cells */
+            cells?: [
+                number,
+                number,
+                number,
+            ][] | null;
+        };
+        /**
+         * InventoryRead
+         * @description Schema for reading inventory data.
+         */
+        InventoryRead: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /**
+             * Reserved Quantity
+             * @default 0
+             */
+            reserved_quantity: number;
+        };
+        /**
+         * InventoryTransfer
+         * @description Schema for transferring inventory between warehouses.
+         */
+        InventoryTransfer: {
+            /** Source Warehouse Id */
+            source_warehouse_id: number;
+            /** Destination Warehouse Id */
+            destination_warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+        };
+        /**
+         * InventoryTransferResponse
+         * @description Response model for inventory transfer operations.
+         */
+        InventoryTransferResponse: {
+            /** Message */
+            message: string;
+            source_inventory: components["schemas"]["InventoryRead"];
+            destination_inventory: components["schemas"]["InventoryRead"];
+        };
+        /**
+         * InventoryUpdate
+         * @description Schema for updating an inventory record.
+         */
+        InventoryUpdate: {
+            /** Quantity */
+            quantity?: number | null;
+        };
+        /**
+         * InventoryWithItem
+         * @description Schema for reading inventory data with item information.
+         */
+        InventoryWithItem: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /**
+             * Reserved Quantity
+             * @default 0
+             */
+            reserved_quantity: number;
+            item: components["schemas"]["ItemRead"];
+        };
+        /**
+         * InventoryWithWarehouse
+         * @description Schema for reading inventory data with warehouse information.
+         */
+        InventoryWithWarehouse: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /**
+             * Reserved Quantity
+             * @default 0
+             */
+            reserved_quantity: number;
+            warehouse: components["schemas"]["WarehouseRead"];
+        };
+        /**
+         * ItemCreate
+         * @description Schema for creating a new item.
+         */
+        ItemCreate: {
+            /** Name */
+            name: string;
+            /** Description */
+            description: string;
+            /** Sku */
+            sku?: string | null;
+            /** Unit Footprint */
+            unit_footprint?: number | null;
+        };
+        /**
+         * ItemExportRead
+         * @description Schema for reading item data in a full export.
+         */
+        ItemExportRead: {
+            /** Name */
+            name: string;
+            /** Description */
+            description: string;
+            /** Sku */
+            sku?: string | null;
+            /** Unit Footprint */
+            unit_footprint?: number | null;
+            /** Item Id */
+            item_id: number;
+        };
+        /**
+         * ItemFieldsRead
+         * @description Schema for reading a subset of item fields.
+         *
+         *     Fields that were not selected are left unset and omitted from responses.
+         */
+        ItemFieldsRead: {
+            /** Name */
+            name?: string | null;
+            /** Description */
+            description?: string | null;
+            /** Sku */
+            sku?: string | null;
+            /** Unit Footprint */
+            unit_footprint?: number | null;
+        };
+        /**
+         * ItemRead
+         * @description Schema for reading item data.
+         */
+        ItemRead: {
+            /** Name */
+            name: string;
+            /** Description */
+            description: string;
+            /** Sku */
+            sku?: string | null;
+            /** Unit Footprint */
+            unit_footprint?: number | null;
+        };
+        /**
+         * ItemReadWithInventory
+         * @description Schema for reading item data with total inventory information.
+         */
+        ItemReadWithInventory: {
+            /** Name */
+            name: string;
+            /** Description */
+            description: string;
+            /** Sku */
+            sku?: string | null;
+            /** Unit Footprint */
+            unit_footprint?: number | null;
+            /** Item Id */
+            item_id: number;
+            /** Total Inventory */
+            total_inventory: number;
+        };
+        /**
+         * ItemUpdate
+         * @description Schema for updating an item.
+         */
+        ItemUpdate: {
+            /** Name */
+            name?: string | null;
+            /** Description */
+            description?: string | null;
+            /** Sku */
+            sku?: string | null;
+            /** Unit Footprint */
+            unit_footprint?: number | null;
+        };
+        /**
+         * LivenessReport
+         * @description Confirms the worker's event loop is responding.
+         */
+        LivenessReport: {
+            /**
+             * Status
+             * @default ok
+             */
+            status: string;
+        };
+        /**
+         * LocationCreate
+         * @description Schema for creating a new location.
+         */
+        LocationCreate: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Code */
+            code: string;
+            /** Pick Sequence */
+            pick_sequence: number;
+        };
+        /**
+         * LocationRead
+         * @description Schema for reading location data.
+         */
+        LocationRead: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Code */
+            code: string;
+            /** Pick Sequence */
+            pick_sequence: number;
+            /** Location Id */
+            location_id: number;
+        };
+        /**
+         * LocationStockRead
+         * @description Schema for reading location stock.
+         */
+        LocationStockRead: {
+            /** Location Id */
+            location_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Quantity */
+            quantity: number;
+        };
+        /**
+         * LocationStockUpdate
+         * @description Schema for setting the quantity of an item in a location.
+         */
+        LocationStockUpdate: {
+            /** Quantity */
+            quantity: number;
+        };
+        /**
+         * LocationUpdate
+         * @description Schema for updating a location.
+         */
+        LocationUpdate: {
+            /** Code */
+            code?: string | null;
+            /** Pick Sequence */
+            pick_sequence?: number | null;
+        };
+        /**
+         * NearestWarehouse
+         * @description Schema for a warehouse returned by a nearest-warehouse lookup.
+         */
+        NearestWarehouse: {
+            warehouse: components["schemas"]["WarehouseRead"];
+            /** Distance Km */
+            distance_km: number;
+            /** Quantity */
+            quantity?: number | null;
+        };
+        /**
+         * PageInfo
+         * @description Information about the current page.
+         */
+        PageInfo: {
+            /** Total Items */
+            total_items: number;
+            /** Page */
+            page: number;
+            /** Page Size */
+            page_size: number;
+            /** Total Pages */
+            total_pages: number;
+            /** Has Next Page */
+            has_next_page: boolean;
+        };
+        /**
+         * PaginatedInventoryWithItemResponse
+         * @description Paginated response for inventory records with item information.
+         */
+        PaginatedInventoryWithItemResponse: {
+            /** Items */
+            items: components["schemas"]["InventoryWithItem"][];
+            page_info: components["schemas"]["PageInfo"];
+        };
+        /**
+         * PaginatedItemWithInventoryResponse
+         * @description Paginated response for items with inventory information.
+         */
+        PaginatedItemWithInventoryResponse: {
+            /** Items */
+            items: components["schemas"]["ItemReadWithInventory"][];
+            page_info: components["schemas"]["PageInfo"];
+        };
+        /**
+         * PaginatedRebalanceTransferResponse
+         * @description Paginated response for the transfers of a rebalancing plan.
+         */
+        PaginatedRebalanceTransferResponse: {
+            /** Items */
+            items: components["schemas"]["RebalanceTransferRead"][];
+            page_info: components["schemas"]["PageInfo"];
+        };
+        /**
+         * PaginatedWarehouseResponse
+         * @description Paginated response for warehouses.
+         */
+        PaginatedWarehouseResponse: {
+            /** Items */
+            items: components["schemas"]["WarehouseFieldsRead"][];
+            page_info: components["schemas"]["PageInfo"];
+        };
+        /**
+         * PickList
+         * @description Response model for a pick list, with stops in walking order.
+         */
+        PickList: {
+            /** Complete */
+            complete: boolean;
+            /** Stops */
+            stops: components["schemas"]["PickStop"][];
+            /** Items */
+            items: components["schemas"]["PickListItem"][];
+        };
+        /**
+         * PickListItem
+         * @description Picking of one item, with its order lines combined.
+         */
+        PickListItem: {
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Shortfall */
+            shortfall: number;
+        };
+        /**
+         * PickListLine
+         * @description Schema for an order line to pick.
+         */
+        PickListLine: {
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+        };
+        /**
+         * PickListRequest
+         * @description Schema for requesting a pick list.
+         */
+        PickListRequest: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Lines */
+            lines: components["schemas"]["PickListLine"][];
+        };
+        /**
+         * PickStop
+         * @description Quantity of an item to pick at one location.
+         */
+        PickStop: {
+            /** Location Id */
+            location_id: number;
+            /** Code */
+            code: string;
+            /** Pick Sequence */
+            pick_sequence: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+        };
+        /**
+         * PoolHealth
+         * @description Usage of the database connection pool.
+         */
+        PoolHealth: {
+            /** Ok */
+            ok: boolean;
+            /** Checked Out */
+            checked_out: number;
+            /** Capacity */
+            capacity: number;
+            /** Usage */
+            usage: number;
+        };
+        /**
+         * ReadinessReport
+         * @description Whether a worker is ready for traffic, with the checks it is based on.
+         */
+        ReadinessReport: {
+            /** Ready */
+            ready: boolean;
+            database: components["schemas"]["DatabaseHealth"];
+            pool: components["schemas"]["PoolHealth"];
+            /** Loop Lag Ms */
+            loop_lag_ms: number;
+            /** Loop Ok */
+            loop_ok: boolean;
+        };
+        /**
+         * RebalancePlanRead
+         * @description Schema for reading a rebalancing plan.
+         */
+        RebalancePlanRead: {
+            /** Strategy */
+            strategy: string;
+            /** Tolerance */
+            tolerance: number;
+            /** Plan Id */
+            plan_id: number;
+            /** Status */
+            status: string;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /** Finished At */
+            finished_at: string | null;
+            /** Applied At */
+            applied_at: string | null;
+            /** Transfer Count */
+            transfer_count: number;
+            /** Units Moved */
+            units_moved: number;
+            /** Unit Km */
+            unit_km: number;
+            /** Error */
+            error: string | null;
+        };
+        /**
+         * RebalanceRequest
+         * @description Schema for requesting a rebalancing plan.
+         */
+        RebalanceRequest: {
+            /**
+             * Strategy
+             * @default capacity
+             * @enum {string}
+             */
+            strategy: "capacity" | "even";
+            /**
+             * Tolerance
+             * @default 0.1
+             */
+            tolerance: number;
+        };
+        /**
+         * RebalanceTransferRead
+         * @description Schema for reading a planned transfer.
+         */
+        RebalanceTransferRead: {
+            /** Source Warehouse Id */
+            source_warehouse_id: number;
+            /** Destination Warehouse Id */
+            destination_warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Distance Km */
+            distance_km: number;
+        };
+        /**
+         * ReservationCreate
+         * @description Schema for creating a new reservation.
+         */
+        ReservationCreate: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Ttl Seconds */
+            ttl_seconds?: number | null;
+        };
+        /**
+         * ReservationRead
+         * @description Schema for reading reservation data.
+         */
+        ReservationRead: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Reservation Id */
+            reservation_id: number;
+            /**
+             * Expires At
+             * Format: date-time
+             */
+            expires_at: string;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+        };
+        /**
+         * SourcingAllocation
+         * @description Quantity of an order line shipped from one warehouse.
+         */
+        SourcingAllocation: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Distance Km */
+            distance_km: number;
+        };
+        /**
+         * SourcingLine
+         * @description Schema for an order line to source.
+         */
+        SourcingLine: {
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+        };
+        /**
+         * SourcingPlan
+         * @description Response model for a fulfilment sourcing plan.
+         */
+        SourcingPlan: {
+            /** Fulfillable */
+            fulfillable: boolean;
+            /** Total Unit Km */
+            total_unit_km: number;
+            /** Lines */
+            lines: components["schemas"]["SourcingPlanLine"][];
+        };
+        /**
+         * SourcingPlanLine
+         * @description Sourcing of one order line.
+         */
+        SourcingPlanLine: {
+            /** Item Id */
+            item_id: number;
+            /** Quantity */
+            quantity: number;
+            /** Shortfall */
+            shortfall: number;
+            /** Allocations */
+            allocations: components["schemas"]["SourcingAllocation"][];
+        };
+        /**
+         * SourcingRequest
+         * @description Schema for requesting a fulfilment sourcing plan.
+         */
+        SourcingRequest: {
+            /** Latitude */
+            latitude: number;
+            /** Longitude */
+            longitude: number;
+            /** Lines */
+            lines: components["schemas"]["SourcingLine"][];
+        };
+        /**
+         * SyncItem
+         * @description Schema for reading item data in a sync response.
+         */
+        SyncItem: {
+            /** Name */
+            name: string;
+            /** Description */
+            description: string;
+            /** Sku */
+            sku?: string | null;
+            /** Unit Footprint */
+            unit_footprint?: number | null;
+            /** Item Id */
+            item_id: number;
+        };
+        /**
+         * SyncResponse
+         * @description Rows upserted or deleted since a change sequence watermark.
+         */
+        SyncResponse: {
+            /** Watermark */
+            watermark: number;
+            /** Has More */
+            has_more: boolean;
+            /** Warehouses */
+            warehouses: components["schemas"]["WarehouseRead"][];
+            /** Items */
+            items: components["schemas"]["SyncItem"][];
+            /** Inventory */
+            inventory: components["schemas"]["InventoryRead"][];
+            /** Deleted */
+            deleted: components["schemas"]["DeletedRowRead"][];
+        };
+        /**
+         * Token
+         * @description Model for JWT token.
+         */
+        Token: {
+            /** Access Token */
+            access_token: string;
+            /** Token Type */
+            token_type: string;
+        };
+        /**
+         * UserCreate
+         * @description Model for creating a new user.
+         */
+        UserCreate: {
+            /**
+             * Email
+             * Format: email
+             */
+            email: string;
+            /** Username */
+            username: string;
+            /** Password */
+            password: string;
+        };
+        /**
+         * UserRead
+         * @description Model for reading user data.
+         */
+        UserRead: {
+            /**
+             * Email
+             * Format: email
+             */
+            email: string;
+            /** Username */
+            username: string;
+            /** Id */
+            id: number;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             */
+            updated_at: string;
+        };
+        /** ValidationError */
+        ValidationError: {
+            /** Location */
+            loc: (string | number)[];
+            /** Message */
+            msg: string;
+            /** Error Type */
+            type: string;
+        };
+        /**
+         * WarehouseCreate
+         * @description Schema for creating a new warehouse.
+         */
+        WarehouseCreate: {
+            /** Name */
+            name: string;
+            /** Square Footage */
+            square_footage: number;
+            /** Address */
+            address: string;
+            /** Manager Name */
+            manager_name: string;
+            /** Phone */
+            phone: string;
+            /** Latitude */
+            latitude: number | string;
+            /** Longitude */
+            longitude: number | string;
+        };
+        /**
+         * WarehouseDashboard
+         * @description Response model for a warehouse with its stock summary and inventory page.
+         */
+        WarehouseDashboard: {
+            warehouse: components["schemas"]["WarehouseRead"];
+            /** Sku Count */
+            sku_count: number;
+            /** Total Units */
+            total_units: number;
+            /** Low Stock Count */
+            low_stock_count: number;
+            inventory: components["schemas"]["PaginatedInventoryWithItemResponse"];
+        };
+        /**
+         * WarehouseFieldsRead
+         * @description Schema for reading a subset of warehouse fields.
+         *
+         *     Fields that were not selected are left unset and omitted from responses.
+         */
+        WarehouseFieldsRead: {
+            /** Warehouse Id */
+            warehouse_id?: number | null;
+            /** Name */
+            name?: string | null;
+            /** Square Footage */
+            square_footage?: number | null;
+            /** Address */
+            address?: string | null;
+            /** Manager Name */
+            manager_name?: string | null;
+            /** Phone */
+            phone?: string | null;
+            /** Latitude */
+            latitude?: string | null;
+            /** Longitude */
+            longitude?: string | null;
+        };
+        /**
+         * WarehousePurgeRead
+         * @description Schema for reading a warehouse purge.
+         */
+        WarehousePurgeRead: {
+            /** Purge Id */
+            purge_id: number;
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Status */
+            status: string;
+            /** Removed Count */
+            removed_count: number;
+            /**
+             * Created At
+             * Format: date-time
+             */
+            created_at: string;
+            /** Finished At */
+            finished_at: string | null;
+            /** Error */
+            error: string | null;
+        };
+        /**
+         * WarehouseRead
+         * @description Schema for reading warehouse data.
+         */
+        WarehouseRead: {
+            /** Name */
+            name: string;
+            /** Square Footage */
+            square_footage: number;
+            /** Address */
+            address: string;
+            /** Manager Name */
+            manager_name: string;
+            /** Phone */
+            phone: string;
+            /** Latitude */
+            latitude: string;
+            /** Longitude */
+            longitude: string;
+            /** Warehouse Id */
+            warehouse_id: number;
+        };
+        /**
+         * WarehouseUpdate
+         * @description Schema for updating a warehouse.
+         */
+        WarehouseUpdate: {
+            /** Name */
+            name?: string | null;
+            /** Square Footage */
+            square_footage?: number | null;
+            /** Address */
+            address?: string | null;
+            /** Manager Name */
+            manager_name?: string | null;
+            /** Phone */
+            phone?: string | null;
+            /** Latitude */
+            latitude?: number | string | null;
+            /** Longitude */
+            longitude?: number | string | null;
+        };
+        /**
+         * WarehouseUtilization
+         * @description Schema for a warehouse's floor space utilization.
+         */
+        WarehouseUtilization: {
+            /** Warehouse Id */
+            warehouse_id: number;
+            /** Name */
+            name: string;
+            /** Square Footage */
+            square_footage: number;
+            /** Used Footprint */
+            used_footprint: number;
+            /** Utilization */
+            utilization: number | null;
+            /** Available Footprint */
+            available_footprint: number;
+        };
+    };
+    responses: never;
+    parameters: never;
+    requestBodies: never;
+    headers: never;
+    pathItems: never;
+}
+export type $defs = Record<string, never>;
+export interface operations {
+    register_auth_register_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["UserCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["UserRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    login_auth_login_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/x-www-form-urlencoded": components["schemas"]["Body_login_auth_login_post"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["Token"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_warehouses_warehouses__get: {
+        parameters: {
+            query?: {
+                /** @description Filter warehouses by name */
+                name?: string | null;
+                /** @description Filter warehouses by manager name */
+                manager?: string | null;
+                /** @description Bounding box as min_lon,min_lat,max_lon,max_lat */
+                bbox?: string | null;
+                /** @description Comma-separated fields to return */
+                fields?: string | null;
+                /** @description Page number, defaults to 1 */
+                page?: number | null;
+                /** @description Number of warehouses per page, defaults to 10 */
+                page_size?: number | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehouseFieldsRead"][] | components["schemas"]["PaginatedWarehouseResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    create_warehouse_warehouses__post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["WarehouseCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehouseRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_nearest_warehouses_warehouses_nearest_get: {
+        parameters: {
+            query: {
+                /** @description Latitude of the point */
+                lat: number;
+                /** @description Longitude of the point */
+                lon: number;
+                /** @description Number of warehouses to return */
+                k?: number;
+                /** @description Only warehouses stocking this item */
+                item_id?: number | null;
+                /** @description Minimum stock of the item */
+                min_qty?: number;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["NearestWarehouse"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_warehouse_utilization_warehouses_utilization_get: {
+        parameters: {
+            query?: {
+                /** @description Only warehouses at least this full, e.g. 0.9 for 90% */
+                min_utilization?: number | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehouseUtilization"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    export_warehouses_warehouses_export_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehouseRead"][];
+                };
+            };
+        };
+    };
+    get_warehouse_purge_warehouses_purges__purge_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                purge_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehousePurgeRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_warehouse_warehouses__warehouse_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                warehouse_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehouseRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    delete_warehouse_warehouses__warehouse_id__delete: {
+        parameters: {
+            query?: {
+                /** @description Delete the stock in chunks in the background, for huge warehouses */
+                purge?: boolean;
+            };
+            header?: never;
+            path: {
+                warehouse_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Purge started */
+            202: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehousePurgeRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    update_warehouse_warehouses__warehouse_id__patch: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                warehouse_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["WarehouseUpdate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehouseRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_warehouse_dashboard_warehouses__warehouse_id__dashboard_get: {
+        parameters: {
+            query?: {
+                /** @description Quantity at or below which stock counts as low */
+                low_stock_threshold?: number;
+                /** @description Inventory page number */
+                page?: number;
+                /** @description Number of inventory records per page */
+                page_size?: number;
+            };
+            header?: never;
+            path: {
+                warehouse_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["WarehouseDashboard"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_items_items__get: {
+        parameters: {
+            query?: {
+                /** @description Search items by name */
+                search?: string | null;
+                /** @description Page number */
+                page?: number;
+                /** @description Number of items per page */
+                page_size?: number;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PaginatedItemWithInventoryResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    create_item_items__post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["ItemCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ItemReadWithInventory"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    export_items_items_export_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ItemExportRead"][];
+                };
+            };
+        };
+    };
+    get_item_items__item_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                item_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ItemReadWithInventory"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    delete_item_items__item_id__delete: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                item_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    update_item_items__item_id__patch: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                item_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["ItemUpdate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ItemReadWithInventory"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    create_inventory_inventory__post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["InventoryCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InventoryRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_inventory_by_warehouse_inventory_warehouse__warehouse_id__get: {
+        parameters: {
+            query?: {
+                /** @description Comma-separated fields to return, item.<field> for item fields */
+                fields?: string | null;
+                /** @description Embed the item (item), or nothing when empty */
+                expand?: string | null;
+            };
+            header?: never;
+            path: {
+                warehouse_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InventoryWithItem"][] | components["schemas"]["InventoryFieldsRead"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_inventory_by_item_inventory_item__item_id__get: {
+        parameters: {
+            query?: {
+                /** @description Comma-separated fields to return, warehouse.<field> for warehouse fields */
+                fields?: string | null;
+                /** @description Embed the warehouse (warehouse), or nothing when empty */
+                expand?: string | null;
+            };
+            header?: never;
+            path: {
+                item_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InventoryWithWarehouse"][] | components["schemas"]["InventoryFieldsRead"][];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    export_inventory_inventory_export_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InventoryRead"][];
+                };
+            };
+        };
+    };
+    get_inventory_matrix_inventory_matrix_get: {
+        parameters: {
+            query?: {
+                /** @description Only include these warehouses */
+                warehouse_ids?: number[] | null;
+                /** @description Only include these items */
+                item_ids?: number[] | null;
+                /** @description Return non-zero cells instead of a dense grid */
+                sparse?: boolean;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InventoryMatrix"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    check_availability_inventory_availability_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["AvailabilityRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["AvailabilityResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    plan_sourcing_inventory_sourcing_plan_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["SourcingRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["SourcingPlan"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    create_rebalance_plan_inventory_rebalance_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["RebalanceRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            202: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["RebalancePlanRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_rebalance_plan_inventory_rebalance__plan_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                plan_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["RebalancePlanRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_rebalance_transfers_inventory_rebalance__plan_id__transfers_get: {
+        parameters: {
+            query?: {
+                /** @description Page number */
+                page?: number;
+                /** @description Number of transfers per page */
+                page_size?: number;
+            };
+            header?: never;
+            path: {
+                plan_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["PaginatedRebalanceTransferResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    apply_rebalance_plan_inventory_rebalance__plan_id__apply_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                plan_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["RebalancePlanRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    create_reservation_inventory_reservations_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["ReservationCreate"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            201: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ReservationRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_reservation_inventory_reservations__reservation_id__get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                reservation_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ReservationRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    release_reservation_inventory_reservations__reservation_id__delete: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                reservation_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    fulfil_reservation_inventory_reservations__reservation_id__fulfil_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                reservation_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InventoryRead"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_inventory_history_inventory_history_get: {
+        parameters: {
+            query: {
+                /** @description Point in time to rebuild stock for */
+                at: string;
+                /** @description Only include this warehouse */
+                warehouse_id?: number | null;
+                /** @description Only include this item */
+                item_id?: number | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["InventoryHistory"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    get_inventory_by_warehouse_and_item_inventory__warehouse_id___item_id__get: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
-            cookie?: never;
-        };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["UserCreate"];
+            path: {
+                warehouse_id: number;
+                item_id: number;
             };
+            cookie?: never;
         };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
-            201: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["UserRead"];
+                    "application/json": components["schemas"]["InventoryRead"];
                 };
             };
             /** @description Validation Error */
@@ -628,16 +3280,49 @@ export interface operations {
             };
         };
     };
-    login_auth_login_post: {
+    delete_inventory_inventory__warehouse_id___item_id__delete: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
+            path: {
+                warehouse_id: number;
+                item_id: number;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    update_inventory_inventory__warehouse_id___item_id__patch: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                warehouse_id: number;
+                item_id: number;
+            };
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/x-www-form-urlencoded": components["schemas"]["Body_login_auth_login_post"];
+                "application/json": components["schemas"]["InventoryUpdate"];
             };
         };
         responses: {
@@ -647,7 +3332,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["Token"];
+                    "application/json": components["schemas"]["InventoryRead"];
                 };
             };
             /** @description Validation Error */
@@ -661,14 +3346,18 @@ export interface operations {
             };
         };
     };
-    get_warehouses_warehouses__get: {
+    transfer_inventory_inventory_transfer_post: {
         parameters: {
             query?: never;
             header?: never;
             path?: never;
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["InventoryTransfer"];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -676,12 +3365,21 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["WarehouseRead"][];
+                    "application/json": components["schemas"]["InventoryTransferResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
     };
-    create_warehouse_warehouses__post: {
+    create_location_locations__post: {
         parameters: {
             query?: never;
             header?: never;
@@ -690,7 +3388,7 @@ export interface operations {
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["WarehouseCreate"];
+                "application/json": components["schemas"]["LocationCreate"];
             };
         };
         responses: {
@@ -700,7 +3398,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["WarehouseRead"];
+                    "application/json": components["schemas"]["LocationRead"];
                 };
             };
             /** @description Validation Error */
@@ -714,16 +3412,18 @@ export interface operations {
             };
         };
     };
-    get_warehouse_warehouses__warehouse_id__get: {
+    get_pick_list_locations_pick_list_post: {
         parameters: {
             query?: never;
             header?: never;
-            path: {
-                warehouse_id: number;
-            };
+            path?: never;
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["PickListRequest"];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -731,7 +3431,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["WarehouseRead"];
+                    "application/json": components["schemas"]["PickList"];
                 };
             };
             /** @description Validation Error */
@@ -745,7 +3445,7 @@ export interface operations {
             };
         };
     };
-    delete_warehouse_warehouses__warehouse_id__delete: {
+    get_locations_by_warehouse_locations_warehouse__warehouse_id__get: {
         parameters: {
             query?: never;
             header?: never;
@@ -757,11 +3457,13 @@ export interface operations {
         requestBody?: never;
         responses: {
             /** @description Successful Response */
-            204: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": components["schemas"]["LocationRead"][];
+                };
             };
             /** @description Validation Error */
             422: {
@@ -774,20 +3476,16 @@ export interface operations {
             };
         };
     };
-    update_warehouse_warehouses__warehouse_id__patch: {
+    get_location_locations__location_id__get: {
         parameters: {
             query?: never;
             header?: never;
             path: {
-                warehouse_id: number;
+                location_id: number;
             };
             cookie?: never;
         };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["WarehouseUpdate"];
-            };
-        };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
             200: {
@@ -795,7 +3493,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["WarehouseRead"];
+                    "application/json": components["schemas"]["LocationRead"];
                 };
             };
             /** @description Validation Error */
@@ -809,30 +3507,23 @@ export interface operations {
             };
         };
     };
-    get_items_items__get: {
+    delete_location_locations__location_id__delete: {
         parameters: {
-            query?: {
-                /** @description Search items by name */
-                search?: string | null;
-                /** @description Page number */
-                page?: number;
-                /** @description Number of items per page */
-                page_size?: number;
-            };
+            query?: never;
             header?: never;
-            path?: never;
+            path: {
+                location_id: number;
+            };
             cookie?: never;
         };
         requestBody?: never;
         responses: {
             /** @description Successful Response */
-            200: {
+            204: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content: {
-                    "application/json": components["schemas"]["PaginatedItemWithInventoryResponse"];
-                };
+                content?: never;
             };
             /** @description Validation Error */
             422: {
@@ -845,26 +3536,28 @@ export interface operations {
             };
         };
     };
-    create_item_items__post: {
+    update_location_locations__location_id__patch: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
+            path: {
+                location_id: number;
+            };
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["ItemCreate"];
+                "application/json": components["schemas"]["LocationUpdate"];
             };
         };
         responses: {
             /** @description Successful Response */
-            201: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["ItemReadWithInventory"];
+                    "application/json": components["schemas"]["LocationRead"];
                 };
             };
             /** @description Validation Error */
@@ -878,12 +3571,12 @@ export interface operations {
             };
         };
     };
-    get_item_items__item_id__get: {
+    get_location_stock_locations__location_id__stock_get: {
         parameters: {
             query?: never;
             header?: never;
             path: {
-                item_id: number;
+                location_id: number;
             };
             cookie?: never;
         };
@@ -895,7 +3588,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["ItemReadWithInventory"];
+                    "application/json": components["schemas"]["LocationStockRead"][];
                 };
             };
             /** @description Validation Error */
@@ -909,23 +3602,30 @@ export interface operations {
             };
         };
     };
-    delete_item_items__item_id__delete: {
+    set_location_stock_locations__location_id__stock__item_id__put: {
         parameters: {
             query?: never;
             header?: never;
             path: {
+                location_id: number;
                 item_id: number;
             };
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["LocationStockUpdate"];
+            };
+        };
         responses: {
             /** @description Successful Response */
-            204: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": components["schemas"]["LocationStockRead"];
+                };
             };
             /** @description Validation Error */
             422: {
@@ -938,28 +3638,26 @@ export interface operations {
             };
         };
     };
-    update_item_items__item_id__patch: {
+    create_count_session_counts__post: {
         parameters: {
             query?: never;
             header?: never;
-            path: {
-                item_id: number;
-            };
+            path?: never;
             cookie?: never;
         };
         requestBody: {
             content: {
-                "application/json": components["schemas"]["ItemUpdate"];
+                "application/json": components["schemas"]["CountSessionCreate"];
             };
         };
         responses: {
             /** @description Successful Response */
-            200: {
+            201: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["ItemReadWithInventory"];
+                    "application/json": components["schemas"]["CountSessionRead"];
                 };
             };
             /** @description Validation Error */
@@ -973,26 +3671,24 @@ export interface operations {
             };
         };
     };
-    create_inventory_inventory__post: {
+    get_count_session_counts__session_id__get: {
         parameters: {
             query?: never;
             header?: never;
-            path?: never;
-            cookie?: never;
-        };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["InventoryCreate"];
+            path: {
+                session_id: number;
             };
+            cookie?: never;
         };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
-            201: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["InventoryRead"];
+                    "application/json": components["schemas"]["CountSessionRead"];
                 };
             };
             /** @description Validation Error */
@@ -1006,16 +3702,20 @@ export interface operations {
             };
         };
     };
-    get_inventory_by_warehouse_inventory_warehouse__warehouse_id__get: {
+    add_count_lines_counts__session_id__lines_post: {
         parameters: {
             query?: never;
             header?: never;
             path: {
-                warehouse_id: number;
+                session_id: number;
             };
             cookie?: never;
         };
-        requestBody?: never;
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["CountLinesRequest"];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
@@ -1023,7 +3723,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["InventoryWithItem"][];
+                    "application/json": components["schemas"]["CountSessionRead"];
                 };
             };
             /** @description Validation Error */
@@ -1037,12 +3737,12 @@ export interface operations {
             };
         };
     };
-    get_inventory_by_item_inventory_item__item_id__get: {
+    close_count_session_counts__session_id__close_post: {
         parameters: {
             query?: never;
             header?: never;
             path: {
-                item_id: number;
+                session_id: number;
             };
             cookie?: never;
         };
@@ -1054,7 +3754,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["InventoryWithWarehouse"][];
+                    "application/json": components["schemas"]["CountReport"];
                 };
             };
             /** @description Validation Error */
@@ -1068,13 +3768,12 @@ export interface operations {
             };
         };
     };
-    get_inventory_by_warehouse_and_item_inventory__warehouse_id___item_id__get: {
+    get_count_report_counts__session_id__report_get: {
         parameters: {
             query?: never;
             header?: never;
             path: {
-                warehouse_id: number;
-                item_id: number;
+                session_id: number;
             };
             cookie?: never;
         };
@@ -1086,7 +3785,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["InventoryRead"];
+                    "application/json": components["schemas"]["CountReport"];
                 };
             };
             /** @description Validation Error */
@@ -1100,24 +3799,26 @@ export interface operations {
             };
         };
     };
-    delete_inventory_inventory__warehouse_id___item_id__delete: {
+    stream_events_events__get: {
         parameters: {
-            query?: never;
-            header?: never;
-            path: {
-                warehouse_id: number;
-                item_id: number;
+            query?: {
+                /** @description Only send inventory and warehouse events for these warehouses */
+                warehouse_ids?: number[] | null;
             };
+            header?: never;
+            path?: never;
             cookie?: never;
         };
         requestBody?: never;
         responses: {
             /** @description Successful Response */
-            204: {
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
-                content?: never;
+                content: {
+                    "application/json": unknown;
+                };
             };
             /** @description Validation Error */
             422: {
@@ -1130,21 +3831,19 @@ export interface operations {
             };
         };
     };
-    update_inventory_inventory__warehouse_id___item_id__patch: {
+    get_changes_sync__get: {
         parameters: {
-            query?: never;
-            header?: never;
-            path: {
-                warehouse_id: number;
-                item_id: number;
+            query?: {
+                /** @description Watermark returned by the previous sync */
+                since?: number;
+                /** @description Maximum number of changes */
+                limit?: number;
             };
+            header?: never;
+            path?: never;
             cookie?: never;
         };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["InventoryUpdate"];
-            };
-        };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
             200: {
@@ -1152,7 +3851,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["InventoryRead"];
+                    "application/json": components["schemas"]["SyncResponse"];
                 };
             };
             /** @description Validation Error */
@@ -1166,18 +3865,34 @@ export interface operations {
             };
         };
     };
-    transfer_inventory_inventory_transfer_post: {
+    get_cache_stats_cache_stats_get: {
         parameters: {
             query?: never;
             header?: never;
             path?: never;
             cookie?: never;
         };
-        requestBody: {
-            content: {
-                "application/json": components["schemas"]["InventoryTransfer"];
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CacheStats"];
+                };
             };
         };
+    };
+    get_liveness_health_live_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
         responses: {
             /** @description Successful Response */
             200: {
@@ -1185,16 +3900,36 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["InventoryTransferResponse"];
+                    "application/json": components["schemas"]["LivenessReport"];
                 };
             };
-            /** @description Validation Error */
-            422: {
+        };
+    };
+    get_readiness_health_ready_get: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
                 headers: {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["HTTPValidationError"];
+                    "application/json": components["schemas"]["ReadinessReport"];
+                };
+            };
+            /** @description Service Unavailable */
+            503: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ReadinessReport"];
                 };
             };
         };
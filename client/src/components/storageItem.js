@@ -1,11 +1,13 @@
 import { useEffect, useState } from 'react';
 import './StorageItem.css';
-import { getItemsInWarehouse } from '../events/warehouses';
+import { getWarehouseDashboard } from '../events/warehouses';
 
 function StorageItem(props) {
     let [items, updateItems] = useState([]);
     useEffect(() => {
-        getItemsInWarehouse(props.warehouse.warehouse_id).then(updateItems);
+        getWarehouseDashboard(props.warehouse.warehouse_id).then((dashboard) => {
+            updateItems(dashboard ? dashboard.inventory.items : []);
+        });
     }, []);
     return (
             <div className='storageWrapper' onClick={()=> {
@@ -2,37 +2,57 @@ import { authorizeRequest } from "./authorization"
 
 async function getWarehouses() {
     let headers = authorizeRequest();
-    const response = await fetch("http://localhost:8000/warehouses/", {
-        method: "GET",
-        mode: "cors",
-        headers: headers,
-    })
-    if (response.status == 401) {
-        sessionStorage.removeItem("swm_token");
-        document.location.reload();
-        return;
-    };
-    const json = await response.json();
-    return json;
+    let warehouses = [];
+    let page = 1;
+    while (true) {
+        const response = await fetch(`http://localhost:8000/warehouses/?page=${page}&page_size=100`, {
+            method: "GET",
+            mode: "cors",
+            headers: headers,
+        })
+        if (response.status == 401) {
+            sessionStorage.removeItem("swm_token");
+            document.location.reload();
+            return;
+        };
+        const json = await response.json();
+        warehouses = warehouses.concat(json.items);
+        if (!json.page_info.has_next_page) {
+            return warehouses;
+        }
+        page++;
+    }
 }
 
-async function getItemsInWarehouse(id) {
+async function getWarehouseDashboard(id) {
     if (id == undefined) {
-        return [];
+        return null;
     }
     let headers = authorizeRequest();
-    const response = await fetch(`http://localhost:8000/inventory/warehouse/${id}`, {
-        method: "GET",
-        mode: "cors",
-        headers: headers,
-    });
-    if (response.status == 401) {
-        sessionStorage.removeItem("swm_token");
-        document.location.reload();
-        return;
+    let dashboard = null;
+    let page = 1;
+    while (true) {
+        const response = await fetch(`http://localhost:8000/warehouses/${id}/dashboard?page=${page}&page_size=500`, {
+            method: "GET",
+            mode: "cors",
+            headers: headers,
+        });
+        if (response.status == 401) {
+            sessionStorage.removeItem("swm_token");
+            document.location.reload();
+            return;
+        }
+        const json = await response.json();
+        if (dashboard == null) {
+            dashboard = json;
+        } else {
+            dashboard.inventory.items = dashboard.inventory.items.concat(json.inventory.items);
+        }
+        if (!json.inventory.page_info.has_next_page) {
+            return dashboard;
+        }
+        page++;
     }
-    let json = await response.json();
-    return json;
 }
 
 async function patchWarehouse(id, data) {
@@ -73,4 +93,4 @@ async function deleteWarehouse(id) {
     return response.status;
 }
 
-export {getWarehouses, getItemsInWarehouse, patchWarehouse, createWarehouse, deleteWarehouse}
\ No newline at end of file
+export {getWarehouses, getWarehouseDashboard, patchWarehouse, createWarehouse, deleteWarehouse}
\ No newline at end of file